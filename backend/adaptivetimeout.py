@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import threading
+from collections import deque
+
+
+class AdaptiveTimeout:
+    """
+    Compute command timeouts from recorded run durations and module size
+
+    Learned timeout never drops below default one until enough runs are recorded. A
+    killed run is recorded with its timeout as duration and next timeout is doubled
+    while runs keep being killed. History is reset after repeated kills since it does
+    not reflect command durations anymore.
+    """
+
+    HISTORY_SIZE = 20
+    MIN_HISTORY = 3
+    TRUSTED_HISTORY = 10
+    MAX_KILLS = 3
+    FACTOR = 3.0
+
+    def __init__(self, defaults, history_size=None):
+        """
+        Constructor
+
+        Args:
+            defaults (dict): timeout bounds by command type::
+
+                {
+                    command type (str): (default (float), floor (float), ceiling (float)),
+                    ...
+                }
+
+            history_size (int): number of runs kept by command type
+        """
+        self.defaults = defaults
+        self.history_size = history_size or self.HISTORY_SIZE
+        self.__lock = threading.Lock()
+        self.__history = {}
+        self.__kills = {}
+
+    def record(self, command_type, duration, module_size=0):
+        """
+        Record successful command run
+
+        Args:
+            command_type (str): command type
+            duration (float): run duration in seconds
+            module_size (int): size of module the command ran on (KB)
+        """
+        if command_type not in self.defaults:
+            return
+
+        with self.__lock:
+            history = self.__history.setdefault(
+                command_type, deque(maxlen=self.history_size)
+            )
+            history.append((duration, module_size))
+            self.__kills.pop(command_type, None)
+
+    def record_kill(self, command_type, timeout, module_size=0):
+        """
+        Record command run killed after timeout
+
+        Args:
+            command_type (str): command type
+            timeout (float): timeout the command was killed after (seconds)
+            module_size (int): size of module the command ran on (KB)
+        """
+        if command_type not in self.defaults:
+            return
+
+        with self.__lock:
+            history = self.__history.setdefault(
+                command_type, deque(maxlen=self.history_size)
+            )
+            kills, _ = self.__kills.get(command_type, (0, 0.0))
+            kills += 1
+            if kills >= self.MAX_KILLS:
+                history.clear()
+            else:
+                # command lasted at least its timeout
+                history.append((timeout, module_size))
+            self.__kills[command_type] = (kills, timeout)
+
+    def get_timeout(self, command_type, module_size=0):
+        """
+        Return timeout for specified command type
+
+        Timeout is the 95th percentile of recorded durations multiplied by a safety factor,
+        scaled up when module is bigger than modules recorded so far, and bounded by
+        command floor and ceiling. Default timeout is returned until enough runs are
+        recorded and is a lower bound until history is trusted. After a kill, timeout is
+        at least twice the timeout the command was killed after.
+
+        Args:
+            command_type (str): command type
+            module_size (int): size of module the command will run on (KB)
+
+        Returns:
+            float: timeout in seconds or None if command type is not handled
+        """
+        if command_type not in self.defaults:
+            return None
+        default, floor, ceiling = self.defaults[command_type]
+
+        with self.__lock:
+            history = list(self.__history.get(command_type, []))
+            _, killed_timeout = self.__kills.get(command_type, (0, 0.0))
+        backoff = min(ceiling, killed_timeout * 2)
+        if len(history) < self.MIN_HISTORY:
+            return max(default, backoff)
+
+        durations = sorted(duration for duration, _ in history)
+        p95 = durations[max(0, int(round(0.95 * len(durations))) - 1)]
+        sizes = sorted(size for _, size in history)
+        reference_size = sizes[len(sizes) // 2]
+        size_ratio = (
+            max(1.0, float(module_size) / reference_size) if reference_size else 1.0
+        )
+
+        timeout = min(ceiling, max(floor, p95 * self.FACTOR * size_ratio))
+        if len(history) < self.TRUSTED_HISTORY:
+            timeout = max(default, timeout)
+        return round(max(timeout, backoff), 1)
+
+    def to_dict(self):
+        """
+        Export history
+
+        Returns:
+            dict: history by command type
+        """
+        with self.__lock:
+            return {
+                command_type: [list(run) for run in history]
+                for command_type, history in self.__history.items()
+            }
+
+    def from_dict(self, data):
+        """
+        Import history
+
+        Args:
+            data (dict): history as exported by to_dict
+        """
+        with self.__lock:
+            self.__history.clear()
+            self.__kills.clear()
+            for command_type, runs in (data or {}).items():
+                if command_type not in self.defaults:
+                    continue
+                self.__history[command_type] = deque(
+                    [tuple(run) for run in runs], maxlen=self.history_size
+                )
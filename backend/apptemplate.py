@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import sys
+import json
+import base64
+
+
+class AppTemplate:
+    """
+    Pre-built application skeleton
+
+    Template is built once from a skeleton generated by cleep-cli for a placeholder module name.
+    New application is then rendered replacing placeholder in file names and contents, which
+    is much faster than generating skeleton with cleep-cli.
+    """
+
+    PLACEHOLDER = "devtplskel"
+    # bump when template format changes to force template rebuild
+    VERSION = 1
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__files = None
+        variants = self.__get_variants(self.PLACEHOLDER)
+        self.__pattern = re.compile("|".join(re.escape(variant) for variant in variants))
+
+    @staticmethod
+    def __get_variants(name):
+        return [name, name.capitalize(), name.upper()]
+
+    @property
+    def loaded(self):
+        """
+        True if template is loaded
+        """
+        return self.__files is not None
+
+    def build(self, skeleton_path):
+        """
+        Build template from skeleton generated for placeholder module name
+
+        Args:
+            skeleton_path (str): skeleton directory path
+
+        Returns:
+            dict: template content to store
+        """
+        files = []
+        for (root, dirs, filenames) in os.walk(skeleton_path):
+            dirs.sort()
+            for filename in sorted(filenames):
+                path = os.path.join(root, filename)
+                with open(path, "rb") as fd:
+                    raw = fd.read()
+                entry = {
+                    "path": os.path.relpath(path, skeleton_path),
+                    "mode": os.stat(path).st_mode & 0o777,
+                }
+                try:
+                    entry["content"] = raw.decode("utf-8")
+                except UnicodeDecodeError:
+                    entry["binary"] = base64.b64encode(raw).decode("ascii")
+                files.append(entry)
+
+        self.__files = files
+        return {"version": self.VERSION, "files": files}
+
+    def load(self, template):
+        """
+        Load template
+
+        Args:
+            template (dict): template content as returned by build
+
+        Returns:
+            bool: True if template loaded, False if template version is outdated
+        """
+        if not template or template.get("version") != self.VERSION:
+            return False
+
+        self.__files = template["files"]
+        return True
+
+    def render(self, module_name, output_path):
+        """
+        Render template for specified module
+
+        Args:
+            module_name (str): module name
+            output_path (str): module directory path. It must not exist
+
+        Returns:
+            list: list of rendered file paths (relative to output path)
+
+        Raises:
+            Exception: if template is not loaded or output path already exists
+        """
+        if self.__files is None:
+            raise Exception("Application template is not loaded")
+        if os.path.exists(output_path):
+            raise Exception(f'Directory "{output_path}" already exists')
+
+        replacements = dict(
+            zip(self.__get_variants(self.PLACEHOLDER), self.__get_variants(module_name))
+        )
+
+        def replace(match):
+            return replacements[match.group(0)]
+
+        rendered = []
+        for entry in self.__files:
+            relative_path = self.__pattern.sub(replace, entry["path"])
+            path = os.path.join(output_path, relative_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if "binary" in entry:
+                with open(path, "wb") as fd:
+                    fd.write(base64.b64decode(entry["binary"]))
+            else:
+                with open(path, "w", encoding="utf-8") as fd:
+                    fd.write(self.__pattern.sub(replace, entry["content"]))
+            os.chmod(path, entry["mode"])
+            rendered.append(relative_path)
+
+        return rendered
+
+
+if __name__ == "__main__":
+    # build template at install: apptemplate.py <skeleton path> <template path>
+    if len(sys.argv) != 3:
+        print(f"Usage: {sys.argv[0]} <skeleton path> <template path>")
+        sys.exit(2)
+
+    with open(sys.argv[2], "w", encoding="utf-8") as template_fd:
+        json.dump(AppTemplate().build(sys.argv[1]), template_fd)
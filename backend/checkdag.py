@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+STATUS_SKIPPED = "skipped"
+
+
+class CheckDag:
+    """
+    Dependency-aware checks scheduler
+
+    Checks are nodes of a directed acyclic graph: a check starts as soon as all checks
+    it depends on succeeded, independent checks run in parallel. When a check fails
+    (raises), checks depending on it (directly or not) are skipped and other checks
+    keep running, so results of all runnable checks are returned.
+
+    Dependencies must be added before their dependents, which keeps graph acyclic.
+    """
+
+    def __init__(self, max_workers=2):
+        """
+        Constructor
+
+        Args:
+            max_workers (int): maximum number of checks running at the same time
+        """
+        self.max_workers = max_workers
+        self.__nodes = {}
+
+    def add(self, name, func, depends=()):
+        """
+        Add check
+
+        Args:
+            name (str): check name
+            func (function): check function (without parameter) returning check result
+            depends (tuple): names of checks that must succeed before running this one
+
+        Raises:
+            ValueError: if check already exists or dependency is unknown
+        """
+        if name in self.__nodes:
+            raise ValueError(f'Check "{name}" already exists')
+        for dependency in depends:
+            if dependency not in self.__nodes:
+                raise ValueError(
+                    f'Check "{name}" depends on unknown check "{dependency}"'
+                )
+        self.__nodes[name] = (func, tuple(depends))
+
+    @staticmethod
+    def __run_check(func):
+        start = time.time()
+        try:
+            result = func()
+            status = STATUS_SUCCEEDED
+            error = None
+        except Exception as exception:
+            result = None
+            status = STATUS_FAILED
+            error = str(exception)
+
+        return {
+            "status": status,
+            "result": result,
+            "error": error,
+            "duration": round(time.time() - start, 3),
+        }
+
+    def run(self):
+        """
+        Run checks
+
+        Returns:
+            dict: checks results in checks order::
+
+                {
+                    name (str): {
+                        status (str): succeeded, failed or skipped,
+                        result (any): check result (None if check failed or skipped),
+                        error (str): error message (None if check succeeded),
+                        duration (float): check duration (seconds),
+                    },
+                    ...
+                }
+
+        """
+        if not self.__nodes:
+            return {}
+
+        # lazy import: checks are only run on user request
+        from concurrent.futures import (  # pylint: disable=import-outside-toplevel
+            ThreadPoolExecutor,
+            FIRST_COMPLETED,
+            wait,
+        )
+
+        results = {}
+        pending = dict(self.__nodes)
+        running = {}
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(self.__nodes)))
+        ) as executor:
+            while pending or running:
+                # nodes are ordered after their dependencies: one pass propagates skips
+                for (name, (func, depends)) in list(pending.items()):
+                    broken = [
+                        dependency
+                        for dependency in depends
+                        if results.get(dependency, {}).get("status")
+                        in (STATUS_FAILED, STATUS_SKIPPED)
+                    ]
+                    if broken:
+                        del pending[name]
+                        results[name] = {
+                            "status": STATUS_SKIPPED,
+                            "result": None,
+                            "error": f'Check "{broken[0]}" did not succeed',
+                            "duration": 0.0,
+                        }
+                    elif all(dependency in results for dependency in depends):
+                        del pending[name]
+                        running[executor.submit(self.__run_check, func)] = name
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+
+        return {name: results[name] for name in self.__nodes}
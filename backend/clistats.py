@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+import threading
+from collections import deque
+
+
+class CliStats:
+    """
+    Keep rolling statistics of cleep-cli invocations by command type
+    """
+
+    HISTORY_SIZE = 100
+
+    def __init__(self, history_size=None):
+        """
+        Constructor
+
+        Args:
+            history_size (int): number of durations kept by command type
+        """
+        self.history_size = history_size or self.HISTORY_SIZE
+        self.__lock = threading.Lock()
+        self.__stats = {}
+
+    def __get_command_stats(self, command_type):
+        if command_type not in self.__stats:
+            self.__stats[command_type] = {
+                "count": 0,
+                "failures": 0,
+                "timeouts": 0,
+                "outputbytes": 0,
+                "cputime": 0.0,
+                "peakrss": 0,
+                "lastreturncode": None,
+                "lastrun": None,
+                "durations": deque(maxlen=self.history_size),
+                "returncodes": deque(maxlen=self.history_size),
+            }
+        return self.__stats[command_type]
+
+    def record(
+        self,
+        command_type,
+        duration,
+        returncode,
+        killed=False,
+        output_bytes=0,
+        cpu_time=0.0,
+        peak_rss=0,
+    ):
+        """
+        Record command execution
+
+        Args:
+            command_type (str): command type (cli sub command)
+            duration (float): command duration in seconds
+            returncode (int): command return code
+            killed (bool): True if command was killed (timeout)
+            output_bytes (int): size of command output
+            cpu_time (float): cpu time consumed by command in seconds
+            peak_rss (int): peak resident memory of command in KB
+        """
+        with self.__lock:
+            stats = self.__get_command_stats(command_type)
+            stats["count"] += 1
+            if killed:
+                stats["timeouts"] += 1
+            elif returncode != 0:
+                stats["failures"] += 1
+            stats["outputbytes"] += output_bytes
+            stats["cputime"] += cpu_time
+            stats["peakrss"] = max(stats["peakrss"], peak_rss)
+            stats["lastreturncode"] = returncode
+            stats["lastrun"] = int(time.time())
+            stats["durations"].append(duration)
+            stats["returncodes"].append(returncode)
+
+    def get_durations(self, command_type, successful_only=True):
+        """
+        Return recorded durations of specified command type
+
+        Args:
+            command_type (str): command type
+            successful_only (bool): only return durations of successful runs
+
+        Returns:
+            list: list of durations (oldest first)
+        """
+        with self.__lock:
+            stats = self.__stats.get(command_type)
+            if not stats:
+                return []
+            if not successful_only:
+                return list(stats["durations"])
+            return [
+                duration
+                for duration, returncode in zip(
+                    stats["durations"], stats["returncodes"]
+                )
+                if returncode == 0
+            ]
+
+    @staticmethod
+    def percentile(values, percent):
+        """
+        Compute percentile (nearest rank) of specified values
+
+        Args:
+            values (list): values
+            percent (int): percentile (0-100)
+
+        Returns:
+            float: percentile value, None if no value
+        """
+        if not values:
+            return None
+        ordered = sorted(values)
+        index = int(round(percent / 100.0 * len(ordered))) - 1
+        return ordered[max(0, min(len(ordered) - 1, index))]
+
+    def get_stats(self):
+        """
+        Return statistics by command type
+
+        Returns:
+            dict: statistics::
+
+                {
+                    command type (str): {
+                        count (int): number of executions,
+                        failures (int): number of failed executions,
+                        timeouts (int): number of killed executions,
+                        outputbytes (int): total output size,
+                        cputime (float): total cpu time (seconds),
+                        peakrss (int): peak children memory (KB),
+                        lastreturncode (int): last return code,
+                        lastrun (int): last run timestamp,
+                        p50 (float): median duration (seconds),
+                        p95 (float): 95th percentile duration (seconds),
+                    },
+                    ...
+                }
+
+        """
+        with self.__lock:
+            output = {}
+            for command_type, stats in self.__stats.items():
+                durations = list(stats["durations"])
+                output[command_type] = {
+                    key: value
+                    for key, value in stats.items()
+                    if key not in ("durations", "returncodes")
+                }
+                output[command_type]["p50"] = self.percentile(durations, 50)
+                output[command_type]["p95"] = self.percentile(durations, 95)
+            return output
+
+    def reset(self):
+        """
+        Reset all statistics
+        """
+        with self.__lock:
+            self.__stats.clear()
@@ -0,0 +1,332 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import time
+import threading
+
+# coverage report line: name, statements, missing, [branches, partial branches,] cover
+COVERAGE_LINE_PATTERN = re.compile(
+    r"^(\S+)\s+(\d+)\s+(\d+)(?:\s+\d+\s+\d+)?\s+(\d+(?:\.\d+)?)%"
+)
+TESTS_COUNT_PATTERNS = (
+    re.compile(r"^Ran (\d+) tests? in"),
+    re.compile(r"(\d+) passed"),
+)
+
+
+def parse_coverage_report(lines):
+    """
+    Parse coverage report text
+
+    Args:
+        lines (list): output lines
+
+    Returns:
+        dict: coverage report or None if no report found::
+
+            {
+                files (dict): {
+                    path (str): {
+                        statements (int): number of statements,
+                        missing (int): number of missing statements,
+                        coverage (float): coverage percentage,
+                    },
+                    ...
+                },
+                total (dict): same content than file for whole module,
+                tests (int): number of executed tests, None if unknown,
+            }
+
+    """
+    files = {}
+    total = None
+    tests = None
+    for line in lines:
+        line = line.strip()
+        for pattern in TESTS_COUNT_PATTERNS:
+            match = pattern.search(line)
+            if match:
+                tests = int(match.group(1))
+        match = COVERAGE_LINE_PATTERN.match(line)
+        if not match:
+            continue
+        entry = {
+            "statements": int(match.group(2)),
+            "missing": int(match.group(3)),
+            "coverage": float(match.group(4)),
+        }
+        if match.group(1) == "TOTAL":
+            total = entry
+        else:
+            files[match.group(1)] = entry
+
+    if total is None:
+        return None
+    return {"files": files, "total": total, "tests": tests}
+
+
+class CoverageStore:
+    """
+    Store of tests runs coverage and duration (SQLite)
+
+    Only last runs of each module are kept: older runs are deleted when a run is added.
+    """
+
+    SCHEMA = (
+        """CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            module TEXT NOT NULL,
+            version TEXT,
+            timestamp REAL NOT NULL,
+            duration REAL NOT NULL,
+            returncode INTEGER,
+            tests INTEGER,
+            statements INTEGER NOT NULL,
+            missing INTEGER NOT NULL,
+            coverage REAL NOT NULL
+        )""",
+        """CREATE TABLE IF NOT EXISTS files (
+            run_id INTEGER NOT NULL,
+            path TEXT NOT NULL,
+            statements INTEGER NOT NULL,
+            missing INTEGER NOT NULL,
+            coverage REAL NOT NULL
+        )""",
+        "CREATE INDEX IF NOT EXISTS runs_module ON runs (module, id)",
+        "CREATE INDEX IF NOT EXISTS files_run ON files (run_id)",
+    )
+
+    def __init__(self, path, max_runs=100):
+        """
+        Constructor
+
+        Args:
+            path (str): database path
+            max_runs (int): maximum number of runs kept per module
+        """
+        self.path = path
+        self.max_runs = max_runs
+        self.__lock = threading.Lock()
+        self.__initialized = False
+
+    def __connect(self):
+        # lazy import: store is only used when tests are run
+        import sqlite3  # pylint: disable=import-outside-toplevel
+
+        connection = sqlite3.connect(self.path)
+        connection.row_factory = sqlite3.Row
+        if not self.__initialized:
+            with connection:
+                for statement in self.SCHEMA:
+                    connection.execute(statement)
+            self.__initialized = True
+        return connection
+
+    def add_run(self, module_name, report, duration, returncode=0, version=None):
+        """
+        Add tests run and delete runs of module exceeding max_runs
+
+        Args:
+            module_name (str): module name
+            report (dict): coverage report as returned by parse_coverage_report
+            duration (float): tests duration (seconds)
+            returncode (int): tests command return code
+            version (str): module version
+
+        Returns:
+            int: run id
+        """
+        with self.__lock:
+            connection = self.__connect()
+            try:
+                with connection:
+                    cursor = connection.execute(
+                        "INSERT INTO runs (module, version, timestamp, duration, "
+                        "returncode, tests, statements, missing, coverage) "
+                        "VALUES (?,?,?,?,?,?,?,?,?)",
+                        (
+                            module_name,
+                            version,
+                            time.time(),
+                            round(duration, 3),
+                            returncode,
+                            report.get("tests"),
+                            report["total"]["statements"],
+                            report["total"]["missing"],
+                            report["total"]["coverage"],
+                        ),
+                    )
+                    run_id = cursor.lastrowid
+                    connection.executemany(
+                        "INSERT INTO files (run_id, path, statements, missing, "
+                        "coverage) VALUES (?,?,?,?,?)",
+                        [
+                            (
+                                run_id,
+                                path,
+                                entry["statements"],
+                                entry["missing"],
+                                entry["coverage"],
+                            )
+                            for (path, entry) in report["files"].items()
+                        ],
+                    )
+                    self.__prune(connection, module_name)
+                return run_id
+            finally:
+                connection.close()
+
+    def get_trends(self, module_name, limit=20):
+        """
+        Return last runs of specified module with deltas from previous run
+
+        Args:
+            module_name (str): module name
+            limit (int): maximum number of runs
+
+        Returns:
+            list: runs from oldest to newest::
+
+                [
+                    {
+                        id (int): run id,
+                        version (str): module version,
+                        timestamp (float): run timestamp,
+                        duration (float): tests duration (seconds),
+                        returncode (int): tests command return code,
+                        tests (int): number of tests,
+                        statements (int): number of statements,
+                        missing (int): number of missing statements,
+                        coverage (float): coverage percentage,
+                        coveragedelta (float): coverage delta from previous run (None for first run),
+                        durationdelta (float): duration delta from previous run (None for first run),
+                    },
+                    ...
+                ]
+
+        """
+        if not os.path.exists(self.path):
+            return []
+
+        with self.__lock:
+            connection = self.__connect()
+            try:
+                rows = connection.execute(
+                    "SELECT * FROM runs WHERE module=? ORDER BY id DESC LIMIT ?",
+                    (module_name, limit + 1),
+                ).fetchall()
+            finally:
+                connection.close()
+
+        runs = [dict(row) for row in reversed(rows)]
+        trends = []
+        for (index, run) in enumerate(runs):
+            previous = runs[index - 1] if index > 0 else None
+            run.pop("module")
+            run["coveragedelta"] = (
+                round(run["coverage"] - previous["coverage"], 2) if previous else None
+            )
+            run["durationdelta"] = (
+                round(run["duration"] - previous["duration"], 3) if previous else None
+            )
+            trends.append(run)
+
+        return trends[-limit:] if limit else []
+
+    def get_file_deltas(self, module_name, run_id=None, reference_run_id=None):
+        """
+        Return per-file coverage deltas between two runs
+
+        Args:
+            module_name (str): module name
+            run_id (int): run id. Last run if None
+            reference_run_id (int): reference run id. Run preceding run_id if None
+
+        Returns:
+            dict: deltas or None if run does not exist::
+
+                {
+                    runid (int): run id,
+                    referencerunid (int): reference run id (None if no reference run),
+                    files (dict): {
+                        path (str): {
+                            coverage (float): coverage percentage (None if file removed),
+                            reference (float): reference coverage percentage (None if file added),
+                            delta (float): coverage delta (None if file added or removed),
+                        },
+                        ...
+                    }
+                }
+
+        """
+        if not os.path.exists(self.path):
+            return None
+
+        with self.__lock:
+            connection = self.__connect()
+            try:
+                if run_id is None:
+                    row = connection.execute(
+                        "SELECT id FROM runs WHERE module=? ORDER BY id DESC LIMIT 1",
+                        (module_name,),
+                    ).fetchone()
+                else:
+                    row = connection.execute(
+                        "SELECT id FROM runs WHERE module=? AND id=?",
+                        (module_name, run_id),
+                    ).fetchone()
+                if row is None:
+                    return None
+                run_id = row["id"]
+
+                if reference_run_id is None:
+                    row = connection.execute(
+                        "SELECT id FROM runs WHERE module=? AND id<? "
+                        "ORDER BY id DESC LIMIT 1",
+                        (module_name, run_id),
+                    ).fetchone()
+                    reference_run_id = row["id"] if row else None
+
+                current = self.__get_files(connection, run_id)
+                reference = (
+                    self.__get_files(connection, reference_run_id)
+                    if reference_run_id is not None
+                    else {}
+                )
+            finally:
+                connection.close()
+
+        files = {}
+        for path in sorted(set(current) | set(reference)):
+            coverage = current.get(path)
+            reference_coverage = reference.get(path)
+            files[path] = {
+                "coverage": coverage,
+                "reference": reference_coverage,
+                "delta": (
+                    round(coverage - reference_coverage, 2)
+                    if coverage is not None and reference_coverage is not None
+                    else None
+                ),
+            }
+
+        return {"runid": run_id, "referencerunid": reference_run_id, "files": files}
+
+    def __prune(self, connection, module_name):
+        old_runs = (
+            "SELECT id FROM runs WHERE module=? ORDER BY id DESC LIMIT -1 OFFSET ?"
+        )
+        parameters = (module_name, self.max_runs)
+        connection.execute(
+            f"DELETE FROM files WHERE run_id IN ({old_runs})", parameters
+        )
+        connection.execute(f"DELETE FROM runs WHERE id IN ({old_runs})", parameters)
+
+    @staticmethod
+    def __get_files(connection, run_id):
+        rows = connection.execute(
+            "SELECT path, coverage FROM files WHERE run_id=?", (run_id,)
+        ).fetchall()
+        return {row["path"]: row["coverage"] for row in rows}
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import fnmatch
+import argparse
+
+
+def get_ranges(lines):
+    """
+    Compact sorted line numbers into ranges
+
+    Args:
+        lines (list): line numbers
+
+    Returns:
+        list: list of [first, last] ranges
+    """
+    ranges = []
+    for line in sorted(lines):
+        if ranges and line == ranges[-1][1] + 1:
+            ranges[-1][1] = line
+        else:
+            ranges.append([line, line])
+    return ranges
+
+
+def _get_coverage(statements, missing):
+    if statements == 0:
+        return 100.0
+    return round(100.0 * (statements - missing) / statements, 2)
+
+
+def build_summary(data_file, root):
+    """
+    Build compact coverage summary from coverage data file
+
+    Args:
+        data_file (str): coverage data file path
+        root (str): module directory. Files outside it and module tests are ignored
+
+    Returns:
+        dict: coverage summary::
+
+            {
+                timestamp (float): coverage data modification timestamp,
+                files (dict): {
+                    path (str): {
+                        statements (int): number of statements,
+                        missing (int): number of missing statements,
+                        coverage (float): coverage percentage,
+                        missinglines (list): missing lines ranges ([first, last]),
+                    },
+                    ...
+                },
+                total (dict): {
+                    statements (int): number of statements,
+                    missing (int): number of missing statements,
+                    coverage (float): coverage percentage,
+                },
+            }
+
+    """
+    # lazy import: coverage is only needed when summary is built
+    import coverage  # pylint: disable=import-outside-toplevel
+
+    cov = coverage.Coverage(data_file=data_file)
+    cov.load()
+    root = os.path.abspath(root)
+    files = {}
+    for measured_file in sorted(cov.get_data().measured_files()):
+        path = os.path.relpath(os.path.abspath(measured_file), root)
+        if path.startswith(("..", "tests" + os.sep)):
+            continue
+        try:
+            _, statements, _, missing, _ = cov.analysis2(measured_file)
+        except Exception:  # pylint: disable=broad-except
+            # source file removed since tests run
+            continue
+        files[path] = {
+            "statements": len(statements),
+            "missing": len(missing),
+            "coverage": _get_coverage(len(statements), len(missing)),
+            "missinglines": get_ranges(missing),
+        }
+
+    statements = sum(entry["statements"] for entry in files.values())
+    missing = sum(entry["missing"] for entry in files.values())
+    return {
+        "timestamp": os.path.getmtime(data_file),
+        "files": files,
+        "total": {
+            "statements": statements,
+            "missing": missing,
+            "coverage": _get_coverage(statements, missing),
+        },
+    }
+
+
+def filter_summary(summary, pattern=None, max_coverage=None):
+    """
+    Filter coverage summary files. Total is not changed
+
+    Args:
+        summary (dict): coverage summary (see build_summary)
+        pattern (str): keep only files whose path matches this glob pattern
+        max_coverage (float): keep only files whose coverage is lower or equal
+
+    Returns:
+        dict: filtered coverage summary
+    """
+    files = {
+        path: entry
+        for (path, entry) in summary["files"].items()
+        if (pattern is None or fnmatch.fnmatch(path, pattern))
+        and (max_coverage is None or entry["coverage"] <= max_coverage)
+    }
+    return dict(summary, files=files)
+
+
+def read_summary(path):
+    """
+    Read coverage summary file
+
+    Args:
+        path (str): summary file path
+
+    Returns:
+        dict: coverage summary (see build_summary) or None if file does not exist or is
+            invalid
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as fd:
+            return json.load(fd)
+    except (OSError, ValueError):
+        return None
+
+
+def write_summary(data_files, root, output):
+    """
+    Build coverage summary from newest existing data file and write it
+
+    Args:
+        data_files (list): candidate coverage data files
+        root (str): module directory
+        output (str): summary file path
+
+    Returns:
+        bool: True if summary was written
+    """
+    existing = [path for path in data_files if os.path.exists(path)]
+    if not existing:
+        return False
+
+    summary = build_summary(max(existing, key=os.path.getmtime), root)
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(f"{output}.tmp", "w", encoding="utf-8") as fd:
+        json.dump(summary, fd)
+    os.replace(f"{output}.tmp", output)
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write compact coverage summary")
+    parser.add_argument("--root", required=True)
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--data", action="append", default=[])
+    args = parser.parse_args()
+    try:
+        if not write_summary(args.data, args.root, args.output):
+            sys.stderr.write("No coverage data found, coverage summary not updated\n")
+    except Exception as error:  # pylint: disable=broad-except
+        # summary is a cache: never fail tests run because of it
+        sys.stderr.write(f"Unable to write coverage summary: {error}\n")
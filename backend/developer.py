@@ -2,17 +2,36 @@
 # -*- coding: utf-8 -*-
 
 import os
+import re
 import inspect
 import json
-import requests
+import time
+import hashlib
+import threading
+import functools
+import shutil
+import shlex
 from cleep.core import CleepModule
 from cleep.libs.internals.console import Console, EndlessConsole
-from cleep.libs.internals.cleepdoc import CleepDoc
+from cleep.libs.internals.task import Task
 from cleep.exception import CommandError, MissingParameter, InvalidParameter
-from cleep.libs.internals import __all__ as internals_libs
-from cleep.libs.drivers import __all__ as drivers_libs
-from cleep.libs.configs import __all__ as configs_libs
-from cleep.libs.commands import __all__ as commands_libs
+from .clistats import CliStats
+from .profilesummary import merge_profiles, get_hotspots, format_hotspots
+from .adaptivetimeout import AdaptiveTimeout
+from .processtree import find_processes, kill_tree
+from .docrenderer import DocRenderer
+from .outputlog import OutputLog
+from .writesession import WriteSession
+from .apptemplate import AppTemplate
+from .coveragestore import CoverageStore, parse_coverage_report
+from .streamcommand import stream_command
+from .eventdispatcher import EventDispatcher
+from .modulecatalog import ModuleCatalog
+from .joblimits import wrap_command, kill_job, new_usage_path, read_usage
+from .frontendassets import FrontendAssets
+from .runhistory import RunHistory
+from .checkdag import CheckDag, STATUS_SUCCEEDED
+from .coveragesummary import read_summary, filter_summary
 
 
 __all__ = ["Developer"]
@@ -55,12 +74,63 @@ class Developer(CleepModule):
     MODULE_URLBUGS = "https://github.com/CleepDevice/cleepmod-developer/issues"
 
     MODULE_CONFIG_FILE = "developer.conf"
-    DEFAULT_CONFIG = {"moduleindev": None}
+    DEFAULT_CONFIG = {
+        "moduleindev": None,
+        "statsinterval": 0,
+        "restartquietperiod": 1.0,
+    }
 
     BUFFER_SIZE = 10
-
+    EVENTS_RATE = 10.0
+    EVENTS_BURST = 20
+    OUTPUT_LOG_SIZE = 5000
+    OUTPUT_RANGE_MAX = 500
+    RUN_HISTORY_MAX_RUNS = 100
+    RUN_HISTORY_MAX_SIZE = 20 * 1024 * 1024
+    RUN_LOG_SEGMENT_SIZE = 512 * 1024
+    RUN_HISTORY_JOBS = ("tests", "docs", "build")
+    BATCH_MAX_CONCURRENCY = 2
+    CHECK_MAX_CONCURRENCY = 2
+    # cleep-cli commands running at the same time, whatever their caller (checks, batch)
+    CLI_MAX_CONCURRENCY = 2
+    PIPELINE_STEPS = ("check", "tests", "doc", "build")
+    PIPELINE_OUTPUT_LINES = 50
+    CLI_OUTPUT_MAX_SIZE = 8 * 1024 * 1024
+    CLI_DEFAULT_TIMEOUT = 30.0
+
+    # spawned jobs limits: niceness increment, data segment (bytes), wall time (s)
+    # data segment includes thread stacks (8MB each): limits only catch runaway jobs
+    JOB_LIMITS = {
+        "watcher": {"nice": 5, "memory": 512 * 1024 * 1024, "walltime": None},
+        "tests": {"nice": 10, "memory": 2048 * 1024 * 1024, "walltime": 1800.0},
+        "docs": {"nice": 10, "memory": 1024 * 1024 * 1024, "walltime": 600.0},
+        "cli": {"nice": 10, "memory": 1024 * 1024 * 1024, "walltime": None},
+        "testserver": {"nice": 10, "memory": 2048 * 1024 * 1024, "walltime": None},
+    }
+
+    PATH_MODULE_SOURCES = "/root/cleep/modules/%(MODULE_NAME)s/"
     PATH_MODULE_TESTS = "/root/cleep/modules/%(MODULE_NAME)s/tests/"
     PATH_MODULE_FRONTEND = "/root/cleep/modules/%(MODULE_NAME)s/frontend/"
+    PATH_PROFILES = "/tmp/cleep/developer/profiles/"
+    PATH_TIMEOUTS_HISTORY = "/etc/cleep/developer.timeouts.json"
+    PATH_DOC_CACHE = "/tmp/cleep/developer/docs/"
+    PATH_APP_TEMPLATE = "/etc/cleep/developer.template.json"
+    PATH_COVERAGE_HISTORY = "/etc/cleep/developer.coverage.db"
+    PATH_TEST_SERVER = os.path.join(os.path.dirname(__file__), "testserver.py")
+    PATH_TEST_SERVER_SOCKET = "/run/cleep/developer/testserver.sock"
+    PATH_RUN_HISTORY = "/tmp/cleep/developer/runs/"
+    PATH_COVERAGE_SUMMARY = "/tmp/cleep/developer/coverage/%(MODULE_NAME)s.json"
+    PATH_COVERAGE_SUMMARY_SCRIPT = os.path.join(
+        os.path.dirname(__file__), "coveragesummary.py"
+    )
+
+    COVERAGE_TRENDS_MAX = 100
+    PROFILES_MAX = 5
+    PROFILE_HOTSPOTS = 20
+    WRITE_QUIET_PERIOD = 2.0
+    RESTART_QUIET_PERIOD_MAX = 30.0
+
+    MODULE_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9]*$")
 
     CLI = "/usr/local/bin/cleep-cli"
     CLI_WATCHER_CMD = CLI + " watch --loglevel=40"
@@ -80,6 +150,35 @@ class Developer(CleepModule):
     CLI_CHECK_DOC_CMD = '%s modcheckdoc --module "%s" --json'
     CLI_CHECK_BREAKING_CHANGES_CMD = '%s modcheckbreakingchanges --module "%s" --json'
     CLI_BUILD_APP_CMD = '%s modbuild --module "%s"'
+    CLI_TESTS_PROFILE_CMD = 'cd "%s" && python3 -m cProfile -o "%s" -m pytest -q'
+    CLI_PROFILE_CMD = 'python3 -m cProfile -o "%s" %s'
+    CLI_COVERAGE_SUMMARY_CMD = (
+        'python3 "%s" --root "%s" --output "%s" '
+        '--data "%s.coverage" --data "%s.coverage"'
+    )
+    CLI_TESTS_WITH_SUMMARY_CMD = "%s; RC=$?; %s; exit $RC"
+    CLI_TEST_SERVER_CMD = 'python3 "%s" --socket "%s" --serve'
+    CLI_TESTS_FAST_CMD = (
+        'python3 "%s" --socket "%s" --cwd "%s" --source "%s" --fallback \'%s\' -- -q'
+    )
+
+    # command type: (default timeout, floor, ceiling) in seconds
+    COMMAND_TIMEOUTS = {
+        "modcreate": (10.0, 5.0, 60.0),
+        "modsync": (60.0, 10.0, 300.0),
+        "modcheckbackend": (15.0, 5.0, 120.0),
+        "modcheckfrontend": (15.0, 5.0, 120.0),
+        "modcheckscripts": (15.0, 5.0, 120.0),
+        "modchecktests": (15.0, 5.0, 120.0),
+        "modcheckcode": (15.0, 5.0, 120.0),
+        "modcheckchangelog": (15.0, 5.0, 120.0),
+        "modcheckdoc": (30.0, 5.0, 180.0),
+        "modcheckbreakingchanges": (20.0, 5.0, 120.0),
+        "modbuild": (60.0, 15.0, 300.0),
+        "moddoc": (30.0, 5.0, 180.0),
+        "modapidocpath": (10.0, 2.0, 60.0),
+        "modtests": (300.0, 60.0, 1800.0),
+    }
 
     def __init__(self, bootstrap, debug_enabled):
         """
@@ -93,39 +192,86 @@ class Developer(CleepModule):
 
         # members
         self.__developer_uuid = None
+        self.__devices_cache = None
         self.cleep_path = os.path.dirname(inspect.getfile(CleepModule))
         self.__last_application_build = None
         self.__watcher_task = None
+        self.__watcher_enabled = False
         self.__tests_task = None
         self.__tests_buffer = []
         self.__docs_task = None
         self.__docs_buffer = []
+        self.__outputs = {
+            "tests": OutputLog(self.OUTPUT_LOG_SIZE),
+            "docs": OutputLog(self.OUTPUT_LOG_SIZE),
+        }
+        self.__run_history = RunHistory(
+            self.PATH_RUN_HISTORY,
+            self.RUN_HISTORY_MAX_RUNS,
+            self.RUN_HISTORY_MAX_SIZE,
+            self.RUN_LOG_SEGMENT_SIZE,
+        )
+        self.__tests_profile = None
+        self.__last_profiles = {}
+        self.__cli_stats = CliStats()
+        self.__timeouts = AdaptiveTimeout(self.COMMAND_TIMEOUTS)
+        self.__doc_renderer = DocRenderer()
+        self.__checks_cache = {}
+        self.__checks_cache_lock = threading.Lock()
+        self.__batch_semaphore = threading.BoundedSemaphore(self.BATCH_MAX_CONCURRENCY)
+        self.__cli_semaphore = threading.BoundedSemaphore(self.CLI_MAX_CONCURRENCY)
+        self.__stats_task = None
+        self.__write_session = WriteSession(
+            self.cleep_filesystem, self.WRITE_QUIET_PERIOD, self.logger
+        )
+        self.__app_template = AppTemplate()
+        # one more run than trends max: delta of oldest returned run needs it
+        self.__coverage_store = CoverageStore(
+            self.PATH_COVERAGE_HISTORY, self.COVERAGE_TRENDS_MAX + 1
+        )
+        self.__dispatcher = EventDispatcher(
+            self.EVENTS_RATE, self.EVENTS_BURST, logger=self.logger
+        )
+        self.__tests_run = None
+        self.__create_job = None
+        self.__test_server_task = None
+        self.__catalog = ModuleCatalog(os.path.join(self.cleep_path, "modules"))
+        self.__frontend_assets = FrontendAssets(
+            self.DEFAULT_CONFIG["restartquietperiod"],
+            self.__send_frontend_changes,
+            self.logger,
+        )
 
         # events
         self.tests_output_event = self._get_event("developer.tests.output")
         self.docs_output_event = self._get_event("developer.docs.output")
         self.frontend_restart_event = self._get_event("developer.frontend.restart")
+        self.frontend_assets_event = self._get_event("developer.frontend.assets")
+        self.performance_stats_event = self._get_event("developer.performance.stats")
+        self.application_create_event = self._get_event("developer.application.create")
 
     def _configure(self):
         """
         Configure module
         """
-        # disable rw if in development
         module_in_dev = self._get_config_field("moduleindev")
         self.logger.debug("Module in development: %s", module_in_dev)
-        if module_in_dev:
-            self.logger.info(
-                'Module "%s" is in development, disable RO feature', module_in_dev
-            )
-            self.cleep_filesystem.enable_write(root=True, boot=True)
 
         # add dummy device
-        self.logger.debug("device_count=%d", self._get_device_count())
-        if self._get_device_count() == 0:
+        device_count = self._get_device_count()
+        self.logger.debug("device_count=%d", device_count)
+        if device_count == 0:
             self.logger.debug("Add default devices")
             developer = {"type": "developer", "name": "Developer"}
             self._add_device(developer)
 
+        # load learned command timeouts
+        self.__load_timeouts_history()
+
+        quiet_period = self._get_config_field("restartquietperiod")
+        if quiet_period is not None:
+            self.__frontend_assets.quiet_period = float(quiet_period)
+
         # store device uuids for events
         devices = self.get_module_devices()
         self.logger.debug("devices: %s", devices)
@@ -137,44 +283,595 @@ class Developer(CleepModule):
         """
         Module starts
         """
-        self.__start_watcher()
+        # stay dormant (no watcher) while no application is in development
+        if self._get_config_field("moduleindev"):
+            self.__start_watcher()
+            self.__start_test_server()
+        else:
+            self.logger.info("No application in development, developer is dormant")
+        self.__start_stats_task()
 
     def _on_stop(self):
         """
         Custom stop: stop remotedev thread
         """
+        self.__stop_stats_task()
         self.__stop_watcher()
-        if self.__tests_task:
-            self.__tests_task.stop()
-        if self.__docs_task:
-            self.__docs_task.stop()
+        self.__stop_test_server()
+        self.__frontend_assets.cancel()
+        self.__save_timeouts_history()
+        self.__stop_job("tests", self.__tests_task)
+        self.__stop_job("docs", self.__docs_task)
+        self.__dispatcher.flush()
+        self.__write_session.reset()
 
     def __start_watcher(self):
         """
         Launch cleep-cli watch command
         """
+        self.__watcher_enabled = True
         self.__kill_watchers()
 
+        # cleep-cli watcher is a separate process syncing files as soon as it detects
+        # a change, developer is only notified after files are written. A write window
+        # can't be opened around each sync, root partition stays writable while watcher
+        # runs (only while an application is in development)
+        self.__write_session.open("watcher", root=True, boot=False)
+
+        self.__track_frontend(self._get_config_field("moduleindev"))
+
         self.logger.info("Launch watcher task")
-        self.__watcher_task = EndlessConsole(
-            self.CLI_WATCHER_CMD, self.__watcher_callback, self.__watcher_end_callback
+        self.__watcher_task = self.__start_endless_command(
+            self.CLI_WATCHER_CMD,
+            self.__watcher_callback,
+            self.__watcher_end_callback,
+            "watcher",
+        )
+
+    def __track_frontend(self, module_name):
+        """
+        Track frontend assets of module in development
+
+        Args:
+            module_name (str): module in development. None to stop tracking
+        """
+        self.__frontend_assets.track(
+            self.PATH_MODULE_FRONTEND % {"MODULE_NAME": module_name}
+            if module_name
+            else None
         )
-        self.__watcher_task.start()
 
     def __stop_watcher(self):
         """
         Stop running watcher instance
         """
+        self.__watcher_enabled = False
+        self.__kill_watchers()
         if self.__watcher_task:
             self.__watcher_task.stop()
-        self.__kill_watchers()
+        self.__write_session.close("watcher")
+        self.__frontend_assets.track(None)
+
+    def __invalidate_module_in_dev(self):
+        """
+        Drop catalog entry of module in development after watcher notified changes
+        """
+        module_in_dev = self._get_config_field("moduleindev")
+        if module_in_dev:
+            self.__catalog.invalidate(module_in_dev)
+
+    def __start_test_server(self):
+        """
+        Launch pre-warmed tests runner, tests are started faster when it is running
+        """
+        if self.__test_server_task:
+            return
+
+        self.logger.info("Launch test server")
+        self.__test_server_task = self.__start_endless_command(
+            self.CLI_TEST_SERVER_CMD
+            % (self.PATH_TEST_SERVER, self.PATH_TEST_SERVER_SOCKET),
+            self.__test_server_callback,
+            self.__test_server_end_callback,
+            "testserver",
+        )
+
+    def __stop_test_server(self):
+        """
+        Stop pre-warmed tests runner
+        """
+        self.__stop_job("testserver", self.__test_server_task)
+        self.__test_server_task = None
+
+    def __test_server_callback(self, stdout, stderr):
+        """
+        Callback when test server writes messages on stdXXX
+
+        Args:
+            stdout (str): stdout message
+            stderr (str): stderr message
+        """
+        if stdout:
+            self.logger.debug("Test server: %s", stdout)
+        if stderr:
+            self.logger.warning("Test server: %s", stderr)
+
+    def __test_server_end_callback(self, return_code, killed):
+        """
+        Callback when test server ends. Tests are then run by cleep-cli
+
+        Args:
+            return_code (int): command return code
+            killed (bool): True if test server killed
+        """
+        if self.__test_server_task and not killed:
+            self.logger.warning(
+                "Test server stopped unexpectedly (return code %s)", return_code
+            )
+        self.__test_server_task = None
 
     def __kill_watchers(self):
         """
-        Kill all watchers instances
+        Kill all watchers instances (including the ones not launched by developer)
+        """
+        self.__stop_job("watcher", None)
+        self.__kill_command_tree("cleep-cli watch")
+
+    def __stop_job(self, job, task):
+        """
+        Stop job task and kill all its processes (process group and children)
+
+        Args:
+            job (str): job name (see JOB_LIMITS)
+            task (EndlessConsole): job task if any
+        """
+        try:
+            killed = kill_job(job)
+            if killed:
+                self.logger.info('Killed "%s" job processes: %s', job, killed)
+        except Exception:
+            self.logger.exception('Unable to kill "%s" job processes', job)
+        if task:
+            task.stop()
+
+    def __wrap_job_command(self, command, job, usage_path=None):
+        """
+        Wrap command to run it in its own process group with job limits
+
+        Args:
+            command (str): command to execute
+            job (str): job name (see JOB_LIMITS)
+            usage_path (str): file job resource usage is written to
+
+        Returns:
+            str: wrapped command
+        """
+        limits = self.JOB_LIMITS[job]
+        return wrap_command(
+            command,
+            job,
+            nice=limits["nice"],
+            memory=limits["memory"],
+            wall_time=limits["walltime"],
+            usage_path=usage_path,
+        )
+
+    def __get_command_type(self, command):
+        """
+        Return command type used to aggregate statistics (cli sub command)
+
+        Args:
+            command (str): command line
+
+        Returns:
+            str: command type
+        """
+        if self.CLI in command:
+            parts = command.split(self.CLI, 1)[1].split()
+        else:
+            parts = [os.path.basename(command.split()[0])] if command else []
+        return parts[0] if parts else "unknown"
+
+    @staticmethod
+    def __get_output_size(output):
+        """
+        Return size of command output
+
+        Args:
+            output (list|str): command output
+
+        Returns:
+            int: output size
+        """
+        if not output:
+            return 0
+        if isinstance(output, str):
+            return len(output)
+        return sum(len(line) for line in output)
+
+    def __record_command(
+        self, command_type, start, usage, returncode, killed, output_bytes
+    ):
         """
+        Record command execution in statistics
+
+        Args:
+            command_type (str): command type
+            start (float): command start timestamp
+            usage (dict): command resource usage (see joblimits.get_usage). None if
+                not available (job wrapper killed)
+            returncode (int): command return code
+            killed (bool): True if command was killed
+            output_bytes (int): command output size
+
+        Returns:
+            float: command duration
+        """
+        duration = time.time() - start
+        usage = usage or {"cputime": 0.0, "maxrss": 0}
+        self.__cli_stats.record(
+            command_type,
+            duration,
+            returncode,
+            killed=bool(killed),
+            output_bytes=output_bytes,
+            cpu_time=usage["cputime"],
+            peak_rss=usage["maxrss"],
+        )
+
+        return duration
+
+    def __run_command(self, command, timeout=None, module_name=None):
+        """
+        Execute command and record its statistics
+
+        Args:
+            command (str): command to execute
+            timeout (float): command timeout. If None, timeout learned from previous runs
+                is used (Console default one for unhandled commands)
+            module_name (str): name of module the command runs on
+
+        Returns:
+            dict: console command result
+        """
+        command_type = self.__get_command_type(command)
+        module_size = self.__get_module_size(module_name)
+        if timeout is None:
+            timeout = self.__timeouts.get_timeout(command_type, module_size)
+
+        usage_path = new_usage_path("cli")
         console = Console()
-        console.command('/usr/bin/pkill -9 -f "cleep-cli watch"')
+        job_command = self.__wrap_job_command(command, "cli", usage_path)
+        with self.__cli_semaphore:
+            start = time.time()
+            if timeout is None:
+                res = console.command(job_command)
+            else:
+                res = console.command(job_command, timeout)
+
+        killed = res.get("killed", False)
+        duration = self.__record_command(
+            command_type,
+            start,
+            read_usage(usage_path),
+            res.get("returncode"),
+            killed,
+            self.__get_output_size(res.get("stdout"))
+            + self.__get_output_size(res.get("stderr")),
+        )
+        if killed:
+            self.logger.warning(
+                'Command "%s" killed after %.1f seconds', command, duration
+            )
+            self.__kill_command_tree(command)
+            if timeout is not None:
+                self.__timeouts.record_kill(command_type, timeout, module_size)
+        elif res.get("returncode") == 0:
+            self.__timeouts.record(command_type, duration, module_size)
+
+        return res
+
+    def __run_json_command(self, command, timeout=None, module_name=None):
+        """
+        Execute command whose stdout contains JSON documents and record its statistics
+
+        Stdout is parsed while it is received (see stream_command) and command is killed
+        as soon as its output exceeds CLI_OUTPUT_MAX_SIZE or contains invalid JSON.
+
+        Args:
+            command (str): command to execute
+            timeout (float): command timeout. If None, timeout learned from previous runs
+                is used
+            module_name (str): name of module the command runs on
+
+        Returns:
+            dict: command result (see stream_command)
+        """
+        command_type = self.__get_command_type(command)
+        module_size = self.__get_module_size(module_name)
+        if timeout is None:
+            timeout = self.__timeouts.get_timeout(command_type, module_size)
+
+        if timeout is None:
+            timeout = self.CLI_DEFAULT_TIMEOUT
+
+        limits = self.JOB_LIMITS["cli"]
+        with self.__cli_semaphore:
+            start = time.time()
+            res = stream_command(
+                command,
+                timeout,
+                self.CLI_OUTPUT_MAX_SIZE,
+                nice=limits["nice"],
+                memory=limits["memory"],
+            )
+
+        duration = self.__record_command(
+            command_type,
+            start,
+            res["usage"],
+            res["returncode"],
+            res["killed"],
+            res["outputsize"],
+        )
+        if res["killed"]:
+            self.logger.warning(
+                'Command "%s" killed after %.1f seconds', command, duration
+            )
+            self.__timeouts.record_kill(command_type, timeout, module_size)
+        elif res["truncated"]:
+            self.logger.warning(
+                'Command "%s" killed: output exceeds %d bytes',
+                command,
+                self.CLI_OUTPUT_MAX_SIZE,
+            )
+        elif res["error"]:
+            self.logger.warning(
+                'Command "%s" killed: invalid output (%s)', command, res["error"]
+            )
+        elif res["returncode"] == 0:
+            self.__timeouts.record(command_type, duration, module_size)
+
+        return res
+
+    def __kill_command_tree(self, command):
+        """
+        Kill processes remaining from specified command and all their children
+
+        Args:
+            command (str): command line
+        """
+        try:
+            pids = find_processes(command.replace('"', ""))
+            killed = kill_tree(pids)
+            if killed:
+                self.logger.info(
+                    'Killed remaining processes of "%s": %s', command, killed
+                )
+        except Exception:
+            self.logger.exception('Unable to kill processes of command "%s"', command)
+
+    def __get_module_size(self, module_name):
+        """
+        Return module size
+
+        Args:
+            module_name (str): module name
+
+        Returns:
+            int: module size in KB (0 if module is unknown)
+        """
+        entry = self.__catalog.get(module_name)
+        return entry["size"] // 1024 if entry else 0
+
+    def __load_timeouts_history(self):
+        """
+        Load learned command timeouts history
+        """
+        try:
+            if os.path.exists(self.PATH_TIMEOUTS_HISTORY):
+                self.__timeouts.from_dict(
+                    self.cleep_filesystem.read_json(self.PATH_TIMEOUTS_HISTORY)
+                )
+        except Exception:
+            self.logger.exception("Unable to load command timeouts history")
+
+    def __save_timeouts_history(self):
+        """
+        Save learned command timeouts history
+        """
+        try:
+            self.__write_session.queue_write(
+                self.PATH_TIMEOUTS_HISTORY, json.dumps(self.__timeouts.to_dict())
+            )
+            self.__write_session.flush()
+        except Exception:
+            self.logger.exception("Unable to save command timeouts history")
+
+    def get_command_timeouts(self, module_name=None):
+        """
+        Return current command timeouts
+
+        Args:
+            module_name (str): module name to take module size into account
+
+        Returns:
+            dict: timeout (seconds) by command type
+        """
+        module_size = self.__get_module_size(module_name)
+        return {
+            command_type: self.__timeouts.get_timeout(command_type, module_size)
+            for command_type in self.COMMAND_TIMEOUTS
+        }
+
+    def __start_endless_command(self, command, callback, end_callback, job):
+        """
+        Start endless command as limited job and record its statistics when it ends
+
+        Args:
+            command (str): command to execute
+            callback (function): output callback
+            end_callback (function): end callback
+            job (str): job name (see JOB_LIMITS)
+
+        Returns:
+            EndlessConsole: started task
+        """
+        command_type = self.__get_command_type(command)
+        context = {
+            "start": time.time(),
+            "usagepath": new_usage_path(job),
+            "outputbytes": 0,
+        }
+
+        def output_callback(stdout, stderr):
+            context["outputbytes"] += len(stdout or "") + len(stderr or "")
+            callback(stdout, stderr)
+
+        def command_end_callback(return_code, killed):
+            self.__record_command(
+                command_type,
+                context["start"],
+                read_usage(context["usagepath"]),
+                return_code,
+                killed,
+                context["outputbytes"],
+            )
+            end_callback(return_code, killed)
+
+        task = EndlessConsole(
+            self.__wrap_job_command(command, job, context["usagepath"]),
+            output_callback,
+            command_end_callback,
+        )
+        task.start()
+
+        return task
+
+    def __start_stats_task(self):
+        """
+        Start periodic performance stats event task if enabled
+        """
+        self.__stop_stats_task()
+        interval = self._get_config_field("statsinterval")
+        if not interval:
+            return
+
+        self.logger.debug("Start performance stats task (interval=%ss)", interval)
+        self.__stats_task = Task(
+            float(interval), self.__send_performance_stats, self.logger
+        )
+        self.__stats_task.start()
+
+    def __stop_stats_task(self):
+        """
+        Stop periodic performance stats event task
+        """
+        if self.__stats_task:
+            self.__stats_task.stop()
+            self.__stats_task = None
+
+    def __send_performance_stats(self):
+        """
+        Send performance stats event
+        """
+        self.__dispatcher.dispatch(
+            "developer.performance.stats",
+            self.performance_stats_event,
+            {"stats": self.__cli_stats.get_stats()},
+            to="rpc",
+            render=False,
+        )
+
+    def get_performance_stats(self):
+        """
+        Return cleep-cli commands performance statistics
+
+        Returns:
+            dict: statistics by command type::
+
+                {
+                    command type (str): {
+                        count (int): number of executions,
+                        failures (int): number of failed executions,
+                        timeouts (int): number of killed executions,
+                        outputbytes (int): total output size,
+                        cputime (float): total cpu time (seconds),
+                        peakrss (int): peak memory of a single run (KB),
+                        lastreturncode (int): last return code,
+                        lastrun (int): last run timestamp,
+                        p50 (float): median duration (seconds),
+                        p95 (float): 95th percentile duration (seconds),
+                    },
+                    ...
+                }
+
+        """
+        return self.__cli_stats.get_stats()
+
+    def set_performance_stats_interval(self, interval):
+        """
+        Set periodic performance stats event interval
+
+        Args:
+            interval (int): interval in seconds. 0 disables periodic event
+
+        Raises:
+            MissingParameter: if parameter is missing
+            InvalidParameter: if parameter is invalid
+        """
+        if interval is None:
+            raise MissingParameter('Parameter "interval" is missing')
+        if not isinstance(interval, int) or interval < 0:
+            raise InvalidParameter('Parameter "interval" must be a positive integer')
+
+        self._set_config_field("statsinterval", interval)
+        self.__start_stats_task()
+
+    def get_modules_catalog(self):
+        """
+        Return catalog of installed modules
+
+        Returns:
+            list: list of modules::
+
+                [
+                    {
+                        name (str): module name,
+                        path (str): module directory,
+                        mainpath (str): module main file,
+                        version (str): module version (None if not found),
+                        files (list): module files (relative to module directory),
+                        size (int): module size (bytes),
+                        mtime (float): last modification timestamp,
+                        hash (str): sources hash,
+                        scanned (float): entry build timestamp,
+                    },
+                    ...
+                ]
+
+        """
+        return self.__catalog.get_all()
+
+    def get_filesystem_stats(self):
+        """
+        Return filesystem write windows statistics
+
+        Returns:
+            dict: write windows statistics::
+
+                {
+                    windows (int): number of read-write windows opened,
+                    rwseconds (dict): time spent in read-write by partition (seconds),
+                    writable (dict): current read-write state by partition,
+                    sessions (list): opened long-lived sessions (watcher, tests...),
+                    pendingwrites (int): number of queued writes,
+                    writes (int): number of batched writes,
+                    flushes (int): number of queued writes flushes,
+                }
+
+        """
+        return self.__write_session.get_stats()
 
     def __watcher_callback(self, stdout, stderr):
         """
@@ -184,6 +881,8 @@ class Developer(CleepModule):
             stdout (string): message from stdout
             stderr (string): message from stderr
         """
+        # watcher only outputs when it syncs files or fails
+        self.__invalidate_module_in_dev()
         if self.__watcher_task:
             self.logger.error("Error on watcher: %s %s", stdout, stderr)
 
@@ -200,255 +899,1285 @@ class Developer(CleepModule):
                 'Watcher stops while it should not with return code "%s"', return_code
             )
         if self.__tests_task:
-            self.tests_output_event.send(
-                params={
-                    "messages": "====== Tests crashes. Run tests manually please to check errors ====="
-                },
-                to="rpc",
-                render=False,
+            self.__send_tests_output(
+                "====== Tests crashes. Run tests manually please to check errors =====",
+                last=True,
             )
 
-        self.__start_watcher()
+        # restart watcher only if it was not stopped on purpose
+        if self.__watcher_enabled:
+            self.__start_watcher()
 
     def get_module_devices(self):
         """
         Return module devices
+
+        Devices are read from config once and cached until a device is added, updated or deleted
         """
-        devices = super().get_module_devices()
-        data = {}
-        self.__developer_uuid = list(devices.keys())[0]
-        devices[self.__developer_uuid].update(data)
+        devices_cache = self.__devices_cache
+        if devices_cache is None:
+            devices_cache = super().get_module_devices()
+            self.__developer_uuid = list(devices_cache.keys())[0]
+            self.__devices_cache = devices_cache
 
-        return devices
+        return {
+            device_uuid: dict(device) for (device_uuid, device) in devices_cache.items()
+        }
 
-    def restart_frontend(self):
+    def _add_device(self, data):
         """
-        Send event to restart frontend
+        Add device and invalidate devices cache
+
+        Args:
+            data (dict): device data
+
+        Returns:
+            dict: added device
         """
-        self.logger.debug("Sending restart event to frontend")
-        self.frontend_restart_event.send(to="rpc")
+        self.__devices_cache = None
+        return super()._add_device(data)
 
-    def select_application_for_development(self, module_name):
+    def _update_device(self, uuid, data):
         """
-        Select application for development. It save in config the module, and enable debug.
-        It also disables debug on previous module in debug if any.
+        Update device and invalidate devices cache
 
         Args:
-            module_name (string): module to enable development on, None to disable development mode
+            uuid (string): device uuid
+            data (dict): device data
+
+        Returns:
+            bool: True if device updated
         """
-        self.__last_application_build = None
+        self.__devices_cache = None
+        return super()._update_device(uuid, data)
 
-        # disable debug on old module
-        old_module = self._get_config_field("moduleindev")
-        if old_module:
-            self.__set_module_debug(old_module, False)
+    def _delete_device(self, uuid):
+        """
+        Delete device and invalidate devices cache
 
-        # save new module in dev
-        self._set_config_field("moduleindev", module_name)
+        Args:
+            uuid (string): device uuid
 
-        # enable or disable dev mode
-        if module_name:
-            self.__set_module_debug(module_name, True)
-            self.logger.info(
-                'Application "%s" is in development, disable RO feature', module_name
-            )
-            self.cleep_filesystem.enable_write(root=True, boot=True)
-        else:
-            self.logger.info("No application in development, enable RO feature")
-            self.cleep_filesystem.disable_write(root=True, boot=True)
+        Returns:
+            bool: True if device deleted
+        """
+        self.__devices_cache = None
+        return super()._delete_device(uuid)
 
-    def __set_module_debug(self, module_name, debug):
+    def restart_frontend(self, files=None):
         """
-        Enable or disable debug on specified module
+        Notify frontend changes. Notifications are coalesced during a quiet period, then
+        frontend is restarted or changed assets are hot-swapped
 
         Args:
-            module_name (string): module name
-            debug (bool): True to enable debug, False otherwise
+            files (list): changed frontend files (relative to module frontend directory)
+                if known
         """
-        try:
-            if module_name == "developer":
-                self.set_debug(debug)
-            elif len(module_name) > 0:
-                self.send_command(
-                    "set_module_debug",
-                    "system",
-                    {"module": module_name, "debug": debug},
-                )
-        except Exception:
+        if files is not None and not isinstance(files, list):
+            raise InvalidParameter('Parameter "files" must be a list')
+
+        self.__invalidate_module_in_dev()
+        self.__frontend_assets.notify(files)
+
+    def __send_frontend_changes(self, files, reload):
+        """
+        Send frontend changes event: restart event if frontend must be reloaded, assets
+        event listing changed files otherwise
+
+        Args:
+            files (list): changed frontend files
+            reload (bool): True if frontend must be reloaded
+        """
+        if reload:
+            self.logger.debug("Sending restart event to frontend")
+            self.__dispatcher.dispatch(
+                "developer.frontend.restart",
+                self.frontend_restart_event,
+                priority=EventDispatcher.HIGH,
+                to="rpc",
+            )
+            return
+
+        self.logger.debug("Sending assets changed event to frontend: %s", files)
+        self.__dispatcher.dispatch(
+            "developer.frontend.assets",
+            self.frontend_assets_event,
+            {"module": self._get_config_field("moduleindev"), "files": files},
+            priority=EventDispatcher.HIGH,
+            to="rpc",
+        )
+
+    def set_frontend_restart_quiet_period(self, quiet_period):
+        """
+        Set quiet period used to coalesce frontend restarts
+
+        Args:
+            quiet_period (float): quiet period in seconds. 0 disables coalescing
+
+        Raises:
+            MissingParameter: if parameter is missing
+            InvalidParameter: if parameter is invalid
+        """
+        if quiet_period is None:
+            raise MissingParameter('Parameter "quiet_period" is missing')
+        if (
+            not isinstance(quiet_period, (int, float))
+            or isinstance(quiet_period, bool)
+            or not 0 <= quiet_period <= self.RESTART_QUIET_PERIOD_MAX
+        ):
+            raise InvalidParameter(
+                'Parameter "quiet_period" must be a number between 0 and %s'
+                % self.RESTART_QUIET_PERIOD_MAX
+            )
+
+        self._set_config_field("restartquietperiod", float(quiet_period))
+        self.__frontend_assets.quiet_period = float(quiet_period)
+
+    def get_frontend_restart_stats(self):
+        """
+        Return frontend restarts coalescing statistics
+
+        Returns:
+            dict: statistics::
+
+                {
+                    notifications (int): number of restart_frontend calls,
+                    sent (int): number of sent restart or assets events,
+                    pending (bool): True if changes are waiting for quiet period end,
+                }
+
+        """
+        return self.__frontend_assets.get_stats()
+
+    def select_application_for_development(self, module_name):
+        """
+        Select application for development. It save in config the module, and enable debug.
+        It also disables debug on previous module in debug if any.
+
+        Args:
+            module_name (string): module to enable development on, None to disable development mode
+        """
+        self.__last_application_build = None
+
+        # disable debug on old module
+        old_module = self._get_config_field("moduleindev")
+        if old_module:
+            self.__set_module_debug(old_module, False)
+
+        # save new module in dev
+        self._set_config_field("moduleindev", module_name)
+
+        # enable or disable dev mode
+        if module_name:
+            self.__set_module_debug(module_name, True)
+            self.logger.info('Application "%s" is in development', module_name)
+            if not self.__watcher_enabled:
+                self.__start_watcher()
+            else:
+                # running watcher now syncs new module
+                self.__track_frontend(module_name)
+            self.__start_test_server()
+        else:
+            self.logger.info("No application in development, enable RO feature")
+            # closes watcher write session only, running jobs keep their own sessions
+            self.__stop_watcher()
+            self.__stop_test_server()
+
+    def __set_module_debug(self, module_name, debug):
+        """
+        Enable or disable debug on specified module
+
+        Args:
+            module_name (string): module name
+            debug (bool): True to enable debug, False otherwise
+        """
+        try:
+            if module_name == "developer":
+                self.set_debug(debug)
+            elif len(module_name) > 0:
+                self.send_command(
+                    "set_module_debug",
+                    "system",
+                    {"module": module_name, "debug": debug},
+                )
+        except Exception:
             # module may not exists anymore
             self.logger.exception("Unable to change debug status")
 
-    def create_application(self, module_name):
+    def create_application(self, module_name):
+        """
+        Create new application skel
+
+        Creation runs in background, progress is sent by developer.application.create
+        event
+
+        Args:
+            module_name (string): module name
+
+        Raises:
+            MissingParameter: if parameter is missing
+            InvalidParameter: if module name is invalid or application already exists
+            CommandError: if application creation is already running
+        """
+        if module_name is None or len(module_name) == 0:
+            raise MissingParameter('Parameter "module_name" is missing')
+        if not isinstance(module_name, str) or not self.MODULE_NAME_PATTERN.match(
+            module_name
+        ):
+            raise InvalidParameter(
+                'Parameter "module_name" must contain only lowercase letters and '
+                "digits and start with a letter"
+            )
+        if os.path.exists(self.PATH_MODULE_SOURCES % {"MODULE_NAME": module_name}):
+            raise InvalidParameter(f'Application "{module_name}" already exists')
+        if self.__create_job and self.__create_job.is_alive():
+            raise CommandError("Application creation is already running")
+
+        self.__create_job = threading.Thread(
+            target=self.__create_application, args=(module_name,), daemon=True
+        )
+        self.__create_job.start()
+
+    def __send_create_progress(self, module_name, step, progress, error=None):
+        """
+        Send application creation progress
+
+        Args:
+            module_name (string): module name
+            step (string): creation step (template, render, sync, done, error)
+            progress (int): progress percentage
+            error (string): error message if creation failed
+        """
+        self.__dispatcher.dispatch(
+            "developer.application.create",
+            self.application_create_event,
+            {
+                "module": module_name,
+                "step": step,
+                "progress": progress,
+                "error": error,
+            },
+            priority=EventDispatcher.HIGH,
+            to="rpc",
+            render=False,
+        )
+
+    def __create_application(self, module_name):
+        """
+        Create application from pre-built template
+
+        Args:
+            module_name (string): module name
+        """
+        try:
+            with self.__write_session.session():
+                # watcher must not sync partially rendered application
+                watcher_enabled = self.__watcher_enabled
+                self.__stop_watcher()
+                try:
+                    self.__send_create_progress(module_name, "template", 10)
+                    self.__load_app_template()
+
+                    self.__send_create_progress(module_name, "render", 40)
+                    files = self.__app_template.render(
+                        module_name,
+                        self.PATH_MODULE_SOURCES % {"MODULE_NAME": module_name},
+                    )
+                    self.logger.info(
+                        'Application "%s" created (%d files)', module_name, len(files)
+                    )
+                finally:
+                    if watcher_enabled:
+                        self.__start_watcher()
+
+                # sync new app content
+                self.__send_create_progress(module_name, "sync", 70)
+                self.__run_sync(module_name)
+
+            self.__send_create_progress(module_name, "done", 100)
+        except Exception as error:
+            self.logger.exception('Error creating application "%s"', module_name)
+            self.__send_create_progress(module_name, "error", 100, str(error))
+
+    def __load_app_template(self):
+        """
+        Load application template, build it if it does not exist or is outdated
+
+        Raises:
+            CommandError: if template build failed
+        """
+        if self.__app_template.loaded:
+            return
+
+        try:
+            if os.path.exists(self.PATH_APP_TEMPLATE) and self.__app_template.load(
+                self.cleep_filesystem.read_json(self.PATH_APP_TEMPLATE)
+            ):
+                return
+        except Exception:
+            self.logger.exception("Unable to load application template")
+
+        self.__build_app_template()
+
+    def __build_app_template(self):
+        """
+        Build application template from skeleton generated by cleep-cli
+
+        Raises:
+            CommandError: if skeleton generation failed
+        """
+        self.logger.info("Building application template")
+        skeleton_path = self.PATH_MODULE_SOURCES % {
+            "MODULE_NAME": AppTemplate.PLACEHOLDER
+        }
+        shutil.rmtree(skeleton_path, ignore_errors=True)
+        cmd = self.CLI_NEW_APPLICATION_CMD % (self.CLI, AppTemplate.PLACEHOLDER)
+        try:
+            res = self.__run_command(cmd)
+            self.logger.debug(
+                "Create app cmd result: %s %s", res["stdout"], res["stderr"]
+            )
+            if res["returncode"] != 0:
+                raise CommandError(
+                    "Error during application creation. Check Cleep logs."
+                )
+            template = self.__app_template.build(skeleton_path)
+        finally:
+            shutil.rmtree(skeleton_path, ignore_errors=True)
+
+        self.__write_session.queue_write(self.PATH_APP_TEMPLATE, json.dumps(template))
+
+    def __run_sync(self, module_name):
+        """
+        Sync module content to Cleep installation
+
+        Args:
+            module_name (string): module name
+        """
+        with self.__write_session.session():
+            self.__run_command(
+                self.CLI_SYNC_MODULE_CMD % shlex.quote(module_name),
+                module_name=module_name,
+            )
+        self.__catalog.invalidate(module_name)
+
+    def __cli_check(
+        self,
+        command,
+        error_message,
+        timeout=None,
+        profile_path=None,
+        module_name=None,
+    ):
+        """
+        Execute cleep-cli check specified by command
+
+        Args:
+            command (str): cli command to execute
+            error_message (str): error message to throw if error occured
+            timeout (float): timeout value. Learned timeout if None
+            profile_path (str): run command under profiler and store raw profile to this path
+            module_name (str): checked module name
+
+        Returns:
+            dict: command output (single JSON document)
+
+        Raises:
+            CommandError: if command failed or its output is not a single JSON document
+        """
+        if profile_path:
+            command = self.CLI_PROFILE_CMD % (profile_path, command)
+        res = self.__run_json_command(command, timeout, module_name)
+        self.logger.debug(
+            'Cli command "%s" output: %s | %s', command, res["stdout"], res["stderr"]
+        )
+        # command killed on invalid or too large output has no meaningful return code
+        invalid_output = res["error"] or res["truncated"]
+        if res["returncode"] != 0 and not invalid_output:
+            self.logger.error('Command "%s" failed: %s', command, res)
+            raise CommandError(error_message)
+        if invalid_output or len(res["documents"]) != 1:
+            self.logger.error('Error parsing command "%s" output: %s', command, res)
+            raise CommandError("Error parsing check result. Check Cleep logs")
+
+        return res["documents"][0]
+
+    def check_application(self, module_name, profile=False):
+        """
+        Check application content
+
+        Checks run in parallel, limited by CHECK_MAX_CONCURRENCY, and cleep-cli processes
+        of all callers are limited by CLI_MAX_CONCURRENCY. Checks depending on a failed
+        check (breaking changes detection needs backend parsing) are skipped, other
+        checks results are still returned.
+
+        Args:
+            module_name (string): module name
+            profile (bool): run checks under profiler and return hotspots summary
+
+        Returns:
+            dict: checks results::
+
+                {
+                    backend (dict): backend check result (None if not succeeded),
+                    frontend (dict): frontend check result (None if not succeeded),
+                    scripts (dict): scripts check result (None if not succeeded),
+                    tests (dict): tests check result (None if not succeeded),
+                    changelog (dict): changelog check result (None if not succeeded),
+                    breaking_changes (dict): breaking changes check result (None if not
+                        succeeded),
+                    checks (dict): {
+                        check name (string): {
+                            status (string): succeeded, failed or skipped,
+                            error (string): error message (None if check succeeded),
+                            duration (float): check duration (seconds),
+                        },
+                        ...
+                    },
+                    profile (dict): profile infos (only if profile is True),
+                }
+
+        Raises:
+            MissingParameter: if module name is missing
+            InvalidParameter: if module does not exist
+        """
+        # check parameters
+        self.__check_module_name(module_name)
+
+        # checks graph: (name, command, error message, dependencies)
+        checks = [
+            (
+                "backend",
+                self.CLI_CHECK_BACKEND_CMD,
+                "Backend source code check failed",
+                (),
+            ),
+            (
+                "frontend",
+                self.CLI_CHECK_FRONTEND_CMD,
+                "Frontend source code check failed",
+                (),
+            ),
+            ("scripts", self.CLI_CHECK_SCRIPTS_CMD, "Scripts check failed", ()),
+            ("tests", self.CLI_CHECK_TESTS_CMD, "Tests check failed", ()),
+            # ("quality", self.CLI_CHECK_CODE_CMD, "Code quality check failed", ()),
+            ("changelog", self.CLI_CHECK_CHANGELOG_CMD, "Changelog check failed", ()),
+            (
+                "breaking_changes",
+                self.CLI_CHECK_BREAKING_CHANGES_CMD,
+                "Breaking changes check failed",
+                ("backend",),
+            ),
+        ]
+        profile_path = (
+            self.__get_profile_path(module_name, "check") if profile else None
+        )
+        check_profile_paths = []
+        dag = CheckDag(self.CHECK_MAX_CONCURRENCY)
+        for (name, command, error_message, depends) in checks:
+            check_profile_path = f"{profile_path}.{name}" if profile_path else None
+            if check_profile_path:
+                check_profile_paths.append(check_profile_path)
+            dag.add(
+                name,
+                functools.partial(
+                    self.__cli_check,
+                    command % (self.CLI, module_name),
+                    error_message,
+                    profile_path=check_profile_path,
+                    module_name=module_name,
+                ),
+                depends,
+            )
+
+        results = {}
+        statuses = {}
+        for (name, check) in dag.run().items():
+            results[name] = check.pop("result")
+            statuses[name] = check
+            if check["status"] != STATUS_SUCCEEDED:
+                self.logger.warning(
+                    'Check "%s" of "%s" %s: %s',
+                    name,
+                    module_name,
+                    check["status"],
+                    check["error"],
+                )
+        results["checks"] = statuses
+
+        if profile_path:
+            results["profile"] = self.__merge_check_profiles(
+                module_name, check_profile_paths, profile_path
+            )
+        elif all(check["status"] == STATUS_SUCCEEDED for check in statuses.values()):
+            # failed checks may be transient (timeout...), they are not cached
+            with self.__checks_cache_lock:
+                self.__checks_cache[module_name] = {
+                    "hash": self.__get_module_source_hash(module_name),
+                    "result": results,
+                }
+
+        return results
+
+    def __check_module_name(self, module_name):
+        """
+        Check module name parameter
+
+        Args:
+            module_name (string): module name
+
+        Raises:
+            MissingParameter: if module name is missing
+            InvalidParameter: if module does not exist
+        """
+        if module_name is None or len(module_name) == 0:
+            raise MissingParameter('Parameter "module_name" is missing')
+        if not self.__catalog.exists(module_name):
+            raise InvalidParameter(f'Module "{module_name}" does not exist')
+
+    def __get_cached_check(self, module_name):
+        """
+        Return cached check result if module sources did not change since
+
+        Args:
+            module_name (string): module name
+
+        Returns:
+            dict: check result or None if not cached
+        """
+        with self.__checks_cache_lock:
+            cached = self.__checks_cache.get(module_name)
+        if cached and cached["hash"] == self.__get_module_source_hash(module_name):
+            return cached["result"]
+        return None
+
+    @staticmethod
+    def __check_has_errors(result):
+        """
+        Return True if check result contains errors
+
+        Args:
+            result (dict): check result
+
+        Returns:
+            bool: True if at least one check reported errors
+        """
+        return any(
+            isinstance(check, dict) and len(check.get("errors") or []) > 0
+            for check in result.values()
+        ) or any(
+            check["status"] != STATUS_SUCCEEDED
+            for check in result.get("checks", {}).values()
+        )
+
+    def __run_tests(self, module_name):
+        """
+        Run module tests synchronously
+
+        Args:
+            module_name (string): module name
+
+        Returns:
+            dict: tests result::
+
+                {
+                    returncode (int): tests command return code,
+                    output (list): last output lines,
+                }
+
+        """
+        cmd = self.__with_coverage_summary(
+            self.CLI_TESTS_CMD % (self.CLI, module_name), module_name
+        )
+        # tests write coverage data in module directory
+        with self.__write_session.session():
+            res = self.__run_command(cmd, module_name=module_name)
+        output = (res.get("stdout") or []) + (res.get("stderr") or [])
+
+        return {
+            "returncode": res["returncode"],
+            "output": output[-self.PIPELINE_OUTPUT_LINES :],
+        }
+
+    def __with_coverage_summary(self, cmd, module_name):
+        """
+        Append coverage summary computation to tests command, summary is computed once
+        at end of run for coverage report. Tests return code is kept
+
+        Args:
+            cmd (string): tests command
+            module_name (string): module name
+
+        Returns:
+            string: tests command followed by coverage summary command
+        """
+        return self.CLI_TESTS_WITH_SUMMARY_CMD % (
+            cmd,
+            self.CLI_COVERAGE_SUMMARY_CMD
+            % (
+                self.PATH_COVERAGE_SUMMARY_SCRIPT,
+                self.PATH_MODULE_SOURCES % {"MODULE_NAME": module_name},
+                self.PATH_COVERAGE_SUMMARY % {"MODULE_NAME": module_name},
+                self.PATH_MODULE_SOURCES % {"MODULE_NAME": module_name},
+                self.PATH_MODULE_TESTS % {"MODULE_NAME": module_name},
+            ),
+        )
+
+    def __is_pipeline_success(self, report):
+        """
+        Return True if all pipeline steps of module report succeeded
+
+        Args:
+            report (dict): module report
+
+        Returns:
+            bool: True if succeeded
+        """
+        if report["error"]:
+            return False
+        if report["check"] is not None and self.__check_has_errors(report["check"]):
+            return False
+        if report["tests"] is not None and report["tests"]["returncode"] != 0:
+            return False
+        if report["doc"] is not None and not report["doc"]["valid"]:
+            return False
+        return True
+
+    def __batch_process_module(self, module_name, steps, use_cache):
+        """
+        Run pipeline steps on module within batch
+
+        Args:
+            module_name (string): module name
+            steps (list): steps to run (check, tests, doc, build). Build is skipped if a
+                previous step failed
+            use_cache (bool): reuse cached check result if module did not change
+
+        Returns:
+            dict: module report (see run_pipeline)
+        """
+        report = {
+            "check": None,
+            "tests": None,
+            "doc": None,
+            "build": None,
+            "cached": False,
+            "error": None,
+            "success": False,
+            "duration": 0.0,
+        }
+        with self.__batch_semaphore:
+            start = time.time()
+            try:
+                if "check" in steps:
+                    check = self.__get_cached_check(module_name) if use_cache else None
+                    report["cached"] = check is not None
+                    report["check"] = check or self.check_application(module_name)
+                if "tests" in steps:
+                    report["tests"] = self.__run_tests(module_name)
+                if "doc" in steps:
+                    report["doc"] = self.generate_documentation(module_name)
+                if "build" in steps and self.__is_pipeline_success(report):
+                    report["build"] = self.__build_application(module_name)
+                report["success"] = self.__is_pipeline_success(report)
+            except Exception as error:
+                self.logger.warning(
+                    'Batch processing of "%s" failed: %s', module_name, error
+                )
+                report["error"] = str(error)
+            report["duration"] = round(time.time() - start, 3)
+
+        return report
+
+    def check_applications(self, module_names, build=False, use_cache=True):
+        """
+        Check (and build) several applications at once
+
+        Modules are processed in parallel, limited by a global concurrency shared by all batches.
+
+        Args:
+            module_names (list): list of module names
+            build (bool): build applications whose check has no error
+            use_cache (bool): reuse previous check results of unchanged modules
+
+        Returns:
+            dict: batch report::
+
+                {
+                    modules (dict): {
+                        module name (string): {
+                            check (dict): check result (see check_application),
+                            build (dict): build result (package path...) or None,
+                            cached (bool): True if check result comes from cache,
+                            error (string): error message or None,
+                            success (bool): True if check has no error and build succeeded,
+                            duration (float): module processing duration,
+                        },
+                        ...
+                    },
+                    succeeded (int): number of modules processed without error,
+                    failed (int): number of modules in error,
+                    success (bool): True if all modules succeeded,
+                    duration (float): batch duration,
+                }
+
+        Raises:
+            MissingParameter: if parameter is missing
+            InvalidParameter: if parameter is invalid
+        """
+        return self.__run_batch(
+            module_names, ["check", "build"] if build else ["check"], use_cache
+        )
+
+    def __run_batch(self, module_names, steps, use_cache):
+        """
+        Run pipeline steps on several modules in parallel
+
+        Args:
+            module_names (list): list of module names
+            steps (list): steps to run
+            use_cache (bool): reuse previous check results of unchanged modules
+
+        Returns:
+            dict: batch report (see run_pipeline)
+
+        Raises:
+            MissingParameter: if parameter is missing
+            InvalidParameter: if parameter is invalid
+        """
+        if not module_names:
+            raise MissingParameter('Parameter "module_names" is missing')
+        if not isinstance(module_names, list):
+            raise InvalidParameter('Parameter "module_names" must be a list')
+        for module_name in module_names:
+            self.__check_module_name(module_name)
+        module_names = list(dict.fromkeys(module_names))
+
+        # lazy import: batches are rarely used and module is loaded at Cleep startup
+        from concurrent.futures import ThreadPoolExecutor  # pylint: disable=import-outside-toplevel
+
+        start = time.time()
+        with ThreadPoolExecutor(
+            max_workers=min(self.BATCH_MAX_CONCURRENCY, len(module_names))
+        ) as executor:
+            futures = {
+                module_name: executor.submit(
+                    self.__batch_process_module, module_name, steps, use_cache
+                )
+                for module_name in module_names
+            }
+            reports = {
+                module_name: future.result() for module_name, future in futures.items()
+            }
+
+        failed = len([report for report in reports.values() if report["error"]])
+        return {
+            "modules": reports,
+            "succeeded": len(reports) - failed,
+            "failed": failed,
+            "success": all(report["success"] for report in reports.values()),
+            "duration": round(time.time() - start, 3),
+        }
+
+    def run_pipeline(self, module_names, steps=None, use_cache=True):
+        """
+        Run check, tests, doc and build steps on several applications in a single
+        non-interactive call. It is intended to be used by CI (see developerci.py)
+
+        Args:
+            module_names (list): list of module names
+            steps (list): steps to run among check, tests, doc and build. All if None
+            use_cache (bool): reuse previous check results of unchanged modules
+
+        Returns:
+            dict: pipeline report::
+
+                {
+                    modules (dict): {
+                        module name (string): {
+                            check (dict): check result or None,
+                            tests (dict): tests returncode and last output lines or None,
+                            doc (dict): documentation result or None,
+                            build (dict): build result or None,
+                            cached (bool): True if check result comes from cache,
+                            error (string): error message or None,
+                            success (bool): True if all steps succeeded,
+                            duration (float): module processing duration,
+                        },
+                        ...
+                    },
+                    succeeded (int): number of modules processed without error,
+                    failed (int): number of modules in error,
+                    success (bool): True if all modules succeeded,
+                    duration (float): pipeline duration,
+                }
+
+        Raises:
+            MissingParameter: if parameter is missing
+            InvalidParameter: if parameter is invalid
+        """
+        steps = steps or list(self.PIPELINE_STEPS)
+        if not isinstance(steps, list) or any(
+            step not in self.PIPELINE_STEPS for step in steps
+        ):
+            raise InvalidParameter(
+                f'Parameter "steps" must be a list of {list(self.PIPELINE_STEPS)}'
+            )
+
+        return self.__run_batch(module_names, steps, use_cache)
+
+    def __merge_check_profiles(self, module_name, check_profile_paths, profile_path):
+        """
+        Merge checks raw profiles into a single run profile
+
+        Args:
+            module_name (string): module name
+            check_profile_paths (list): checks raw profile paths
+            profile_path (string): run profile path
+
+        Returns:
+            dict: profile infos::
+
+                {
+                    filename (string): run profile filename,
+                    hotspots (list): top-N hotspots (see get_hotspots)
+                }
+
+        """
+        try:
+            if not merge_profiles(check_profile_paths, profile_path):
+                return None
+            self.__last_profiles[module_name] = profile_path
+            return {
+                "filename": os.path.basename(profile_path),
+                "hotspots": get_hotspots(profile_path, self.PROFILE_HOTSPOTS),
+            }
+        except Exception:
+            self.logger.exception("Unable to summarize checks profile")
+            return None
+        finally:
+            for path in check_profile_paths:
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def __get_profile_path(self, module_name, kind):
+        """
+        Return new raw profile path for specified module. Old module profiles are purged
+
+        Args:
+            module_name (string): module name
+            kind (string): profiled run kind (tests, check)
+
+        Returns:
+            string: raw profile path
+        """
+        os.makedirs(self.PATH_PROFILES, exist_ok=True)
+
+        prefix = f"{module_name}_"
+        profiles = sorted(
+            filename
+            for filename in os.listdir(self.PATH_PROFILES)
+            if filename.startswith(prefix) and filename.endswith(".prof")
+        )
+        for filename in profiles[: max(0, len(profiles) - self.PROFILES_MAX + 1)]:
+            os.remove(os.path.join(self.PATH_PROFILES, filename))
+
+        return os.path.join(
+            self.PATH_PROFILES, f"{prefix}{int(time.time() * 1000)}_{kind}.prof"
+        )
+
+    def download_profile(self, module_name):
+        """
+        Download latest raw profile (cProfile format) of specified module
+
+        Args:
+            module_name (string): module name
+
+        Returns:
+            dict: profile infos::
+
+                {
+                    filepath (string): filepath
+                    filename (string): filename
+                }
+
+        Raises:
+            CommandError: if no profile available
+        """
+        profile_path = self.__last_profiles.get(module_name)
+        if not profile_path or not os.path.exists(profile_path):
+            raise CommandError(
+                "No profile available. Please run a profiled execution first"
+            )
+
+        return {
+            "filepath": profile_path,
+            "filename": os.path.basename(profile_path),
+        }
+
+    def build_application(self, module_name):
+        """
+        Build application archive (zip format)
+        Archive is not protected by password
+
+        Args:
+            module_name (string): module name
+
+        Raises:
+            InvalidParameter: if module does not exist
+            Exception: if build failed
+        """
+        self.__check_module_name(module_name)
+        self.__last_application_build = self.__build_application(module_name)
+
+    def __build_application(self, module_name):
+        """
+        Build application archive
+
+        Args:
+            module_name (string): module name
+
+        Returns:
+            dict: build result (package path...)
+
+        Raises:
+            CommandError: if build failed
+        """
+        cmd = self.CLI_BUILD_APP_CMD % (self.CLI, module_name)
+        self.logger.debug("Build app cmd: %s", cmd)
+
+        with self.__write_session.session():
+            res = self.__run_json_command(cmd, module_name=module_name)
+        self.__run_history.record(
+            "build", module_name, res["stdout"] + res["stderr"], res["returncode"]
+        )
+        self.logger.info(
+            "Build app result: %s | %s | %s",
+            res["documents"],
+            res["stdout"],
+            res["stderr"],
+        )
+        if res["returncode"] != 0:
+            raise CommandError("Error building application. Check Cleep logs.")
+        if res["error"] or res["truncated"] or not res["documents"]:
+            self.logger.error('Error parsing app build command "%s" output', cmd)
+            raise CommandError("Error building application. Check Cleep logs.")
+
+        return res["documents"][0]
+
+    def download_application(self):
+        """
+        Download latest generated application package
+
+        Returns:
+            dict: archive infos::
+
+                {
+                    filepath (string): filepath
+                    filename (string): filename
+                }
+
+        """
+        self.logger.debug("Download application archive")
+        if not self.__last_application_build:
+            raise CommandError("Please build application first")
+
+        return {
+            "filepath": self.__last_application_build["package"],
+            "filename": os.path.basename(self.__last_application_build["package"]),
+        }
+
+    def __send_output(self, job, event, messages, last):
+        """
+        Retain job output and send it to clients
+
+        Output chunks are rate limited and coalesced, last message of a run is sent
+        with high priority after pending chunks. Each event holds run identifier and
+        sequence number of its last message so clients detect missed messages and
+        resume output (see resume_output)
+
+        Args:
+            job (string): job name (tests, docs)
+            event (Event): output event
+            messages (list|str): message or list of messages
+            last (bool): True if messages end job run
+        """
+        seq = self.__outputs[job].append(messages)
+        run_id = self.__outputs[job].run_id
+        self.__run_history.append(run_id, messages)
+        name = f"developer.{job}.output"
+        params = {"messages": messages, "runid": run_id, "seq": seq}
+        if last:
+            self.__dispatcher.dispatch(
+                name,
+                event,
+                params,
+                priority=EventDispatcher.HIGH,
+                flush=[name],
+                to="rpc",
+                render=False,
+            )
+        else:
+            self.__dispatcher.dispatch(
+                name,
+                event,
+                params,
+                merge=EventDispatcher.MERGE_MESSAGES,
+                to="rpc",
+                render=False,
+            )
+
+    def __send_tests_output(self, messages, last=False):
+        """
+        Retain tests output and send it to clients
+
+        Args:
+            messages (list|str): message or list of messages
+            last (bool): True if messages end tests run
         """
-        Create new application skel
+        self.__send_output("tests", self.tests_output_event, messages, last)
+
+    def __send_docs_output(self, messages, last=False):
+        """
+        Retain docs output and send it to clients
 
         Args:
-            module_name (string): module name
+            messages (list|str): message or list of messages
+            last (bool): True if messages end docs run
+        """
+        self.__send_output("docs", self.docs_output_event, messages, last)
 
-        Raises:
-            CommandError: if command failed
+    def get_event_stats(self):
         """
-        self.__stop_watcher()
+        Return developer events dispatching statistics
 
-        cmd = self.CLI_NEW_APPLICATION_CMD % (self.CLI, module_name)
-        self.logger.debug("Create app cmd: %s", cmd)
+        Returns:
+            dict: statistics::
 
-        try:
-            console = Console()
-            res = console.command(cmd, 10.0)
-            self.logger.info(
-                "Create app cmd result: %s %s", res["stdout"], res["stderr"]
-            )
-            if res["returncode"] != 0:
-                raise CommandError(
-                    "Error during application creation. Check Cleep logs."
-                )
+                {
+                    events (dict): {
+                        name (str): {
+                            sent (int): number of sent events,
+                            coalesced (int): number of events merged into a pending one,
+                            dropped (int): number of dropped output lines,
+                        },
+                        ...
+                    },
+                    pending (list): names of events waiting for rate limit,
+                    tokens (float): available tokens,
+                }
 
-            # sync new app content
-            console.command(self.CLI_SYNC_MODULE_CMD % module_name)
-        finally:
-            self.__start_watcher()
+        """
+        return self.__dispatcher.get_stats()
 
-    def __cli_check(self, command, error_message, timeout=15.0):
+    def get_output_range(self, job, start=0, count=100):
         """
-        Execute cleep-cli check specified by command
+        Return range of retained output of last tests or docs run
 
         Args:
-            command (str): cli command to execute
-            error_message (str): error message to throw if error occured
-            timeout (float): timeout value
+            job (str): job output to get (tests or docs)
+            start (int): sequence number of first line. Negative value to get last lines
+            count (int): number of lines to return (max 500)
 
         Returns:
-            dict: command output
+            dict: output range::
+
+                {
+                    runid (str): run identifier,
+                    start (int): sequence number of first returned line,
+                    lines (list): list of lines,
+                    first (int): sequence number of first retained line,
+                    total (int): number of lines received since run start,
+                }
+
+        Raises:
+            InvalidParameter: if parameter is invalid
         """
-        console = Console()
-        res = console.command(command, timeout)
-        self.logger.debug(
-            'Cli command "%s" output: %s | %s', command, res["stdout"], res["stderr"]
-        )
-        if res["returncode"] != 0:
-            self.logger.error('Command "%s" failed: %s', command, res)
-            raise CommandError(error_message)
+        if job not in self.__outputs:
+            raise InvalidParameter(
+                f'Parameter "job" must be one of {list(self.__outputs.keys())}'
+            )
+        if not isinstance(start, int):
+            raise InvalidParameter('Parameter "start" must be an integer')
+        if not isinstance(count, int) or count <= 0:
+            raise InvalidParameter('Parameter "count" must be a positive integer')
 
-        try:
-            return json.loads("".join(res["stdout"]))
-        except Exception as error:
-            self.logger.exception('Error parsing command "%s" output', command)
-            raise CommandError(
-                "Error parsing check result. Check Cleep logs"
-            ) from error
+        return self.__outputs[job].get_range(start, min(count, self.OUTPUT_RANGE_MAX))
 
-    def check_application(self, module_name):
+    def resume_output(self, job, run_id=None, last_seq=-1):
         """
-        Check application content
+        Return output missed by a client following tests or docs run
+
+        Client passes last received run identifier and sequence number (from output
+        events) and gets all following messages in one batch, then applies output
+        events whose sequence number is greater than returned one. Output of a
+        different run is returned from its start.
 
         Args:
-            module_name (string): module name
+            job (str): job output to resume (tests or docs)
+            run_id (str): run identifier of last received message. None if unknown
+            last_seq (int): sequence number of last received message
 
         Returns:
-            dict: archive infos::
+            dict: missed output::
 
                 {
-                    url (string): archive url,
-                    name (string): archive name (usually name of module)
+                    runid (str): current run identifier,
+                    start (int): sequence number of first returned line,
+                    lines (list): list of lines,
+                    first (int): sequence number of first retained line,
+                    total (int): number of lines received since run start,
+                    seq (int): sequence number of last returned line,
+                    running (bool): True if job is running,
                 }
 
+        Raises:
+            InvalidParameter: if parameter is invalid
         """
-        # check parameters
-        if module_name is None or len(module_name) == 0:
-            raise MissingParameter('Parameter "module_name" is missing')
-        module_path = os.path.join(
-            self.cleep_path, "modules", module_name, module_name + ".py"
-        )
-        if not os.path.exists(module_path):
-            raise InvalidParameter(f'Module "{module_name}" does not exist')
+        tasks = {"tests": self.__tests_task, "docs": self.__docs_task}
+        if job not in tasks:
+            raise InvalidParameter(
+                f'Parameter "job" must be one of {list(tasks.keys())}'
+            )
+        if not isinstance(last_seq, int):
+            raise InvalidParameter('Parameter "last_seq" must be an integer')
+
+        output = self.__outputs[job]
+        current_run_id = output.run_id
+        start = last_seq + 1 if run_id == current_run_id else 0
+        resumed = output.get_range(max(start, 0))
+        if resumed["start"] > start and current_run_id:
+            # missed lines are no longer in memory, read them from run history
+            history = self.__run_history.get_output(current_run_id, start)
+            if history and history["start"] < resumed["start"]:
+                resumed = history
+
+        resumed["seq"] = resumed["start"] + len(resumed["lines"]) - 1
+        resumed["running"] = tasks[job] is not None
+        return resumed
+
+    def get_runs(self, module_name=None, job=None, limit=20):
+        """
+        Return tests, docs and build runs kept in history, newest first
 
-        # execute checks
-        backend_result = self.__cli_check(
-            self.CLI_CHECK_BACKEND_CMD % (self.CLI, module_name),
-            "Backend source code check failed",
-        )
-        frontend_result = self.__cli_check(
-            self.CLI_CHECK_FRONTEND_CMD % (self.CLI, module_name),
-            "Frontend source code check failed",
-        )
-        scripts_result = self.__cli_check(
-            self.CLI_CHECK_SCRIPTS_CMD % (self.CLI, module_name),
-            "Scripts check failed",
-        )
-        tests_result = self.__cli_check(
-            self.CLI_CHECK_TESTS_CMD % (self.CLI, module_name),
-            "Tests check failed",
-        )
-        # code_result = self.__cli_check(self.CLI_CHECK_CODE_CMD % (self.CLI, module_name))
-        changelog_result = self.__cli_check(
-            self.CLI_CHECK_CHANGELOG_CMD % (self.CLI, module_name),
-            "Changelog check failed",
-        )
-        breaking_changes_result = self.__cli_check(
-            self.CLI_CHECK_BREAKING_CHANGES_CMD % (self.CLI, module_name),
-            "Breaking changes check failed",
-        )
+        Args:
+            module_name (str): return only runs of this module
+            job (str): return only runs of this job (tests, docs or build)
+            limit (int): maximum number of runs (max 100)
 
-        return {
-            "backend": backend_result,
-            "frontend": frontend_result,
-            "scripts": scripts_result,
-            "tests": tests_result,
-            "changelog": changelog_result,
-            "breaking_changes": breaking_changes_result,
-            # 'quality': code_result,
-        }
+        Returns:
+            list: runs::
+
+                [
+                    {
+                        runid (str): run identifier,
+                        job (str): job name,
+                        module (str): module name,
+                        started (float): start timestamp,
+                        ended (float): end timestamp (None if running or interrupted),
+                        status (str): running, succeeded, failed, killed or interrupted,
+                        returncode (int): job return code,
+                        lines (int): number of output lines,
+                        first (int): sequence number of first retained line,
+                        size (int): retained output size (bytes),
+                    },
+                    ...
+                ]
 
-    def build_application(self, module_name):
+        Raises:
+            InvalidParameter: if parameter is invalid
         """
-        Build application archive (zip format)
-        Archive is not protected by password
+        if job is not None and job not in self.RUN_HISTORY_JOBS:
+            raise InvalidParameter(
+                f'Parameter "job" must be one of {list(self.RUN_HISTORY_JOBS)}'
+            )
+        if not isinstance(limit, int) or not 0 < limit <= self.RUN_HISTORY_MAX_RUNS:
+            raise InvalidParameter(
+                f'Parameter "limit" must be between 1 and {self.RUN_HISTORY_MAX_RUNS}'
+            )
+
+        return self.__run_history.get_runs(module_name, job, limit)
+
+    def get_run_output(self, run_id, start=0, count=100):
+        """
+        Return output range of a run kept in history
 
         Args:
-            module_name (string): module name
+            run_id (str): run identifier
+            start (int): sequence number of first line. Negative value to get last lines
+            count (int): number of lines to return (max 500)
+
+        Returns:
+            dict: output range::
+
+                {
+                    runid (str): run identifier,
+                    start (int): sequence number of first returned line,
+                    lines (list): list of lines,
+                    first (int): sequence number of first retained line,
+                    total (int): number of lines of run,
+                    running (bool): True if run is still running,
+                }
 
         Raises:
-            Exception: if build failed
+            MissingParameter: if parameter is missing
+            InvalidParameter: if parameter is invalid
         """
-        cmd = self.CLI_BUILD_APP_CMD % (self.CLI, module_name)
-        self.logger.debug("Build app cmd: %s", cmd)
+        if run_id is None or len(run_id) == 0:
+            raise MissingParameter('Parameter "run_id" is missing')
+        if not isinstance(start, int):
+            raise InvalidParameter('Parameter "start" must be an integer')
+        if not isinstance(count, int) or count <= 0:
+            raise InvalidParameter('Parameter "count" must be a positive integer')
+
+        output = self.__run_history.get_output(
+            run_id, start, min(count, self.OUTPUT_RANGE_MAX)
+        )
+        if output is None:
+            raise InvalidParameter(f'Run "{run_id}" does not exist')
+        return output
 
-        console = Console()
-        res = console.command(cmd, 60.0)
-        self.logger.info("Build app result: %s | %s", res["stdout"], res["stderr"])
-        if res["returncode"] != 0:
-            raise CommandError("Error building application. Check Cleep logs.")
+    def tail_run_output(self, run_id, count=100):
+        """
+        Return last lines of a run kept in history
 
-        try:
-            self.__last_application_build = json.loads(res["stdout"][0])
-        except Exception as error:
-            self.logger.exception('Error parsing app build command "%s" output', cmd)
-            raise CommandError(
-                "Error building application. Check Cleep logs."
-            ) from error
+        Args:
+            run_id (str): run identifier
+            count (int): number of lines to return (max 500)
 
-    def download_application(self):
+        Returns:
+            dict: output range (see get_run_output)
+
+        Raises:
+            MissingParameter: if parameter is missing
+            InvalidParameter: if parameter is invalid
         """
-        Download latest generated application package
+        if not isinstance(count, int) or count <= 0:
+            raise InvalidParameter('Parameter "count" must be a positive integer')
 
-        Returns:
-            dict: archive infos::
+        return self.get_run_output(run_id, -min(count, self.OUTPUT_RANGE_MAX), count)
 
-                {
-                    filepath (string): filepath
-                    filename (string): filename
-                }
+    def cancel_job(self, job):
+        """
+        Cancel running tests or docs job. Job processes and their children are killed
+
+        Args:
+            job (str): job to cancel (tests or docs)
 
+        Raises:
+            InvalidParameter: if parameter is invalid
+            CommandError: if job is not running
         """
-        self.logger.debug("Download application archive")
-        if not self.__last_application_build:
-            raise CommandError("Please build application first")
+        tasks = {"tests": self.__tests_task, "docs": self.__docs_task}
+        if job not in tasks:
+            raise InvalidParameter(
+                f'Parameter "job" must be one of {list(tasks.keys())}'
+            )
+        if not tasks[job]:
+            raise CommandError(f'No "{job}" job is running')
 
-        return {
-            "filepath": self.__last_application_build["package"],
-            "filename": os.path.basename(self.__last_application_build["package"]),
-        }
+        self.logger.info('Cancel "%s" job', job)
+        self.__stop_job(job, tasks[job])
 
     def __tests_callback(self, stdout, stderr):
         """
@@ -463,13 +2192,9 @@ class Developer(CleepModule):
         )
         self.logger.debug('Receive tests cmd message: "%s"', message)
         self.__tests_buffer.append(message)
-        # send every 10 lines to prevent bus from dropping messages
+        # send every 10 lines, dispatcher coalesces chunks when bus is busy
         if len(self.__tests_buffer) % self.BUFFER_SIZE == 0:
-            self.tests_output_event.send(
-                params={"messages": self.__tests_buffer[: self.BUFFER_SIZE]},
-                to="rpc",
-                render=False,
-            )
+            self.__send_tests_output(self.__tests_buffer[: self.BUFFER_SIZE])
             del self.__tests_buffer[: self.BUFFER_SIZE]
 
     def __tests_end_callback(self, return_code, killed):
@@ -485,65 +2210,282 @@ class Developer(CleepModule):
             return_code,
             killed,
         )
-        self.tests_output_event.send(
-            params={"messages": self.__tests_buffer[: self.BUFFER_SIZE]},
-            to="rpc",
-            render=False,
-        )
+        self.__send_tests_output(self.__tests_buffer[: self.BUFFER_SIZE])
         del self.__tests_buffer[: self.BUFFER_SIZE]
         self.__tests_task = None
+        if self.__tests_run:
+            self.__store_tests_run(return_code, killed, *self.__tests_run)
+            self.__tests_run = None
+        self.__write_session.close("tests")
+
+        if self.__tests_profile:
+            self.__send_tests_profile_summary(*self.__tests_profile)
+            self.__tests_profile = None
 
         if return_code == 0:
-            self.tests_output_event.send(
-                params={"messages": "===== Done ====="}, to="rpc", render=False
-            )
+            self.__send_tests_output("===== Done =====", last=True)
         else:
-            self.tests_output_event.send(
-                params={
-                    "messages": f"===== Tests execution crashes (return code: {return_code}) ====="
-                },
-                to="rpc",
-                render=False,
+            self.__send_tests_output(
+                f"===== Tests execution crashes (return code: {return_code}) =====",
+                last=True,
+            )
+        self.__run_history.end(self.__outputs["tests"].run_id, return_code, killed)
+
+    def __store_tests_run(self, return_code, killed, module_name, start_time):
+        """
+        Store coverage and duration of ended tests run
+
+        Args:
+            return_code (int): command return code
+            killed (bool): True if command killed
+            module_name (string): module name
+            start_time (float): tests start timestamp
+        """
+        if killed:
+            return
+
+        report = parse_coverage_report(self.__outputs["tests"].get_range()["lines"])
+        if not report:
+            self.logger.debug("No coverage report found in tests output")
+            return
+
+        try:
+            self.__coverage_store.add_run(
+                module_name,
+                report,
+                time.time() - start_time,
+                return_code,
+                self.__get_module_version(module_name),
+            )
+        except Exception:
+            self.logger.exception('Unable to store tests run of "%s"', module_name)
+
+    def __get_module_version(self, module_name):
+        """
+        Return installed module version
+
+        Args:
+            module_name (string): module name
+
+        Returns:
+            string: module version or None if not found
+        """
+        entry = self.__catalog.get(module_name)
+        return entry["version"] if entry else None
+
+    def get_coverage_trends(self, module_name, limit=20):
+        """
+        Return coverage and duration of last tests runs of specified module
+
+        Args:
+            module_name (string): module name
+            limit (int): maximum number of runs
+
+        Returns:
+            list: runs from oldest to newest::
+
+                [
+                    {
+                        id (int): run id,
+                        version (str): module version,
+                        timestamp (float): run timestamp,
+                        duration (float): tests duration (seconds),
+                        returncode (int): tests command return code,
+                        tests (int): number of tests,
+                        statements (int): number of statements,
+                        missing (int): number of missing statements,
+                        coverage (float): coverage percentage,
+                        coveragedelta (float): coverage delta from previous run,
+                        durationdelta (float): duration delta from previous run,
+                    },
+                    ...
+                ]
+
+        Raises:
+            MissingParameter: if parameter is missing
+            InvalidParameter: if parameter is invalid
+        """
+        if module_name is None or len(module_name) == 0:
+            raise MissingParameter('Parameter "module_name" is missing')
+        if not isinstance(limit, int) or not 0 < limit <= self.COVERAGE_TRENDS_MAX:
+            raise InvalidParameter(
+                f'Parameter "limit" must be between 1 and {self.COVERAGE_TRENDS_MAX}'
             )
 
-    def launch_tests(self, module_name):
+        return self.__coverage_store.get_trends(module_name, limit)
+
+    def get_coverage_deltas(self, module_name, run_id=None, reference_run_id=None):
+        """
+        Return per-file coverage deltas between two tests runs of specified module
+
+        Args:
+            module_name (string): module name
+            run_id (int): run id. Last run if None
+            reference_run_id (int): reference run id. Run preceding run_id if None
+
+        Returns:
+            dict: per-file deltas::
+
+                {
+                    runid (int): run id,
+                    referencerunid (int): reference run id (None if no reference run),
+                    files (dict): {
+                        path (str): {
+                            coverage (float): coverage percentage (None if file removed),
+                            reference (float): reference coverage (None if file added),
+                            delta (float): coverage delta,
+                        },
+                        ...
+                    }
+                }
+
+        Raises:
+            MissingParameter: if parameter is missing
+            CommandError: if no tests run found
+        """
+        if module_name is None or len(module_name) == 0:
+            raise MissingParameter('Parameter "module_name" is missing')
+
+        deltas = self.__coverage_store.get_file_deltas(
+            module_name, run_id, reference_run_id
+        )
+        if deltas is None:
+            raise CommandError(f'No tests run found for module "{module_name}"')
+        return deltas
+
+    def __send_tests_profile_summary(self, module_name, profile_path):
+        """
+        Send hotspots summary of profiled tests run
+
+        Args:
+            module_name (string): module name
+            profile_path (string): raw profile path
+        """
+        try:
+            hotspots = get_hotspots(profile_path, self.PROFILE_HOTSPOTS)
+        except Exception:
+            self.logger.exception('Unable to read tests profile "%s"', profile_path)
+            return
+
+        self.__last_profiles[module_name] = profile_path
+        messages = [f"===== Top {len(hotspots)} hotspots ====="]
+        messages.extend(format_hotspots(hotspots))
+        for index in range(0, len(messages), self.BUFFER_SIZE):
+            self.__send_tests_output(messages[index : index + self.BUFFER_SIZE])
+
+    def launch_tests(self, module_name, profile=False):
         """
         Launch unit tests
 
         Args:
             module_name (string): module name
+            profile (bool): run tests under profiler (without coverage) and send hotspots summary at end
+
+        Raises:
+            InvalidParameter: if module does not exist
         """
+        self.__check_module_name(module_name)
         if self.__tests_task:
             raise CommandError("Tests are already running")
 
-        cmd = self.CLI_TESTS_CMD % (self.CLI, module_name)
+        if profile:
+            profile_path = self.__get_profile_path(module_name, "tests")
+            self.__tests_profile = (module_name, profile_path)
+            cmd = self.CLI_TESTS_PROFILE_CMD % (
+                self.PATH_MODULE_TESTS % {"MODULE_NAME": module_name},
+                profile_path,
+            )
+        else:
+            self.__tests_run = (module_name, time.time())
+            cmd = self.CLI_TESTS_CMD % (self.CLI, module_name)
+            if self.__test_server_task:
+                # pre-warmed runner falls back to cleep-cli if it is not available
+                cmd = self.CLI_TESTS_FAST_CMD % (
+                    self.PATH_TEST_SERVER,
+                    self.PATH_TEST_SERVER_SOCKET,
+                    self.PATH_MODULE_TESTS % {"MODULE_NAME": module_name},
+                    os.path.join(
+                        self.PATH_MODULE_SOURCES % {"MODULE_NAME": module_name},
+                        "backend",
+                    ),
+                    cmd,
+                )
+            cmd = self.__with_coverage_summary(cmd, module_name)
         self.logger.debug("Test cmd: %s", cmd)
-        self.__tests_task = EndlessConsole(
-            cmd, self.__tests_callback, self.__tests_end_callback
-        )
-        self.__tests_task.start()
-        self.tests_output_event.send(
-            params={"messages": "Tests execution started. Please wait..."},
-            to="rpc",
-            render=False,
+        self.__outputs["tests"].new_run(self.__run_history.start("tests", module_name))
+        # tests write coverage data in module directory
+        self.__write_session.open("tests")
+        self.__tests_task = self.__start_endless_command(
+            cmd, self.__tests_callback, self.__tests_end_callback, "tests"
         )
+        self.__send_tests_output("Tests execution started. Please wait...")
 
-    def get_last_coverage_report(self, module_name):
+    def get_last_coverage_report(self, module_name, pattern=None, max_coverage=None):
         """
         Return last coverage report
 
+        Report is read from coverage summary computed at end of last tests run. If no
+        summary exists (tests not run yet), report is computed by cleep-cli and sent
+        in tests output.
+
         Args:
             module_name (string): module name
+            pattern (string): return only files whose path matches this glob pattern
+            max_coverage (float): return only files whose coverage is lower or equal
+
+        Returns:
+            dict: coverage report (None if report is sent in tests output)::
+
+                {
+                    timestamp (float): coverage data timestamp,
+                    files (dict): {
+                        path (string): {
+                            statements (int): number of statements,
+                            missing (int): number of missing statements,
+                            coverage (float): coverage percentage,
+                            missinglines (list): missing lines ranges ([first, last]),
+                        },
+                        ...
+                    },
+                    total (dict): {
+                        statements (int): number of statements,
+                        missing (int): number of missing statements,
+                        coverage (float): coverage percentage,
+                    },
+                }
+
+        Raises:
+            MissingParameter: if module name is missing
+            InvalidParameter: if parameter is invalid
+            CommandError: if tests are running
         """
+        self.__check_module_name(module_name)
+        if pattern is not None and not isinstance(pattern, str):
+            raise InvalidParameter('Parameter "pattern" must be a string')
+        if max_coverage is not None and (
+            not isinstance(max_coverage, (int, float)) or not 0 <= max_coverage <= 100
+        ):
+            raise InvalidParameter('Parameter "max_coverage" must be between 0 and 100')
+
+        # summary of previous run is about to be replaced by running tests
         if self.__tests_task:
             raise CommandError("Tests are running. Please wait end of it")
 
+        summary = read_summary(
+            self.PATH_COVERAGE_SUMMARY % {"MODULE_NAME": module_name}
+        )
+        if summary:
+            return filter_summary(summary, pattern, max_coverage)
+
         cmd = self.CLI_TESTS_COV_CMD % (self.CLI, module_name)
         self.logger.debug("Test cov cmd: %s", cmd)
-        self.__tests_task = EndlessConsole(
-            cmd, self.__tests_callback, self.__tests_end_callback
+        self.__outputs["tests"].new_run(self.__run_history.start("tests", module_name))
+        # tests write coverage data in module directory
+        self.__write_session.open("tests")
+        self.__tests_task = self.__start_endless_command(
+            cmd, self.__tests_callback, self.__tests_end_callback, "tests"
         )
-        self.__tests_task.start()
+        return None
 
     def __docs_callback(self, stdout, stderr):
         """
@@ -558,14 +2500,10 @@ class Developer(CleepModule):
         )
         self.logger.debug('Receive docs cmd message: "%s"', message)
         self.__docs_buffer.append(message)
-        # send every 10 lines to prevent bus from dropping messages
+        # send every 10 lines, dispatcher coalesces chunks when bus is busy
         if len(self.__docs_buffer) % self.BUFFER_SIZE == 0:
             self.logger.debug("Send docs output event")
-            self.docs_output_event.send(
-                params={"messages": self.__docs_buffer[: self.BUFFER_SIZE]},
-                to="rpc",
-                render=False,
-            )
+            self.__send_docs_output(self.__docs_buffer[: self.BUFFER_SIZE])
             del self.__docs_buffer[: self.BUFFER_SIZE]
 
     def __docs_end_callback(self, return_code, killed):
@@ -581,13 +2519,11 @@ class Developer(CleepModule):
             return_code,
             killed,
         )
-        self.docs_output_event.send(
-            params={"messages": self.__docs_buffer[: self.BUFFER_SIZE]},
-            to="rpc",
-            render=False,
-        )
+        self.__send_docs_output(self.__docs_buffer[: self.BUFFER_SIZE], last=True)
         del self.__docs_buffer[: self.BUFFER_SIZE]
         self.__docs_task = None
+        self.__write_session.close("docs")
+        self.__run_history.end(self.__outputs["docs"].run_id, return_code, killed)
 
     def generate_api_documentation(self, module_name):
         """
@@ -595,20 +2531,23 @@ class Developer(CleepModule):
 
         Args:
             module_name (string): module name
+
+        Raises:
+            InvalidParameter: if module does not exist
         """
+        self.__check_module_name(module_name)
         if self.__docs_task:
             raise CommandError("API doc generation is running. Please wait end of it")
 
         cmd = self.CLI_API_DOC_CMD % (self.CLI, module_name)
         self.logger.debug("Doc generation cmd: %s", cmd)
-        self.__docs_task = EndlessConsole(
-            cmd, self.__docs_callback, self.__docs_end_callback
+        self.__outputs["docs"].new_run(self.__run_history.start("docs", module_name))
+        self.__write_session.open("docs")
+        self.__docs_task = self.__start_endless_command(
+            cmd, self.__docs_callback, self.__docs_end_callback, "docs"
         )
-        self.__docs_task.start()
-        self.docs_output_event.send(
-            params={"messages": "API documentation generation started. Please wait..."},
-            to="rpc",
-            render=False,
+        self.__send_docs_output(
+            "API documentation generation started. Please wait..."
         )
 
     def download_api_documentation(self, module_name):
@@ -634,8 +2573,7 @@ class Developer(CleepModule):
 
         cmd = self.CLI_API_DOC_ZIP_PATH_CMD % (self.CLI, module_name)
         self.logger.debug("Doc zip path cmd: %s", cmd)
-        console = Console()
-        res = console.command(cmd)
+        res = self.__run_command(cmd, module_name=module_name)
         if res["returncode"] != 0:
             raise CommandError("".join(res["stdout"]))
 
@@ -643,38 +2581,121 @@ class Developer(CleepModule):
         self.logger.debug('Module "%s" docs path "%s"', module_name, zip_path)
         return {"filepath": zip_path, "filename": os.path.basename(zip_path)}
 
-    def generate_documentation(self, module_name):
+    def __get_module_source_hash(self, module_name):
         """
-        Generate documentation of specified module
+        Return hash of module sources (based on files path, size and modification time)
 
         Args:
             module_name (str): module name
 
         Returns:
-            dict: documentation and check results
+            str: module sources hash
+        """
+        entry = self.__catalog.get(module_name)
+        return entry["hash"] if entry else hashlib.sha1().hexdigest()
 
+    def __read_doc_cache(self, module_name):
         """
-        console = Console()
+        Read cached documentation of specified module
+
+        Args:
+            module_name (str): module name
+
+        Returns:
+            dict: cached documentation or None if not cached
+        """
+        path = os.path.join(self.PATH_DOC_CACHE, f"{module_name}.json")
+        try:
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as fd:
+                    return json.load(fd)
+        except Exception:
+            self.logger.exception('Unable to read cached doc "%s"', path)
+        return None
 
-        cmd = self.CLI_DOC_CMD % (self.CLI, module_name)
-        doc = console.command(cmd)
-        self.logger.debug("Doc cmd %s response: %s", cmd, doc)
-        doc_output = "".join(doc["stdout"])
-        if doc["returncode"] != 0:
-            self.logger.error("Unable to generate doc: %s", doc_output)
-            raise CommandError("Unable to generate doc")
+    def __write_doc_cache(self, module_name, documentation):
+        """
+        Write documentation of specified module to cache
+
+        Args:
+            module_name (str): module name
+            documentation (dict): documentation to cache
+        """
+        path = os.path.join(self.PATH_DOC_CACHE, f"{module_name}.json")
+        try:
+            os.makedirs(self.PATH_DOC_CACHE, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as fd:
+                json.dump(documentation, fd)
+        except Exception:
+            self.logger.exception('Unable to write cached doc "%s"', path)
+
+    def __render_documentation(self, module_name, etag):
+        """
+        Generate and render documentation of specified module
+
+        Args:
+            module_name (str): module name
+            etag (str): documentation etag
 
-        cmd = self.CLI_CHECK_DOC_CMD % (self.CLI, module_name)
-        check = console.command(cmd)
+        Returns:
+            dict: rendered documentation (see generate_documentation)
+        """
+        with self.__write_session.session():
+            cmd = self.CLI_DOC_CMD % (self.CLI, module_name)
+            doc = self.__run_command(cmd, module_name=module_name)
+            self.logger.debug("Doc cmd %s response: %s", cmd, doc)
+            doc_output = "".join(doc["stdout"])
+            if doc["returncode"] != 0:
+                self.logger.error("Unable to generate doc: %s", doc_output)
+                raise CommandError("Unable to generate doc")
+
+            cmd = self.CLI_CHECK_DOC_CMD % (self.CLI, module_name)
+            check = self.__run_command(cmd, module_name=module_name)
         self.logger.debug("Check doc cmd %s response: %s", cmd, check)
         check_output = "".join(check["stdout"])
 
         return {
             "valid": check["returncode"] == 0,
-            "doc": json.loads(doc_output),
-            "check": json.loads(check_output),
+            "etag": etag,
+            "html": self.__doc_renderer.render(
+                json.loads(doc_output), json.loads(check_output)
+            ),
         }
 
+    def generate_documentation(self, module_name, etag=None):
+        """
+        Generate documentation of specified module
+
+        Rendered documentation is cached until module sources change.
+
+        Args:
+            module_name (str): module name
+            etag (str): etag of documentation already displayed by client
+
+        Returns:
+            dict: documentation::
+
+                {
+                    valid (bool): True if documentation is valid,
+                    etag (str): documentation etag,
+                    html (str): rendered documentation, None if it is the same as specified etag
+                }
+
+        Raises:
+            InvalidParameter: if module does not exist
+        """
+        self.__check_module_name(module_name)
+        source_hash = self.__get_module_source_hash(module_name)
+        source_etag = f"{source_hash}-{DocRenderer.VERSION}"
+        documentation = self.__read_doc_cache(module_name)
+        if not documentation or documentation.get("etag") != source_etag:
+            documentation = self.__render_documentation(module_name, source_etag)
+            self.__write_doc_cache(module_name, documentation)
+
+        if etag is not None and etag == documentation["etag"]:
+            return {"valid": documentation["valid"], "etag": etag, "html": None}
+        return documentation
+
     def detect_breaking_changes(self, module_name):
         """
         Compute and return breaking changes
@@ -691,11 +2712,12 @@ class Developer(CleepModule):
                     breaking_changes (bool): True if breaking changes detected,
                 }
 
+        Raises:
+            InvalidParameter: if module does not exist
         """
-        console = Console()
-
+        self.__check_module_name(module_name)
         cmd = self.CLI_CHECK_BREAKING_CHANGES_CMD % (self.CLI, module_name)
-        breaking = console.command(cmd, 20.0)
+        breaking = self.__run_command(cmd, module_name=module_name)
         self.logger.debug("Breaking changes cmd %s response: %s", cmd, breaking)
         breaking_output = "".join(breaking["stdout"])
         breaking_json = json.loads(breaking_output)
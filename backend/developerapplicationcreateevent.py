@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from cleep.libs.internals.event import Event
+
+
+class DeveloperApplicationCreateEvent(Event):
+    """
+    developer.application.create event
+    """
+
+    EVENT_NAME = "developer.application.create"
+    EVENT_PROPAGATE = False
+    EVENT_PARAMS = ["module", "step", "progress", "error"]
+
+    def __init__(self, params):
+        """
+        Constructor
+
+        Args:
+            params (dict): event parameters
+        """
+        Event.__init__(self, params)
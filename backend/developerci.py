@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Headless developer pipeline for CI
+
+It runs check, tests, doc and build steps of one or several applications on a Cleep device
+(or a local device stand-in) in a single non-interactive call, prints machine-readable
+JSON report and exits with:
+
+    - 0: all steps succeeded for all applications
+    - 1: at least one step failed
+    - 2: pipeline could not be executed (connection error, invalid parameters...)
+
+Usage:
+    python3 developerci.py --module mymodule [--module other] [--step check --step build]
+                           [--url http://127.0.0.1] [--no-cache] [--timeout 1800]
+"""
+
+import sys
+import json
+import argparse
+import requests
+
+STEPS = ["check", "tests", "doc", "build"]
+
+
+def run_pipeline(url, module_names, steps, use_cache, timeout, auth=None):
+    """
+    Execute developer run_pipeline command
+
+    Args:
+        url (str): Cleep url
+        module_names (list): list of module names
+        steps (list): steps to run
+        use_cache (bool): reuse cached check results
+        timeout (float): command timeout in seconds
+        auth (tuple): (user, password) basic auth or None
+
+    Returns:
+        dict: Cleep command response::
+
+            {
+                error (bool): True if command failed,
+                message (str): error message,
+                data (dict): pipeline report,
+            }
+
+    """
+    response = requests.post(
+        f"{url.rstrip('/')}/command",
+        json={
+            "command": "run_pipeline",
+            "to": "developer",
+            "params": {
+                "module_names": module_names,
+                "steps": steps,
+                "use_cache": use_cache,
+            },
+            "timeout": timeout,
+        },
+        timeout=timeout + 10.0,
+        auth=auth,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def main(argv=None):
+    """
+    CI entry point
+
+    Args:
+        argv (list): command line arguments
+
+    Returns:
+        int: exit code
+    """
+    parser = argparse.ArgumentParser(description="Cleep developer headless pipeline")
+    parser.add_argument("--url", default="http://127.0.0.1", help="Cleep url")
+    parser.add_argument("--module", action="append", dest="modules", required=True)
+    parser.add_argument("--step", action="append", dest="steps", choices=STEPS)
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Do not reuse cached checks"
+    )
+    parser.add_argument("--timeout", type=float, default=1800.0)
+    parser.add_argument("--user", help="Basic auth user")
+    parser.add_argument("--password", help="Basic auth password")
+    args = parser.parse_args(argv)
+
+    auth = (args.user, args.password) if args.user else None
+    try:
+        response = run_pipeline(
+            args.url,
+            args.modules,
+            args.steps or STEPS,
+            not args.no_cache,
+            args.timeout,
+            auth,
+        )
+    except Exception as error:
+        print(json.dumps({"error": True, "message": str(error), "data": None}))
+        return 2
+
+    print(json.dumps(response, indent=2))
+    if response.get("error"):
+        return 2
+    return 0 if response["data"]["success"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from cleep.libs.internals.event import Event
+
+
+class DeveloperFrontendAssetsEvent(Event):
+    """
+    developer.frontend.assets event
+    """
+
+    EVENT_NAME = "developer.frontend.assets"
+    EVENT_PROPAGATE = False
+    EVENT_PARAMS = ["module", "files"]
+
+    def __init__(self, params):
+        """
+        Constructor
+        Args:
+            params (dict): event parameters
+        """
+        Event.__init__(self, params)
@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from cleep.libs.internals.event import Event
+
+
+class DeveloperPerformanceStatsEvent(Event):
+    """
+    developer.performance.stats event
+    """
+
+    EVENT_NAME = "developer.performance.stats"
+    EVENT_PROPAGATE = False
+    EVENT_PARAMS = ["stats"]
+
+    def __init__(self, params):
+        """
+        Constructor
+
+        Args:
+            params (dict): event parameters
+        """
+        Event.__init__(self, params)
@@ -11,7 +11,7 @@ class DeveloperTestsOutputEvent(Event):
 
     EVENT_NAME = "developer.tests.output"
     EVENT_PROPAGATE = False
-    EVENT_PARAMS = ["messages"]
+    EVENT_PARAMS = ["messages", "runid", "seq"]
 
     def __init__(self, params):
         """
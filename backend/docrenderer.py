@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from html import escape
+
+
+class DocRenderer:
+    """
+    Render module documentation (output of moddoc and modcheckdoc cli commands) to html
+    """
+
+    # bump when rendered html changes to invalidate cached documentations
+    VERSION = 1
+
+    def render(self, doc, check):
+        """
+        Render documentation
+
+        Args:
+            doc (dict): documentation by command name
+            check (dict): documentation check (errors and warnings) by command name
+
+        Returns:
+            str: html documentation
+        """
+        parts = ["<ul>"]
+        for (fn_name, data) in doc.items():
+            parts.append(
+                f'<li class="doc-function"><span>Command {escape(fn_name)}</span><ul>'
+            )
+
+            fn_check = check.get(fn_name) or {}
+            parts.append(
+                self.__render_messages("Errors", "doc-errors", fn_check.get("errors"))
+            )
+            parts.append(
+                self.__render_messages(
+                    "Warnings", "doc-warns", fn_check.get("warnings")
+                )
+            )
+            parts.append(self.__render_args(data.get("args")))
+            parts.append(self.__render_returns(data.get("returns")))
+            parts.append(self.__render_raises(data.get("raises")))
+
+            parts.append("</ul></li>")
+        parts.append("</ul>")
+
+        return "".join(parts)
+
+    @staticmethod
+    def __text(value):
+        return escape(str(value), quote=False)
+
+    def __render_messages(self, title, css_class, messages):
+        if not messages:
+            return ""
+
+        items = "".join(f"<li>{self.__text(message)}</li>" for message in messages)
+        return f'<li><span>{title}:</span><ul class="{css_class}">{items}</ul></li>'
+
+    def __render_formats(self, formats):
+        if not formats:
+            return ""
+
+        items = "".join(f"<li>{self.__text(format_)}</li>" for format_ in formats)
+        return f"<li><span>Formats</span>:<ul>{items}</ul></li>"
+
+    def __render_args(self, args):
+        if not args:
+            return ""
+
+        parts = ["<li><span>Args</span><ul>"]
+        for arg in args:
+            parts.append(
+                f"<li><span>{self.__text(arg.get('name'))}</span>"
+                f"<ul><li>Type: {self.__text(arg.get('type'))}</li>"
+            )
+            if arg.get("optional"):
+                parts.append("<li>Optional: true</li>")
+            if arg.get("default") is not None:
+                parts.append(f"<li>default: {self.__text(arg['default'])}</li>")
+            parts.append(f"<li>Description: {self.__text(arg.get('description'))}</li>")
+            parts.append(self.__render_formats(arg.get("formats")))
+            parts.append("</ul></li>")
+        parts.append("</ul></li>")
+
+        return "".join(parts)
+
+    def __render_returns(self, returns):
+        if not returns:
+            return ""
+
+        parts = ["<li><span>Returns</span><ul>"]
+        for ret in returns:
+            parts.append(f"<li><span>{self.__text(ret.get('type'))}</span><ul>")
+            parts.append(f"<li>Description: {self.__text(ret.get('description'))}</li>")
+            parts.append(self.__render_formats(ret.get("formats")))
+            parts.append("</ul></li>")
+        parts.append("</ul></li>")
+
+        return "".join(parts)
+
+    def __render_raises(self, raises):
+        if not raises:
+            return ""
+
+        parts = ["<li><span>Raises</span><ul>"]
+        for raise_ in raises:
+            parts.append(
+                f"<li><span>{self.__text(raise_.get('type'))}</span>"
+                f"<ul><li>Description: {self.__text(raise_.get('description'))}</li>"
+                "</ul></li>"
+            )
+        parts.append("</ul></li>")
+
+        return "".join(parts)
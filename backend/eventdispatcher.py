@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+
+
+class EventDispatcher:
+    """
+    Rate limited events dispatcher
+
+    Low priority events (outputs, stats) are sent immediately while tokens are available
+    (token bucket), otherwise they are coalesced by name and sent by a background worker
+    at bucket rate. High priority events (restart, end of run...) are never rate limited
+    nor queued: pending low priority events they depend on are flushed first to keep
+    order.
+    """
+
+    LOW = 0
+    HIGH = 1
+
+    MERGE_REPLACE = "replace"
+    MERGE_MESSAGES = "messages"
+
+    def __init__(self, rate=10.0, burst=20, max_pending_messages=500, logger=None):
+        """
+        Constructor
+
+        Args:
+            rate (float): number of low priority events sent per second
+            burst (int): number of low priority events that can be sent at once
+            max_pending_messages (int): maximum number of messages kept in a coalesced
+                event. Oldest messages are dropped
+            logger (Logger): logger instance
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_pending_messages = max_pending_messages
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.__lock = threading.RLock()
+        self.__tokens = float(burst)
+        self.__last_refill = time.monotonic()
+        self.__pending = OrderedDict()
+        self.__worker = None
+        self.__stats = {}
+
+    def __get_stats(self, name):
+        if name not in self.__stats:
+            self.__stats[name] = {"sent": 0, "coalesced": 0, "dropped": 0}
+        return self.__stats[name]
+
+    def __refill(self):
+        now = time.monotonic()
+        self.__tokens = min(
+            float(self.burst), self.__tokens + (now - self.__last_refill) * self.rate
+        )
+        self.__last_refill = now
+
+    def __send(self, name, entry):
+        event, params, send_kwargs = entry
+        stats = self.__get_stats(name)
+        try:
+            if params is None:
+                event.send(**send_kwargs)
+            else:
+                event.send(params=params, **send_kwargs)
+            stats["sent"] += 1
+        except Exception:
+            self.logger.exception('Unable to send event "%s"', name)
+
+    def __merge(self, name, pending, params, merge):
+        stats = self.__get_stats(name)
+        stats["coalesced"] += 1
+        if merge != self.MERGE_MESSAGES:
+            return params
+
+        messages = self.__to_list(pending.get("messages")) + self.__to_list(
+            params.get("messages")
+        )
+        overflow = len(messages) - self.max_pending_messages
+        if overflow > 0:
+            stats["dropped"] += overflow
+            messages = messages[overflow:]
+        return dict(params, messages=messages)
+
+    @staticmethod
+    def __to_list(messages):
+        if messages is None:
+            return []
+        if isinstance(messages, list):
+            return messages
+        return [messages]
+
+    def dispatch(
+        self,
+        name,
+        event,
+        params=None,
+        priority=LOW,
+        merge=MERGE_REPLACE,
+        flush=None,
+        **send_kwargs,
+    ):
+        """
+        Dispatch event
+
+        Args:
+            name (str): event name (used to coalesce events and in statistics)
+            event (Event): event instance
+            params (dict): event parameters
+            priority (int): LOW or HIGH
+            merge (str): how low priority events are coalesced: MERGE_REPLACE keeps
+                latest params, MERGE_MESSAGES concatenates "messages" param
+            flush (list): names of pending events to send before high priority event
+            send_kwargs (dict): event send method parameters
+        """
+        with self.__lock:
+            if priority == self.HIGH:
+                for flushed_name in flush or []:
+                    if flushed_name in self.__pending:
+                        self.__send(flushed_name, self.__pending.pop(flushed_name))
+                self.__send(name, (event, params, send_kwargs))
+                return
+
+            self.__refill()
+            if name in self.__pending:
+                # keep order: event is sent after already pending ones
+                pending_params = self.__pending[name][1]
+                self.__pending[name] = (
+                    event,
+                    self.__merge(name, pending_params, params, merge),
+                    send_kwargs,
+                )
+            elif self.__tokens >= 1.0:
+                self.__tokens -= 1.0
+                self.__send(name, (event, params, send_kwargs))
+                return
+            else:
+                if merge == self.MERGE_MESSAGES:
+                    messages = self.__to_list(params.get("messages"))
+                    params = dict(params, messages=messages)
+                self.__pending[name] = (event, params, send_kwargs)
+
+            if self.__worker is None:
+                self.__worker = threading.Thread(target=self.__run, daemon=True)
+                self.__worker.start()
+
+    def __run(self):
+        """
+        Send pending events at bucket rate
+        """
+        while True:
+            with self.__lock:
+                if not self.__pending:
+                    self.__worker = None
+                    return
+                self.__refill()
+                if self.__tokens >= 1.0:
+                    self.__tokens -= 1.0
+                    name, entry = self.__pending.popitem(last=False)
+                    self.__send(name, entry)
+                    continue
+                wait = (1.0 - self.__tokens) / self.rate
+            time.sleep(wait)
+
+    def flush(self):
+        """
+        Send all pending events immediately
+        """
+        with self.__lock:
+            while self.__pending:
+                name, entry = self.__pending.popitem(last=False)
+                self.__send(name, entry)
+
+    def get_stats(self):
+        """
+        Return dispatcher statistics
+
+        Returns:
+            dict: statistics::
+
+                {
+                    events (dict): {
+                        name (str): {
+                            sent (int): number of sent events,
+                            coalesced (int): number of events merged into a pending one,
+                            dropped (int): number of dropped messages,
+                        },
+                        ...
+                    },
+                    pending (list): names of pending events,
+                    tokens (float): available tokens,
+                }
+
+        """
+        with self.__lock:
+            self.__refill()
+            return {
+                "events": {name: dict(stats) for (name, stats) in self.__stats.items()},
+                "pending": list(self.__pending.keys()),
+                "tokens": round(self.__tokens, 2),
+            }
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import logging
+import threading
+
+
+class FrontendAssets:
+    """
+    Debounced frontend changes notifier
+
+    Successive change notifications (cleep-cli watcher sends one per synced file) are
+    coalesced during a quiet period. When quiet period ends, callback is called once with
+    all frontend files changed since previous notification (detected comparing files
+    snapshots) and a flag telling if frontend must be fully reloaded or if changed assets
+    can be hot-swapped.
+    """
+
+    # assets that can be replaced without reloading frontend
+    HOT_SWAPPABLE_EXTENSIONS = (".css", ".png", ".jpg", ".jpeg", ".gif", ".svg")
+
+    def __init__(self, quiet_period, callback, logger=None):
+        """
+        Constructor
+
+        Args:
+            quiet_period (float): quiet period (seconds). 0 disables debounce
+            callback (function): function called with changed files list and reload flag
+            logger (Logger): logger instance
+        """
+        self.quiet_period = quiet_period
+        self.callback = callback
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.__lock = threading.Lock()
+        self.__timer = None
+        self.__path = None
+        self.__snapshot = {}
+        self.__files = set()
+        self.__unknown = False
+        self.__stats = {"notifications": 0, "sent": 0}
+
+    def __take_snapshot(self):
+        snapshot = {}
+        if not self.__path or not os.path.isdir(self.__path):
+            return snapshot
+        for (root, _, filenames) in os.walk(self.__path):
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    # file removed meanwhile
+                    continue
+                relative_path = os.path.relpath(path, self.__path)
+                snapshot[relative_path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def track(self, path):
+        """
+        Track changes of specified frontend directory
+
+        Args:
+            path (str): frontend directory path. None to stop tracking
+        """
+        with self.__lock:
+            self.__path = path
+            self.__snapshot = self.__take_snapshot()
+
+    def notify(self, files=None):
+        """
+        Notify frontend changes. Callback is called when no notification is received
+        during quiet period
+
+        Args:
+            files (list): changed files (relative to frontend directory) if known
+        """
+        with self.__lock:
+            self.__stats["notifications"] += 1
+            if files:
+                self.__files.update(files)
+            elif self.__path is None:
+                # changes can't be detected
+                self.__unknown = True
+            if self.__timer:
+                self.__timer.cancel()
+                self.__timer = None
+            if self.quiet_period > 0:
+                self.__timer = threading.Timer(self.quiet_period, self.flush)
+                self.__timer.daemon = True
+                self.__timer.start()
+                return
+
+        self.flush()
+
+    def flush(self):
+        """
+        Call callback immediately with pending changes
+        """
+        with self.__lock:
+            if self.__timer:
+                self.__timer.cancel()
+                self.__timer = None
+            snapshot = self.__take_snapshot()
+            changed = {
+                path
+                for (path, entry) in snapshot.items()
+                if self.__snapshot.get(path) != entry
+            }
+            removed = set(self.__snapshot) - set(snapshot)
+            self.__snapshot = snapshot
+            files = sorted(self.__files | changed | removed)
+            reload = (
+                self.__unknown
+                or not files
+                or bool(removed)
+                or not all(self.is_hot_swappable(path) for path in files)
+            )
+            self.__files = set()
+            self.__unknown = False
+            self.__stats["sent"] += 1
+
+        self.logger.debug("Frontend changes: files=%s reload=%s", files, reload)
+        self.callback(files, reload)
+
+    def cancel(self):
+        """
+        Drop pending changes
+        """
+        with self.__lock:
+            if self.__timer:
+                self.__timer.cancel()
+                self.__timer = None
+            self.__files = set()
+            self.__unknown = False
+
+    @classmethod
+    def is_hot_swappable(cls, path):
+        """
+        Return True if asset can be replaced without reloading frontend
+
+        Args:
+            path (str): file path
+
+        Returns:
+            bool: True if file is hot-swappable
+        """
+        return path.lower().endswith(cls.HOT_SWAPPABLE_EXTENSIONS)
+
+    def get_stats(self):
+        """
+        Return notifier statistics
+
+        Returns:
+            dict: statistics::
+
+                {
+                    notifications (int): number of received notifications,
+                    sent (int): number of callback calls,
+                    pending (bool): True if changes are waiting for quiet period end,
+                }
+
+        """
+        with self.__lock:
+            return dict(self.__stats, pending=self.__timer is not None)
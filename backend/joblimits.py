@@ -0,0 +1,404 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import glob
+import json
+import time
+import uuid
+import shlex
+import signal
+import argparse
+import threading
+import subprocess
+
+JOBS_PATH = "/run/cleep/developer/jobs"
+JOB_MARKER = "joblimits.py --job"
+KILL_GRACE = 2.0
+WALL_TIME_RETURN_CODE = 124
+POLL_INTERVAL = 0.2
+
+
+def limit_command(command, nice=None, memory=None):
+    """
+    Return shell command applying limits to specified command
+
+    Limits are applied by the shell spawned for the command (ulimit builtin and nice),
+    never in calling process: a preexec function is unsafe in a threaded process.
+
+    Args:
+        command (str): shell command
+        nice (int): niceness increment
+        memory (int): maximum data segment size (bytes)
+
+    Returns:
+        str: limited shell command (command itself if there is no limit)
+    """
+    if not nice and not memory:
+        return command
+
+    args = []
+    if memory:
+        args.append(f"ulimit -d {memory // 1024} &&")
+    args.append("exec")
+    if nice:
+        args += ["nice", "-n", str(nice)]
+    args += ["/bin/sh", "-c", shlex.quote(command)]
+    return " ".join(args)
+
+
+def wrap_command(
+    command, job, nice=None, memory=None, wall_time=None, usage_path=None
+):
+    """
+    Wrap shell command to run it as a limited job: command is executed in its own
+    process group with specified niceness and memory limit, and the whole group is
+    killed when wall time is reached or when job is killed (see kill_job)
+
+    Args:
+        command (str): shell command
+        job (str): job name
+        nice (int): niceness increment
+        memory (int): maximum data segment size (bytes)
+        wall_time (float): maximum job duration (seconds)
+        usage_path (str): file the job resource usage is written to (see read_usage)
+
+    Returns:
+        str: wrapped shell command
+    """
+    args = ["exec", sys.executable, os.path.abspath(__file__), "--job", job]
+    if nice:
+        args += ["--nice", str(nice)]
+    if memory:
+        args += ["--memory", str(memory)]
+    if wall_time:
+        args += ["--wall-time", str(wall_time)]
+    if usage_path:
+        args += ["--usage-file", usage_path]
+    args += ["--", command]
+    return " ".join(
+        shlex.quote(arg) if index else arg for (index, arg) in enumerate(args)
+    )
+
+
+def get_usage(rusage):
+    """
+    Return resource usage of a process and its descendants
+
+    Args:
+        rusage (struct_rusage): resource usage returned by os.wait4
+
+    Returns:
+        dict: resource usage::
+
+            {
+                cputime (float): user and system cpu time (seconds),
+                maxrss (int): peak resident memory of biggest process (KB),
+            }
+
+    """
+    return {
+        "cputime": round(rusage.ru_utime + rusage.ru_stime, 3),
+        "maxrss": rusage.ru_maxrss,
+    }
+
+
+def new_usage_path(job):
+    """
+    Return new file path a job wrapper can write its resource usage to
+
+    Args:
+        job (str): job name
+
+    Returns:
+        str: usage file path
+    """
+    return os.path.join(JOBS_PATH, f"{job}.{uuid.uuid4().hex}.usage")
+
+
+def read_usage(path):
+    """
+    Read and remove resource usage written by job wrapper
+
+    Args:
+        path (str): usage file path
+
+    Returns:
+        dict: resource usage (see get_usage) or None if not available
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as fd:
+            usage = json.load(fd)
+        os.remove(path)
+        return usage
+    except (OSError, ValueError):
+        return None
+
+
+def _get_pgid_path(job, pid):
+    return os.path.join(JOBS_PATH, f"{job}.{pid}.pgid")
+
+
+def _get_jobs_path():
+    """
+    Create jobs directory and check nobody else can write in it
+
+    Returns:
+        str: jobs directory
+
+    Raises:
+        OSError: if directory can't be created or is not private
+    """
+    os.makedirs(JOBS_PATH, mode=0o700, exist_ok=True)
+    stat = os.lstat(JOBS_PATH)
+    if (
+        not os.path.isdir(JOBS_PATH)
+        or os.path.islink(JOBS_PATH)
+        or stat.st_uid != os.geteuid()
+        or stat.st_mode & 0o077
+    ):
+        raise OSError(f"Jobs directory {JOBS_PATH} is not private")
+    return JOBS_PATH
+
+
+def _read_stat(pid):
+    """
+    Read process stat fields following command name
+
+    Args:
+        pid (int): process id
+
+    Returns:
+        list: stat fields starting at state (field 3) or None if process does not exist
+    """
+    try:
+        with open(f"/proc/{pid}/stat", "r", encoding="utf-8") as fd:
+            stat = fd.read()
+    except OSError:
+        return None
+    return stat[stat.rindex(")") + 2 :].split()
+
+
+def _get_start_time(pid):
+    stat = _read_stat(pid)
+    return stat[19] if stat else None
+
+
+def _is_running(pid):
+    stat = _read_stat(pid)
+    # ended process not reaped yet by its parent is a zombie
+    return stat is not None and stat[0] != "Z"
+
+
+def _is_job_group(pgid, start_time):
+    """
+    Check process group recorded by job wrapper is still the job one
+
+    Group id can't be reused while group has members, so group is the job one if its
+    leader has recorded start time or if leader ended (remaining members are the job
+    ones).
+
+    Args:
+        pgid (int): process group id
+        start_time (str): group leader start time recorded by job wrapper
+
+    Returns:
+        bool: True if group can be killed
+    """
+    stat = _read_stat(pgid)
+    if stat is None:
+        return True
+    return stat[2] == str(pgid) and stat[19] == start_time
+
+
+def _kill_group(pgid, sig):
+    try:
+        os.killpg(pgid, sig)
+    except OSError:
+        # group already ended
+        pass
+
+
+def kill_job(job, grace=KILL_GRACE):
+    """
+    Kill all running instances of specified job and their process groups
+
+    Job wrappers are asked to terminate (SIGTERM) so they stop their process group
+    gracefully, then remaining processes are killed (SIGKILL), including process groups
+    whose wrapper was already killed.
+
+    Args:
+        job (str): job name
+        grace (float): time to wait before killing remaining processes (seconds)
+
+    Returns:
+        list: killed job wrappers pids
+    """
+    # lazy import: this file is also executed as standalone job wrapper
+    from .processtree import (  # pylint: disable=import-outside-toplevel
+        find_processes,
+        kill_tree,
+    )
+
+    pids = find_processes(f"{JOB_MARKER} {job} ")
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            # job already ended
+            pass
+
+    deadline = time.monotonic() + grace
+    running = [pid for pid in pids if _is_running(pid)]
+    while running and time.monotonic() < deadline:
+        time.sleep(0.05)
+        running = [pid for pid in running if _is_running(pid)]
+    if running:
+        kill_tree(running)
+
+    try:
+        _get_jobs_path()
+    except OSError:
+        # never trust process groups recorded in a directory others can write in
+        return pids
+    for path in glob.glob(_get_pgid_path(job, "*")):
+        try:
+            with open(path, "r", encoding="utf-8") as fd:
+                pgid, start_time = fd.read().split()
+            # wrapper killed without cleaning up: group id may have been reused
+            if _is_job_group(int(pgid), start_time):
+                _kill_group(int(pgid), signal.SIGKILL)
+            os.remove(path)
+        except (OSError, ValueError):
+            # job wrapper cleaned up meanwhile
+            pass
+
+    return pids
+
+
+def run(
+    command,
+    job,
+    nice=None,
+    memory=None,
+    wall_time=None,
+    grace=KILL_GRACE,
+    usage_path=None,
+):
+    """
+    Run command as limited job (job wrapper entry point)
+
+    Args:
+        command (str): shell command
+        job (str): job name
+        nice (int): niceness increment
+        memory (int): maximum data segment size (bytes)
+        wall_time (float): maximum job duration (seconds)
+        grace (float): time to wait after SIGTERM before killing process group
+        usage_path (str): file to write command resource usage to
+
+    Returns:
+        int: command return code
+    """
+    process = subprocess.Popen(  # pylint: disable=consider-using-with
+        ["/bin/sh", "-c", limit_command(command, nice, memory)],
+        start_new_session=True,
+    )
+    pgid_path = _get_pgid_path(job, os.getpid())
+    try:
+        _get_jobs_path()
+        with open(pgid_path, "w", encoding="utf-8") as fd:
+            fd.write(f"{process.pid} {_get_start_time(process.pid)}")
+    except OSError:
+        pgid_path = None
+
+    deadline = time.monotonic() + wall_time if wall_time else None
+    state = {"signum": None, "timedout": False, "killat": None}
+
+    def terminate():
+        _kill_group(process.pid, signal.SIGTERM)
+        state["killat"] = time.monotonic() + grace
+
+    def on_signal(signum, _):
+        state["signum"] = signum
+        terminate()
+
+    handlers = {
+        signum: signal.signal(signum, on_signal)
+        for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP)
+    }
+
+    # command is reaped with wait4 to get its own resource usage
+    ended = threading.Event()
+    reaped = {}
+
+    def reap():
+        _, status, rusage = os.wait4(process.pid, 0)
+        reaped["returncode"] = os.waitstatus_to_exitcode(status)
+        reaped["usage"] = get_usage(rusage)
+        ended.set()
+
+    threading.Thread(target=reap, daemon=True).start()
+
+    try:
+        while not ended.wait(POLL_INTERVAL):
+            now = time.monotonic()
+            if state["killat"] is not None:
+                if now >= state["killat"]:
+                    _kill_group(process.pid, signal.SIGKILL)
+            elif deadline is not None and now >= deadline:
+                sys.stderr.write(
+                    f"Job {job} killed: wall time of {wall_time}s exceeded\n"
+                )
+                state["timedout"] = True
+                terminate()
+
+        process.returncode = returncode = reaped["returncode"]
+
+        # kill processes left in background by command
+        _kill_group(process.pid, signal.SIGKILL)
+    finally:
+        for (signum, handler) in handlers.items():
+            signal.signal(signum, handler)
+        if pgid_path:
+            try:
+                os.remove(pgid_path)
+            except OSError:
+                pass
+
+    if usage_path:
+        try:
+            with open(usage_path, "w", encoding="utf-8") as fd:
+                json.dump(reaped["usage"], fd)
+        except OSError:
+            pass
+
+    if state["timedout"]:
+        return WALL_TIME_RETURN_CODE
+    if state["signum"]:
+        return 128 + state["signum"]
+    return returncode if returncode >= 0 else 128 - returncode
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run command as limited job")
+    parser.add_argument("--job", required=True)
+    parser.add_argument("--nice", type=int)
+    parser.add_argument("--memory", type=int)
+    parser.add_argument("--wall-time", type=float)
+    parser.add_argument("--grace", type=float, default=KILL_GRACE)
+    parser.add_argument("--usage-file")
+    parser.add_argument("command")
+    args = parser.parse_args()
+    sys.exit(
+        run(
+            args.command,
+            args.job,
+            nice=args.nice,
+            memory=args.memory,
+            wall_time=args.wall_time,
+            grace=args.grace,
+            usage_path=args.usage_file,
+        )
+    )
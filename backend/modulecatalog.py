@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import time
+import hashlib
+import threading
+
+MODULE_VERSION_PATTERN = re.compile(
+    r"^\s*MODULE_VERSION\s*=\s*[\"']([^\"']+)[\"']", re.M
+)
+
+
+class ModuleCatalog:
+    """
+    Memoized catalog of installed modules metadata
+
+    Module entry (file list, size, version, sources hash) is built once. Watcher
+    notifications, module sync and frontend restart drop entry of module in development
+    so it is rebuilt on next lookup. Lookup only stats module directory and main file:
+    entry is rebuilt if they changed (file added or removed at module root, main file
+    edited), other changes rely on invalidation. Unknown modules are not memoized: a
+    module installed later is found on next lookup.
+    """
+
+    IGNORED_DIRS = ("__pycache__",)
+
+    def __init__(self, modules_path):
+        """
+        Constructor
+
+        Args:
+            modules_path (str): installed modules directory
+        """
+        self.modules_path = modules_path
+        self.__lock = threading.Lock()
+        self.__entries = {}
+        self.__signatures = {}
+
+    @staticmethod
+    def __get_signature(module_path, main_path):
+        """
+        Return cheap signature of module: modification times of directory and main file
+
+        Args:
+            module_path (str): module directory
+            main_path (str): module main file
+
+        Returns:
+            tuple: signature or None if module does not exist
+        """
+        try:
+            return (os.stat(module_path).st_mtime_ns, os.stat(main_path).st_mtime_ns)
+        except OSError:
+            return None
+
+    def __stat_tree(self, module_path):
+        """
+        Stat module files
+
+        Args:
+            module_path (str): module directory
+
+        Returns:
+            dict: module tree infos (files, size, mtime and hash)
+        """
+        files = []
+        size = 0
+        mtime = 0
+        digest = hashlib.sha1()
+        for (root, dirs, filenames) in os.walk(module_path):
+            dirs[:] = sorted(
+                directory
+                for directory in dirs
+                if directory not in self.IGNORED_DIRS and not directory.startswith(".")
+            )
+            for filename in sorted(filenames):
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                relative_path = os.path.relpath(path, module_path)
+                files.append(relative_path)
+                size += stat.st_size
+                mtime = max(mtime, stat.st_mtime)
+                digest.update(
+                    f"{relative_path}:{stat.st_size}:{stat.st_mtime_ns};".encode()
+                )
+
+        return {
+            "files": files,
+            "size": size,
+            "mtime": mtime,
+            "hash": digest.hexdigest(),
+        }
+
+    def __scan(self, module_name):
+        """
+        Build module entry
+
+        Args:
+            module_name (str): module name
+
+        Returns:
+            dict: module entry or None if module does not exist
+        """
+        module_path = os.path.join(self.modules_path, module_name)
+        main_path = os.path.join(module_path, f"{module_name}.py")
+        if not os.path.exists(main_path):
+            return None
+
+        tree = self.__stat_tree(module_path)
+        return {
+            "name": module_name,
+            "path": module_path,
+            "mainpath": main_path,
+            "version": self.__read_version(main_path),
+            "files": tree["files"],
+            "size": tree["size"],
+            "mtime": tree["mtime"],
+            "hash": tree["hash"],
+            "scanned": time.time(),
+        }
+
+    @staticmethod
+    def __read_version(main_path):
+        try:
+            with open(main_path, "r", encoding="utf-8") as fd:
+                match = MODULE_VERSION_PATTERN.search(fd.read())
+            return match.group(1) if match else None
+        except OSError:
+            return None
+
+    def get(self, module_name):
+        """
+        Return module entry
+
+        Args:
+            module_name (str): module name
+
+        Returns:
+            dict: module entry or None if module does not exist::
+
+                {
+                    name (str): module name,
+                    path (str): module directory,
+                    mainpath (str): module main file,
+                    version (str): module version (None if not found),
+                    files (list): module files (relative to module directory),
+                    size (int): module size (bytes),
+                    mtime (float): last modification timestamp,
+                    hash (str): sources hash (files path, size and modification time),
+                    scanned (float): entry build timestamp,
+                }
+
+        """
+        if not module_name or os.sep in module_name:
+            return None
+
+        with self.__lock:
+            entry = self.__entries.get(module_name)
+            signature = self.__signatures.get(module_name)
+        if entry is None or signature is None:
+            return self.refresh(module_name)
+        if self.__get_signature(entry["path"], entry["mainpath"]) == signature:
+            return entry
+
+        return self.refresh(module_name)
+
+    def exists(self, module_name):
+        """
+        Return True if module is installed. Module tree is not revalidated
+
+        Args:
+            module_name (str): module name
+
+        Returns:
+            bool: True if module exists
+        """
+        if not module_name or os.sep in module_name:
+            return False
+
+        with self.__lock:
+            entry = self.__entries.get(module_name)
+        if entry is not None:
+            return os.path.exists(entry["mainpath"])
+
+        return self.refresh(module_name) is not None
+
+    def refresh(self, module_name):
+        """
+        Rebuild module entry
+
+        Args:
+            module_name (str): module name
+
+        Returns:
+            dict: module entry or None if module does not exist
+        """
+        module_path = os.path.join(self.modules_path, module_name)
+        # signature taken before scan: changes made during scan trigger a new one
+        signature = self.__get_signature(
+            module_path, os.path.join(module_path, f"{module_name}.py")
+        )
+        entry = self.__scan(module_name)
+        with self.__lock:
+            if entry is None:
+                self.__entries.pop(module_name, None)
+                self.__signatures.pop(module_name, None)
+            else:
+                self.__entries[module_name] = entry
+                self.__signatures[module_name] = signature
+        return entry
+
+    def invalidate(self, module_name=None):
+        """
+        Drop module entry, it is rebuilt on next lookup
+
+        Args:
+            module_name (str): module name. All modules if None
+        """
+        with self.__lock:
+            if module_name is None:
+                self.__entries.clear()
+                self.__signatures.clear()
+            else:
+                self.__entries.pop(module_name, None)
+                self.__signatures.pop(module_name, None)
+
+    def get_all(self):
+        """
+        Return entries of all installed modules
+
+        Returns:
+            list: list of module entries (see get) sorted by name
+        """
+        try:
+            names = sorted(os.listdir(self.modules_path))
+        except OSError:
+            return []
+        entries = [self.get(name) for name in names if not name.startswith((".", "_"))]
+        return [entry for entry in entries if entry is not None]
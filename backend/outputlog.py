@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+import threading
+from itertools import islice
+from collections import deque
+
+
+class OutputLog:
+    """
+    Bounded output log of a job run (tests, docs...)
+
+    Each line gets a sequence number starting at 0 for each run. When log is full, oldest
+    lines are dropped but sequence numbers keep increasing.
+    """
+
+    def __init__(self, max_lines=5000):
+        """
+        Constructor
+
+        Args:
+            max_lines (int): maximum number of retained lines
+        """
+        self.max_lines = max_lines
+        self.__lock = threading.Lock()
+        self.__lines = deque(maxlen=max_lines)
+        self.__next_seq = 0
+        self.__run_id = None
+
+    def new_run(self, run_id=None):
+        """
+        Start new run, previous run lines are dropped
+
+        Args:
+            run_id (str): run identifier. Generated if None
+
+        Returns:
+            str: run identifier
+        """
+        with self.__lock:
+            self.__lines.clear()
+            self.__next_seq = 0
+            self.__run_id = run_id or str(int(time.time() * 1000))
+            return self.__run_id
+
+    @property
+    def run_id(self):
+        """
+        Current run identifier
+        """
+        return self.__run_id
+
+    def append(self, messages):
+        """
+        Append messages to log
+
+        Args:
+            messages (list|str): message or list of messages
+
+        Returns:
+            int: sequence number of last appended line, -1 if nothing appended
+        """
+        if messages is None:
+            return self.__next_seq - 1
+        if isinstance(messages, str):
+            messages = [messages]
+
+        with self.__lock:
+            self.__lines.extend(messages)
+            self.__next_seq += len(messages)
+            return self.__next_seq - 1
+
+    def get_range(self, start=0, count=None):
+        """
+        Return lines range
+
+        Args:
+            start (int): sequence number of first line to return. Negative value to get last lines
+            count (int): maximum number of lines to return. All available lines if None
+
+        Returns:
+            dict: lines range::
+
+                {
+                    runid (str): run identifier,
+                    start (int): sequence number of first returned line,
+                    lines (list): list of lines,
+                    first (int): sequence number of first retained line,
+                    total (int): number of lines received since run start,
+                }
+
+        """
+        with self.__lock:
+            first = self.__next_seq - len(self.__lines)
+            if start < 0:
+                start = self.__next_seq + start
+            start = max(start, first)
+            end = (
+                self.__next_seq
+                if count is None
+                else min(self.__next_seq, start + count)
+            )
+            lines = list(islice(self.__lines, start - first, max(start, end) - first))
+
+            return {
+                "runid": self.__run_id,
+                "start": start,
+                "lines": lines,
+                "first": first,
+                "total": self.__next_seq,
+            }
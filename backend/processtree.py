@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import signal
+
+PROC_PATH = "/proc"
+
+
+def get_processes():
+    """
+    Return running processes
+
+    Returns:
+        dict: processes by pid::
+
+            {
+                pid (int): {
+                    ppid (int): parent pid,
+                    cmdline (str): process command line,
+                },
+                ...
+            }
+
+    """
+    processes = {}
+    for entry in os.listdir(PROC_PATH):
+        if not entry.isdigit():
+            continue
+        try:
+            # process name may not be valid utf-8
+            with open(
+                os.path.join(PROC_PATH, entry, "stat"),
+                "r",
+                encoding="utf-8",
+                errors="replace",
+            ) as fd:
+                stat = fd.read()
+            with open(os.path.join(PROC_PATH, entry, "cmdline"), "rb") as fd:
+                cmdline = fd.read().replace(b"\0", b" ").decode(errors="replace")
+        except OSError:
+            # process ended meanwhile
+            continue
+        # process name may contain spaces and parenthesis, ppid is the second field after it
+        ppid = int(stat[stat.rindex(")") + 2 :].split()[1])
+        processes[int(entry)] = {"ppid": ppid, "cmdline": cmdline.strip()}
+
+    return processes
+
+
+def find_processes(pattern, processes=None):
+    """
+    Find processes whose command line contains specified pattern
+
+    Args:
+        pattern (str): pattern to search
+        processes (dict): processes as returned by get_processes. Loaded if None
+
+    Returns:
+        list: list of pids
+    """
+    processes = processes if processes is not None else get_processes()
+    own_pid = os.getpid()
+    return [
+        pid
+        for pid, process in processes.items()
+        if pattern in process["cmdline"] and pid != own_pid
+    ]
+
+
+def get_descendants(pid, processes=None):
+    """
+    Return all descendants of specified process
+
+    Args:
+        pid (int): process id
+        processes (dict): processes as returned by get_processes. Loaded if None
+
+    Returns:
+        list: list of descendant pids (children first)
+    """
+    processes = processes if processes is not None else get_processes()
+    descendants = []
+    parents = [pid]
+    while parents:
+        parent = parents.pop(0)
+        children = [
+            child for child, process in processes.items() if process["ppid"] == parent
+        ]
+        descendants.extend(children)
+        parents.extend(children)
+
+    return descendants
+
+
+def kill_tree(pids, processes=None, sig=signal.SIGKILL):
+    """
+    Kill specified processes and all their descendants
+
+    Args:
+        pids (list): list of process ids
+        processes (dict): processes as returned by get_processes. Loaded if None
+        sig (int): signal to send
+
+    Returns:
+        list: list of signaled pids
+    """
+    processes = processes if processes is not None else get_processes()
+    targets = []
+    for pid in pids:
+        for target in [pid] + get_descendants(pid, processes):
+            if target not in targets:
+                targets.append(target)
+
+    killed = []
+    for target in targets:
+        try:
+            os.kill(target, sig)
+            killed.append(target)
+        except OSError:
+            # process already ended
+            pass
+
+    return killed
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+
+
+def merge_profiles(profile_paths, output_path):
+    """
+    Merge several raw profiles into a single one
+
+    Args:
+        profile_paths (list): list of raw profile paths. Missing files are ignored
+        output_path (str): merged profile path
+
+    Returns:
+        bool: True if merged profile was written, False if no profile exists
+    """
+    # lazy import: profiling is rarely used and module is loaded at Cleep startup
+    import pstats  # pylint: disable=import-outside-toplevel
+
+    existing_paths = [path for path in profile_paths if os.path.exists(path)]
+    if not existing_paths:
+        return False
+
+    stats = pstats.Stats(existing_paths[0])
+    for path in existing_paths[1:]:
+        stats.add(path)
+    stats.dump_stats(output_path)
+
+    return True
+
+
+def get_hotspots(profile_path, top=20, sort_key="cumulative"):
+    """
+    Return top-N hotspots of specified raw profile
+
+    Args:
+        profile_path (str): raw profile path
+        top (int): number of hotspots to return
+        sort_key (str): pstats sort key (cumulative, tottime...)
+
+    Returns:
+        list: list of hotspots::
+
+            [
+                {
+                    function (str): function name,
+                    file (str): source file,
+                    line (int): source line,
+                    calls (int): number of calls,
+                    tottime (float): time spent in function itself (seconds),
+                    cumtime (float): time spent in function and callees (seconds),
+                },
+                ...
+            ]
+
+    """
+    import pstats  # pylint: disable=import-outside-toplevel
+
+    stats = pstats.Stats(profile_path)
+    stats.sort_stats(sort_key)
+
+    hotspots = []
+    for func in stats.fcn_list[:top]:
+        _, calls, tottime, cumtime, _ = stats.stats[func]
+        filename, line, function = func
+        hotspots.append(
+            {
+                "function": function,
+                "file": filename,
+                "line": line,
+                "calls": calls,
+                "tottime": round(tottime, 6),
+                "cumtime": round(cumtime, 6),
+            }
+        )
+
+    return hotspots
+
+
+def format_hotspots(hotspots):
+    """
+    Format hotspots as text lines
+
+    Args:
+        hotspots (list): hotspots as returned by get_hotspots
+
+    Returns:
+        list: list of text lines
+    """
+    lines = [f"{'cumtime':>10} {'tottime':>10} {'calls':>8}  function"]
+    for hotspot in hotspots:
+        lines.append(
+            f"{hotspot['cumtime']:>10.4f} {hotspot['tottime']:>10.4f} {hotspot['calls']:>8}  "
+            f"{hotspot['function']} ({os.path.basename(hotspot['file'])}:{hotspot['line']})"
+        )
+
+    return lines
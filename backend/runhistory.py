@@ -0,0 +1,372 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import time
+import threading
+
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+STATUS_KILLED = "killed"
+STATUS_INTERRUPTED = "interrupted"
+
+
+class RunHistory:
+    """
+    On-disk history of jobs runs (tests, docs, builds) output
+
+    Each run output is written to its own log, one JSON encoded message per line, so it
+    survives clients reconnections and page reloads. Run log is rotated when a segment
+    is full (current and previous segments are kept) so a run never takes more than two
+    segments on disk. Oldest ended runs are removed when history exceeds its maximum
+    number of runs or size.
+
+    Runs index (job, module, status, lines...) is kept in memory and written to disk at
+    run start and end only.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, path, max_runs=100, max_size=20971520, segment_size=524288):
+        """
+        Constructor
+
+        Args:
+            path (str): history directory
+            max_runs (int): maximum number of retained runs
+            max_size (int): maximum history size on disk (bytes)
+            segment_size (int): run log segment size (bytes)
+        """
+        self.path = path
+        self.max_runs = max_runs
+        self.max_size = max_size
+        self.segment_size = segment_size
+        self.__lock = threading.RLock()
+        self.__runs = None
+        self.__active = {}
+
+    def __get_log_path(self, run_id, backup=False):
+        return os.path.join(self.path, f"{run_id}.log{'.1' if backup else ''}")
+
+    def __load(self):
+        """
+        Load runs index from disk (once). Runs still running when index was written
+        were interrupted (Cleep restart)
+        """
+        if self.__runs is not None:
+            return
+
+        self.__runs = {}
+        try:
+            with open(
+                os.path.join(self.path, self.INDEX_FILE), "r", encoding="utf-8"
+            ) as fd:
+                runs = json.load(fd)
+        except (OSError, ValueError):
+            return
+
+        for run in runs:
+            if run["status"] == STATUS_RUNNING:
+                run["status"] = STATUS_INTERRUPTED
+            self.__runs[run["runid"]] = run
+
+    def __save(self):
+        """
+        Write runs index to disk
+        """
+        index_path = os.path.join(self.path, self.INDEX_FILE)
+        try:
+            with open(f"{index_path}.tmp", "w", encoding="utf-8") as fd:
+                json.dump(list(self.__runs.values()), fd)
+            os.replace(f"{index_path}.tmp", index_path)
+        except OSError:
+            # history is best effort, output is still sent to clients
+            pass
+
+    def __prune(self):
+        """
+        Remove oldest ended runs until history fits its limits
+        """
+        ended = sorted(
+            (run for run in self.__runs.values() if run["status"] != STATUS_RUNNING),
+            key=lambda run: run["started"],
+        )
+        count = len(self.__runs)
+        size = sum(run["size"] for run in self.__runs.values())
+        for run in ended:
+            if count <= self.max_runs and size <= self.max_size:
+                break
+            self.__remove_logs(run["runid"])
+            del self.__runs[run["runid"]]
+            count -= 1
+            size -= run["size"]
+
+    def __remove_logs(self, run_id):
+        for backup in (False, True):
+            try:
+                os.remove(self.__get_log_path(run_id, backup))
+            except OSError:
+                pass
+
+    def start(self, job, module_name):
+        """
+        Start new run
+
+        Args:
+            job (str): job name (tests, docs, build...)
+            module_name (str): module name
+
+        Returns:
+            str: run identifier
+        """
+        with self.__lock:
+            self.__load()
+            timestamp = int(time.time() * 1000)
+            run_id = f"{job}-{timestamp}"
+            while run_id in self.__runs:
+                timestamp += 1
+                run_id = f"{job}-{timestamp}"
+
+            self.__runs[run_id] = {
+                "runid": run_id,
+                "job": job,
+                "module": module_name,
+                "started": time.time(),
+                "ended": None,
+                "status": STATUS_RUNNING,
+                "returncode": None,
+                "lines": 0,
+                "first": 0,
+                "size": 0,
+            }
+            try:
+                os.makedirs(self.path, exist_ok=True)
+                fd = open(  # pylint: disable=consider-using-with
+                    self.__get_log_path(run_id), "w", encoding="utf-8"
+                )
+            except OSError:
+                fd = None
+            self.__active[run_id] = {"fd": fd, "segment": 0, "backuplines": 0}
+            self.__prune()
+            self.__save()
+
+            return run_id
+
+    def append(self, run_id, messages):
+        """
+        Append messages to run log
+
+        Args:
+            run_id (str): run identifier
+            messages (list|str): message or list of messages
+        """
+        if not messages:
+            return
+        if isinstance(messages, str):
+            messages = [messages]
+
+        with self.__lock:
+            active = self.__active.get(run_id)
+            if not active:
+                return
+            run = self.__runs[run_id]
+            data = "".join(json.dumps(message) + "\n" for message in messages)
+            if active["fd"]:
+                try:
+                    if (
+                        active["segment"]
+                        and active["segment"] + len(data) > self.segment_size
+                    ):
+                        self.__rotate(run, active)
+                    active["fd"].write(data)
+                    active["fd"].flush()
+                except OSError:
+                    # log is no longer writable, next messages are only counted
+                    active["fd"] = None
+
+            run["lines"] += len(messages)
+            if active["fd"]:
+                active["segment"] += len(data)
+                run["size"] += len(data)
+
+    def __rotate(self, run, active):
+        """
+        Move current run log segment to backup, previous backup is dropped
+        """
+        active["fd"].close()
+        os.replace(
+            self.__get_log_path(run["runid"]),
+            self.__get_log_path(run["runid"], backup=True),
+        )
+        current_lines = run["lines"] - run["first"] - active["backuplines"]
+        run["first"] += active["backuplines"]
+        run["size"] = active["segment"]
+        active["backuplines"] = current_lines
+        active["segment"] = 0
+        active["fd"] = open(  # pylint: disable=consider-using-with
+            self.__get_log_path(run["runid"]), "w", encoding="utf-8"
+        )
+
+    def end(self, run_id, returncode, killed=False):
+        """
+        End run
+
+        Args:
+            run_id (str): run identifier
+            returncode (int): job return code
+            killed (bool): True if job was killed
+        """
+        with self.__lock:
+            active = self.__active.pop(run_id, None)
+            if not active:
+                return
+            if active["fd"]:
+                active["fd"].close()
+            run = self.__runs[run_id]
+            run["ended"] = time.time()
+            run["returncode"] = returncode
+            if killed:
+                run["status"] = STATUS_KILLED
+            else:
+                run["status"] = STATUS_SUCCEEDED if returncode == 0 else STATUS_FAILED
+            self.__prune()
+            self.__save()
+
+    def record(self, job, module_name, messages, returncode):
+        """
+        Record whole output of an ended job
+
+        Args:
+            job (str): job name
+            module_name (str): module name
+            messages (list): output messages
+            returncode (int): job return code
+
+        Returns:
+            str: run identifier
+        """
+        run_id = self.start(job, module_name)
+        self.append(run_id, messages)
+        self.end(run_id, returncode)
+        return run_id
+
+    def get_runs(self, module_name=None, job=None, limit=None):
+        """
+        Return runs, newest first
+
+        Args:
+            module_name (str): return only runs of this module
+            job (str): return only runs of this job
+            limit (int): maximum number of runs
+
+        Returns:
+            list: runs::
+
+                [
+                    {
+                        runid (str): run identifier,
+                        job (str): job name,
+                        module (str): module name,
+                        started (float): start timestamp,
+                        ended (float): end timestamp (None if running or interrupted),
+                        status (str): running, succeeded, failed, killed or interrupted,
+                        returncode (int): job return code,
+                        lines (int): number of output lines,
+                        first (int): sequence number of first retained line,
+                        size (int): retained output size (bytes),
+                    },
+                    ...
+                ]
+
+        """
+        with self.__lock:
+            self.__load()
+            runs = [
+                dict(run)
+                for run in self.__runs.values()
+                if (module_name is None or run["module"] == module_name)
+                and (job is None or run["job"] == job)
+            ]
+        runs.sort(key=lambda run: run["started"], reverse=True)
+        return runs[:limit] if limit else runs
+
+    def get_run(self, run_id):
+        """
+        Return run
+
+        Args:
+            run_id (str): run identifier
+
+        Returns:
+            dict: run (see get_runs) or None if run does not exist
+        """
+        with self.__lock:
+            self.__load()
+            run = self.__runs.get(run_id)
+            return dict(run) if run else None
+
+    def get_output(self, run_id, start=0, count=None):
+        """
+        Return run output range
+
+        Args:
+            run_id (str): run identifier
+            start (int): sequence number of first line. Negative value to get last lines
+            count (int): maximum number of lines to return. All retained lines if None
+
+        Returns:
+            dict: output range (None if run does not exist)::
+
+                {
+                    runid (str): run identifier,
+                    start (int): sequence number of first returned line,
+                    lines (list): list of lines,
+                    first (int): sequence number of first retained line,
+                    total (int): number of lines of run,
+                    running (bool): True if run is still running,
+                }
+
+        """
+        with self.__lock:
+            self.__load()
+            run = self.__runs.get(run_id)
+            if not run:
+                return None
+            lines = []
+            for backup in (True, False):
+                try:
+                    with open(
+                        self.__get_log_path(run_id, backup), "r", encoding="utf-8"
+                    ) as fd:
+                        lines.extend(fd.readlines())
+                except OSError:
+                    pass
+            total = run["lines"]
+            first = run["first"]
+            running = run["status"] == STATUS_RUNNING
+
+        # last line may be partial if a write failed
+        retained = []
+        for line in lines:
+            try:
+                retained.append(json.loads(line))
+            except ValueError:
+                break
+        # index of interrupted run was not updated since run start
+        total = max(total, first + len(retained))
+        first = total - len(retained)
+        if start < 0:
+            start = total + start
+        start = max(start, first)
+        end = total if count is None else min(total, start + count)
+
+        return {
+            "runid": run_id,
+            "start": start,
+            "lines": retained[start - first : max(start, end) - first],
+            "first": first,
+            "total": total,
+            "running": running,
+        }
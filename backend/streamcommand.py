@@ -0,0 +1,319 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import json
+import signal
+import codecs
+import threading
+import subprocess
+from collections import deque
+from .joblimits import limit_command, get_usage
+
+READ_SIZE = 65536
+MAX_TEXT_LINES = 100
+
+
+class JsonStreamParser:
+    """
+    Incremental parser of JSON documents stream
+
+    Stream can contain a single (pretty printed or not) JSON document, several newline
+    delimited JSON documents (ndjson) or text lines between documents. A document must
+    start at beginning of a line. Each document is decoded once, when its last character
+    is received.
+
+    A line starting with a bracket is a JSON document if it decodes, or if it opens a
+    document continued on next lines (nothing or a string, object or array after its
+    opening bracket). Other lines (log lines like "[INFO] ..." or "[ 50%]") are returned
+    as text lines.
+    """
+
+    TOKENS = re.compile(r'[{}\[\]"\\]')
+    DOCUMENT_START = re.compile(r'[{\[]\s*(["{\[]|$)')
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__buffer = ""
+        self.__pos = 0
+        self.__doc_start = None
+        self.__committed = False
+        self.__depth = 0
+        self.__in_string = False
+
+    def feed(self, text):
+        """
+        Feed parser with new data
+
+        Args:
+            text (str): received data
+
+        Returns:
+            tuple: list of decoded documents, list of text lines
+
+        Raises:
+            ValueError: if a document is not valid JSON
+        """
+        self.__buffer += text
+        documents = []
+        lines = []
+        while True:
+            if self.__doc_start is None:
+                if not self.__parse_text(lines):
+                    break
+            elif not self.__parse_document(documents, lines):
+                break
+
+        return documents, lines
+
+    def close(self):
+        """
+        End of stream
+
+        Returns:
+            list: remaining text lines
+
+        Raises:
+            ValueError: if last document is incomplete
+        """
+        if self.__committed:
+            raise ValueError("Incomplete JSON document")
+        remaining = self.__buffer.strip()
+        self.__buffer = ""
+        self.__reset()
+        return [remaining] if remaining else []
+
+    def __reset(self):
+        self.__doc_start = None
+        self.__committed = False
+        self.__pos = 0
+        self.__depth = 0
+        self.__in_string = False
+
+    def __parse_text(self, lines):
+        stripped = self.__buffer.lstrip(" \t\r")
+        offset = len(self.__buffer) - len(stripped)
+        if stripped[:1] in ("{", "["):
+            self.__doc_start = offset
+            self.__pos = offset
+            return True
+
+        return self.__flush_line(lines)
+
+    def __flush_line(self, lines):
+        end = self.__buffer.find("\n")
+        if end < 0:
+            return False
+        line = self.__buffer[:end].strip()
+        if line:
+            lines.append(line)
+        self.__buffer = self.__buffer[end + 1 :]
+        self.__reset()
+        return True
+
+    def __parse_document(self, documents, lines):
+        # until document is known to span several lines, its first line is scanned only
+        line_end = -1 if self.__committed else self.__buffer.find("\n", self.__pos)
+        end = len(self.__buffer) if line_end < 0 else line_end
+        if not self.__scan(end):
+            if line_end < 0:
+                return False
+            first_line = self.__buffer[self.__doc_start : line_end].strip()
+            if not self.DOCUMENT_START.match(first_line):
+                return self.__flush_line(lines)
+            self.__committed = True
+            self.__pos = line_end
+            return True
+
+        document = self.__buffer[self.__doc_start : self.__pos]
+        try:
+            decoded = json.loads(document)
+        except ValueError:
+            if self.__committed:
+                raise
+            # text line starting with a bracket, scanned again once complete
+            self.__pos = self.__doc_start
+            self.__depth = 0
+            self.__in_string = False
+            return self.__flush_line(lines)
+
+        self.__buffer = self.__buffer[self.__pos :]
+        self.__reset()
+        documents.append(decoded)
+        return True
+
+    def __scan(self, end):
+        while True:
+            match = self.TOKENS.search(self.__buffer, self.__pos, end)
+            if match is None:
+                self.__pos = end
+                return False
+
+            token = match.group(0)
+            self.__pos = match.end()
+            if self.__in_string:
+                if token == "\\":
+                    # skip escaped character
+                    if self.__pos >= end:
+                        self.__pos -= 1
+                        return False
+                    self.__pos += 1
+                elif token == '"':
+                    self.__in_string = False
+            elif token == '"':
+                self.__in_string = True
+            elif token in "{[":
+                self.__depth += 1
+            elif token in "}]":
+                self.__depth -= 1
+                if self.__depth == 0:
+                    return True
+
+
+def stream_command(
+    command,
+    timeout=None,
+    max_output_size=None,
+    on_document=None,
+    nice=None,
+    memory=None,
+):
+    """
+    Execute command parsing JSON documents from its stdout as they arrive
+
+    Whole stdout is never kept in memory: only decoded documents and a limited number of
+    text lines are returned. Command (and its children) is killed when timeout or output
+    size limit is reached, when a document is invalid or when on_document callback returns
+    False.
+
+    Args:
+        command (str): command to execute
+        timeout (float): command timeout (seconds). No timeout if None
+        max_output_size (int): maximum stdout size (bytes). No limit if None
+        on_document (function): function called with each decoded document. Return False
+            to stop command
+        nice (int): niceness increment applied to command
+        memory (int): maximum data segment size of command (bytes)
+
+    Returns:
+        dict: command result::
+
+            {
+                returncode (int): command return code,
+                documents (list): decoded documents,
+                stdout (list): stdout text lines (not JSON),
+                stderr (list): last stderr lines,
+                killed (bool): True if command killed by timeout,
+                stopped (bool): True if command stopped by on_document callback,
+                truncated (bool): True if command killed because output size limit is reached,
+                error (str): JSON parsing error if any,
+                outputsize (int): stdout and stderr size (bytes),
+                usage (dict): command resource usage (see joblimits.get_usage),
+            }
+
+    """
+    result = {
+        "returncode": None,
+        "documents": [],
+        "stdout": [],
+        "stderr": [],
+        "killed": False,
+        "stopped": False,
+        "truncated": False,
+        "error": None,
+        "outputsize": 0,
+        "usage": None,
+    }
+    process = subprocess.Popen(  # pylint: disable=consider-using-with
+        limit_command(command, nice, memory),
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True,
+    )
+
+    def kill():
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            # process already ended
+            pass
+
+    def on_timeout():
+        result["killed"] = True
+        kill()
+
+    stderr_lines = deque(maxlen=MAX_TEXT_LINES)
+    stderr_size = [0]
+
+    def read_stderr():
+        for line in process.stderr:
+            stderr_size[0] += len(line)
+            stderr_lines.append(line.decode(errors="replace").rstrip("\n"))
+
+    stderr_thread = threading.Thread(target=read_stderr, daemon=True)
+    stderr_thread.start()
+    timer = None
+    if timeout is not None:
+        timer = threading.Timer(timeout, on_timeout)
+        timer.daemon = True
+        timer.start()
+
+    parser = JsonStreamParser()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    stdout_size = 0
+    try:
+        fd = process.stdout.fileno()
+        while True:
+            chunk = os.read(fd, READ_SIZE)
+            if not chunk:
+                break
+            stdout_size += len(chunk)
+            if max_output_size is not None and stdout_size > max_output_size:
+                result["truncated"] = True
+                kill()
+                break
+
+            documents, lines = parser.feed(decoder.decode(chunk))
+            _keep_lines(result["stdout"], lines)
+            if not _handle_documents(result, documents, on_document):
+                result["stopped"] = True
+                kill()
+                break
+
+        if not (result["truncated"] or result["stopped"] or result["killed"]):
+            documents, lines = parser.feed(decoder.decode(b"", final=True))
+            _handle_documents(result, documents, on_document)
+            _keep_lines(result["stdout"], lines + parser.close())
+    except ValueError as error:
+        result["error"] = str(error)
+        kill()
+    finally:
+        process.stdout.close()
+        # wait4 returns resource usage of this command only (and its descendants)
+        _, status, rusage = os.wait4(process.pid, 0)
+        process.returncode = result["returncode"] = os.waitstatus_to_exitcode(status)
+        result["usage"] = get_usage(rusage)
+        if timer:
+            timer.cancel()
+        stderr_thread.join(1.0)
+        process.stderr.close()
+
+    result["stderr"] = list(stderr_lines)
+    result["outputsize"] = stdout_size + stderr_size[0]
+    return result
+
+
+def _keep_lines(kept_lines, lines):
+    kept_lines.extend(lines[: max(0, MAX_TEXT_LINES - len(kept_lines))])
+
+
+def _handle_documents(result, documents, on_document):
+    for document in documents:
+        result["documents"].append(document)
+        if on_document and on_document(document) is False:
+            return False
+    return True
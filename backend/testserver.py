@@ -0,0 +1,352 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import time
+import select
+import signal
+import socket
+import argparse
+import importlib
+
+PRELOAD_MODULES = (
+    "unittest.mock",
+    "pytest",
+    "coverage",
+    "cleep.core",
+    "cleep.libs.tests.session",
+)
+END_MARKER = b"\x00TESTSERVER-END:"
+STALE_RETURN_CODE = 75
+READ_SIZE = 65536
+CONNECT_TIMEOUT = 30.0
+REAP_INTERVAL = 1.0
+
+
+class TestServer:
+    """
+    Pre-warmed tests runner (forkserver)
+
+    Server imports heavy libraries (pytest, coverage, Cleep core...) once, then forks a
+    child for each tests run, so tests start without paying imports cost. Module under
+    test is never imported by server: each run sees up-to-date module sources.
+
+    Server is single-threaded: forking a threaded process copies locks held by other
+    threads and can deadlock the child. Accept loop forks a handler process for each
+    connection, handler reads request and forks tests run.
+
+    Preloaded libraries are fingerprinted (files and site directories modification
+    times). When they change (Cleep or dependency update) the server re-executes itself
+    to load new versions.
+    """
+
+    def __init__(self, socket_path, preload=PRELOAD_MODULES):
+        """
+        Constructor
+
+        Args:
+            socket_path (str): unix socket path
+            preload (tuple): modules to import before serving
+        """
+        self.socket_path = socket_path
+        self.preload = preload
+        self.preloaded = []
+        self.__fingerprint = None
+        self.__server = None
+
+    def warm_up(self):
+        """
+        Import preloaded modules and compute their fingerprint
+        """
+        for module_name in self.preload:
+            try:
+                importlib.import_module(module_name)
+                self.preloaded.append(module_name)
+            except Exception as error:
+                sys.stderr.write(f'Unable to preload "{module_name}": {error}\n')
+        self.__fingerprint = self.get_fingerprint()
+
+    @staticmethod
+    def get_fingerprint():
+        """
+        Return fingerprint of loaded modules
+
+        Returns:
+            dict: modification time by path (modules files and site directories)
+        """
+        paths = {
+            getattr(module, "__file__", None) for module in list(sys.modules.values())
+        }
+        paths.update(path for path in sys.path if "-packages" in path)
+        fingerprint = {}
+        for path in paths:
+            if not path:
+                continue
+            try:
+                fingerprint[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                fingerprint[path] = None
+        return fingerprint
+
+    def is_stale(self):
+        """
+        Return True if preloaded modules changed since warm up
+
+        Returns:
+            bool: True if server must be restarted
+        """
+        return any(
+            self.__get_mtime(path) != mtime
+            for (path, mtime) in self.__fingerprint.items()
+        )
+
+    @staticmethod
+    def __get_mtime(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def serve(self):
+        """
+        Serve tests run requests until process is stopped
+        """
+        self.warm_up()
+        self.__bind()
+        print(f"Test server ready (preloaded: {', '.join(self.preloaded)})")
+        sys.stdout.flush()
+
+        while True:
+            self.__reap_handlers()
+            try:
+                connection, _ = self.__server.accept()
+            except socket.timeout:
+                continue
+            if self.is_stale():
+                print("Preloaded modules changed, restarting test server")
+                sys.stdout.flush()
+                self.__send_end(connection, STALE_RETURN_CODE)
+                connection.close()
+                self.__server.close()
+                os.remove(self.socket_path)
+                os.execv(sys.executable, [sys.executable] + sys.argv)
+
+            if os.fork() == 0:
+                # handler: serve connection and exit
+                try:
+                    self.__server.close()
+                    self.__handle(connection)
+                finally:
+                    os._exit(0)  # pylint: disable=protected-access
+            connection.close()
+
+    def __bind(self):
+        """
+        Bind server socket, only current user can connect to it
+
+        Raises:
+            OSError: if socket directory is not private
+        """
+        directory = os.path.dirname(self.socket_path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        stat = os.lstat(directory)
+        if (
+            not os.path.isdir(directory)
+            or os.path.islink(directory)
+            or stat.st_uid != os.geteuid()
+            or stat.st_mode & 0o022
+        ):
+            raise OSError(f"Test server directory {directory} is not private")
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+        self.__server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o177)
+        try:
+            self.__server.bind(self.socket_path)
+        finally:
+            os.umask(umask)
+        self.__server.listen(4)
+        # wake up regularly to reap ended handlers
+        self.__server.settimeout(REAP_INTERVAL)
+
+    @staticmethod
+    def __reap_handlers():
+        try:
+            while os.waitpid(-1, os.WNOHANG)[0]:
+                pass
+        except ChildProcessError:
+            # no handler running
+            pass
+
+    @staticmethod
+    def __send_end(connection, returncode):
+        try:
+            connection.sendall(END_MARKER + str(returncode).encode() + b"\n")
+        except OSError:
+            # client is gone
+            pass
+
+    def __handle(self, connection):
+        try:
+            request = json.loads(connection.makefile("rb").readline())
+        except ValueError:
+            connection.close()
+            return
+
+        pid = os.fork()
+        if pid == 0:
+            # child: run tests with connection as stdout and stderr
+            returncode = 1
+            try:
+                os.setsid()
+                os.dup2(connection.fileno(), 1)
+                os.dup2(connection.fileno(), 2)
+                returncode = run_tests(request)
+            except BaseException as error:  # pylint: disable=broad-except
+                sys.stderr.write(f"Tests run failed: {error}\n")
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(returncode)  # pylint: disable=protected-access
+
+        returncode = self.__wait_child(pid, connection)
+        self.__send_end(connection, returncode)
+        connection.close()
+
+    @staticmethod
+    def __wait_child(pid, connection):
+        while True:
+            ended_pid, status = os.waitpid(pid, os.WNOHANG)
+            if ended_pid:
+                if os.WIFSIGNALED(status):
+                    return 128 + os.WTERMSIG(status)
+                return os.WEXITSTATUS(status)
+            readable, _, _ = select.select([connection], [], [], 0.1)
+            if readable and not connection.recv(1):
+                # client stopped (tests cancelled): kill tests run
+                try:
+                    os.killpg(pid, signal.SIGKILL)
+                except OSError:
+                    pass
+
+
+def run_tests(request):
+    """
+    Run tests in current process (forked child)
+
+    Args:
+        request (dict): tests request::
+
+            {
+                cwd (str): tests directory,
+                args (list): pytest arguments,
+                source (str): coverage source directory. No coverage if None,
+            }
+
+    Returns:
+        int: pytest return code
+    """
+    import pytest  # pylint: disable=import-outside-toplevel
+
+    os.chdir(request["cwd"])
+    sys.path.insert(0, request["cwd"])
+    sys.argv = ["pytest"] + request["args"]
+    cov = None
+    if request.get("source"):
+        import coverage  # pylint: disable=import-outside-toplevel
+
+        cov = coverage.Coverage(source=[request["source"]])
+        cov.start()
+    returncode = int(pytest.main(request["args"]))
+    if cov:
+        cov.stop()
+        cov.save()
+        sys.stdout.flush()
+        cov.report(file=sys.stdout)
+    return returncode
+
+
+def run_client(socket_path, request, fallback=None):
+    """
+    Send tests request to test server and stream tests output to stdout
+
+    Args:
+        socket_path (str): test server socket path
+        request (dict): tests request (see run_tests)
+        fallback (str): shell command executed if test server is not available
+
+    Returns:
+        int: tests return code
+    """
+    deadline = time.monotonic() + CONNECT_TIMEOUT
+    restarting = False
+    while True:
+        returncode = _request(socket_path, request)
+        restarting = restarting or returncode == STALE_RETURN_CODE
+        if returncode not in (None, STALE_RETURN_CODE) or not restarting:
+            break
+        if time.monotonic() > deadline:
+            returncode = None
+            break
+        # server is restarting, wait for it
+        time.sleep(0.5)
+
+    if returncode is None and fallback:
+        sys.stdout.flush()
+        os.execv("/bin/sh", ["/bin/sh", "-c", fallback])
+    return 1 if returncode is None else returncode
+
+
+def _request(socket_path, request):
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+    except OSError:
+        client.close()
+        return None
+
+    out = sys.stdout.buffer
+    with client:
+        client.sendall(json.dumps(request).encode() + b"\n")
+        pending = b""
+        while True:
+            chunk = client.recv(READ_SIZE)
+            if not chunk:
+                out.write(pending)
+                out.flush()
+                return 1
+            pending += chunk
+            index = pending.find(END_MARKER)
+            if index >= 0:
+                out.write(pending[:index])
+                out.flush()
+                return int(pending[index + len(END_MARKER) :].split(b"\n")[0])
+            # keep end of buffer in case end marker is split between chunks
+            keep = len(END_MARKER) - 1
+            out.write(pending[:-keep])
+            out.flush()
+            pending = pending[-keep:]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-warmed tests runner")
+    parser.add_argument("--socket", required=True)
+    parser.add_argument("--serve", action="store_true")
+    parser.add_argument("--cwd")
+    parser.add_argument("--source")
+    parser.add_argument("--fallback")
+    parser.add_argument("args", nargs="*")
+    args = parser.parse_args()
+    if args.serve:
+        TestServer(args.socket).serve()
+    else:
+        sys.exit(
+            run_client(
+                args.socket,
+                {"cwd": args.cwd, "args": args.args, "source": args.source},
+                args.fallback,
+            )
+        )
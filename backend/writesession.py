@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+import logging
+import threading
+from contextlib import contextmanager
+
+
+class WriteSession:
+    """
+    Manage filesystem read-write windows
+
+    Partitions are switched to read-write only while at least one session is opened. When last
+    session is closed, read-only is restored after a quiet period so consecutive operations share
+    the same window. Queued writes are flushed once per window with Cleep filesystem helpers, just
+    before read-only is restored.
+    """
+
+    PARTITIONS = ("root", "boot")
+
+    def __init__(self, cleep_filesystem, quiet_period=2.0, logger=None):
+        """
+        Constructor
+
+        Args:
+            cleep_filesystem (CleepFilesystem): Cleep filesystem instance
+            quiet_period (float): delay before restoring read-only after last session is closed
+            logger (Logger): logger instance
+        """
+        self.cleep_filesystem = cleep_filesystem
+        self.quiet_period = quiet_period
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.__lock = threading.RLock()
+        self.__counters = {partition: 0 for partition in self.PARTITIONS}
+        self.__writable_since = {partition: None for partition in self.PARTITIONS}
+        self.__named_sessions = {}
+        self.__pending_writes = {}
+        self.__timer = None
+        self.__stats = {
+            "windows": 0,
+            "rwseconds": {partition: 0.0 for partition in self.PARTITIONS},
+            "writes": 0,
+            "flushes": 0,
+        }
+
+    def __enable(self, root, boot):
+        if root:
+            self.__counters["root"] += 1
+        if boot:
+            self.__counters["boot"] += 1
+
+        if self.__timer:
+            self.__timer.cancel()
+            self.__timer = None
+
+        # partition may still be writable if its quiet period was not elapsed
+        to_enable = {
+            partition: wanted and self.__writable_since[partition] is None
+            for (partition, wanted) in (("root", root), ("boot", boot))
+        }
+        if any(to_enable.values()):
+            self.logger.debug("Enable write on %s", to_enable)
+            self.cleep_filesystem.enable_write(
+                root=to_enable["root"], boot=to_enable["boot"]
+            )
+            now = time.time()
+            for (partition, enabled) in to_enable.items():
+                if enabled:
+                    self.__writable_since[partition] = now
+            self.__stats["windows"] += 1
+
+    def __release(self, root, boot, immediate=False):
+        if root:
+            self.__counters["root"] = max(0, self.__counters["root"] - 1)
+        if boot:
+            self.__counters["boot"] = max(0, self.__counters["boot"] - 1)
+
+        if immediate:
+            self.__disable_idle_partitions()
+        elif self.__timer is None:
+            self.__timer = threading.Timer(self.quiet_period, self.__on_quiet_period)
+            self.__timer.daemon = True
+            self.__timer.start()
+
+    def __on_quiet_period(self):
+        with self.__lock:
+            self.__timer = None
+            self.__disable_idle_partitions()
+
+    def __disable_idle_partitions(self):
+        to_disable = {
+            partition: self.__counters[partition] == 0
+            and self.__writable_since[partition] is not None
+            for partition in self.PARTITIONS
+        }
+        if not any(to_disable.values()):
+            return
+
+        self.__flush_pending_writes()
+        self.logger.debug("Disable write on %s", to_disable)
+        self.cleep_filesystem.disable_write(
+            root=to_disable["root"], boot=to_disable["boot"]
+        )
+        now = time.time()
+        for (partition, disabled) in to_disable.items():
+            if disabled:
+                self.__stats["rwseconds"][partition] += (
+                    now - self.__writable_since[partition]
+                )
+                self.__writable_since[partition] = None
+
+    def __flush_pending_writes(self):
+        if not self.__pending_writes:
+            return
+
+        for (path, content) in self.__pending_writes.items():
+            try:
+                if self.cleep_filesystem.write_data(path, content, encoding="utf-8"):
+                    self.__stats["writes"] += 1
+                else:
+                    self.logger.error('Unable to write file "%s"', path)
+            except Exception:
+                self.logger.exception('Unable to write file "%s"', path)
+        self.__pending_writes.clear()
+        self.__stats["flushes"] += 1
+
+    @contextmanager
+    def session(self, root=True, boot=False):
+        """
+        Context manager that keeps partitions writable during its execution
+
+        Args:
+            root (bool): root partition must be writable
+            boot (bool): boot partition must be writable
+        """
+        with self.__lock:
+            self.__enable(root, boot)
+        try:
+            yield
+        finally:
+            with self.__lock:
+                self.__release(root, boot)
+
+    def open(self, name, root=True, boot=False):
+        """
+        Open named long-lived session. Opening an already opened session does nothing
+
+        Args:
+            name (str): session name
+            root (bool): root partition must be writable
+            boot (bool): boot partition must be writable
+        """
+        with self.__lock:
+            if name in self.__named_sessions:
+                return
+            self.__named_sessions[name] = (root, boot)
+            self.__enable(root, boot)
+
+    def close(self, name):
+        """
+        Close named long-lived session. Read-only is restored immediately if no other session
+        is opened
+
+        Args:
+            name (str): session name
+        """
+        with self.__lock:
+            if name not in self.__named_sessions:
+                return
+            (root, boot) = self.__named_sessions.pop(name)
+            self.__release(root, boot, immediate=True)
+
+    def queue_write(self, path, content):
+        """
+        Queue file write. It will be written during current or next write window.
+        Consecutive writes to the same path are coalesced
+
+        Args:
+            path (str): file path
+            content (str): file content
+        """
+        with self.__lock:
+            self.__pending_writes[path] = content
+        with self.session():
+            pass
+
+    def flush(self):
+        """
+        Write queued files immediately
+        """
+        with self.__lock:
+            if not self.__pending_writes:
+                return
+            self.__enable(True, False)
+            self.__flush_pending_writes()
+            self.__release(True, False, immediate=True)
+
+    def reset(self):
+        """
+        Flush queued writes, drop all sessions and restore read-only on writable partitions
+        """
+        with self.__lock:
+            if self.__pending_writes:
+                self.__enable(True, False)
+            self.__flush_pending_writes()
+            if self.__timer:
+                self.__timer.cancel()
+                self.__timer = None
+            self.__named_sessions.clear()
+            now = time.time()
+            to_disable = {}
+            for partition in self.PARTITIONS:
+                self.__counters[partition] = 0
+                to_disable[partition] = self.__writable_since[partition] is not None
+                if to_disable[partition]:
+                    self.__stats["rwseconds"][partition] += (
+                        now - self.__writable_since[partition]
+                    )
+                    self.__writable_since[partition] = None
+
+            # only partitions enabled by this session, disable calls must match enables
+            if any(to_disable.values()):
+                self.cleep_filesystem.disable_write(
+                    root=to_disable["root"], boot=to_disable["boot"]
+                )
+
+    def get_stats(self):
+        """
+        Return write sessions statistics
+
+        Returns:
+            dict: statistics::
+
+                {
+                    windows (int): number of read-write windows opened,
+                    rwseconds (dict): time spent in read-write by partition (seconds),
+                    writable (dict): current read-write state by partition,
+                    sessions (list): opened named sessions,
+                    pendingwrites (int): number of queued writes,
+                    writes (int): number of written files,
+                    flushes (int): number of queued writes flushes,
+                }
+
+        """
+        with self.__lock:
+            now = time.time()
+            return {
+                "windows": self.__stats["windows"],
+                "rwseconds": {
+                    partition: round(
+                        seconds
+                        + (
+                            now - self.__writable_since[partition]
+                            if self.__writable_since[partition] is not None
+                            else 0.0
+                        ),
+                        3,
+                    )
+                    for (partition, seconds) in self.__stats["rwseconds"].items()
+                },
+                "writable": {
+                    partition: since is not None
+                    for (partition, since) in self.__writable_since.items()
+                },
+                "sessions": list(self.__named_sessions.keys()),
+                "pendingwrites": len(self.__pending_writes),
+                "writes": self.__stats["writes"],
+                "flushes": self.__stats["flushes"],
+            }
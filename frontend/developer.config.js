@@ -63,6 +63,10 @@ function($rootScope, toast, cleepService, developerService, systemService, $time
             // get device ip
             self.deviceIp = $location.host();
 
+            // resume tests and docs outputs (page reloaded during a run)
+            self.developerService.resumeOutput('tests');
+            self.developerService.resumeOutput('docs');
+
             // load module configuration
             cleepService.getModuleConfig('developer')
                 .then(function(config) {
@@ -176,10 +180,25 @@ function($rootScope, toast, cleepService, developerService, systemService, $time
             toast.loading('Analyzing application...');
             developerService.checkApplication(self.config.moduleInDev)
                 .then(function(resp) {
+                    // failed checks (and checks depending on them) have no result
+                    const failedChecks = Object.entries(resp.data.checks || {})
+                        .filter(([, check]) => check.status !== 'succeeded')
+                        .map(([name, check]) => name + ': ' + check.error);
+                    if (!resp.data.backend) {
+                        self.analyzeError = failedChecks.join(', ');
+                        return;
+                    }
+                    const emptyCheck = { errors: [], warnings: [], files: [] };
+                    ['frontend', 'tests', 'scripts'].forEach((name) => {
+                        resp.data[name] = resp.data[name] || emptyCheck;
+                    });
+                    resp.data.changelog = resp.data.changelog || {};
+
                     self.checkData = resp.data;
+                    self.checkData.failedChecks = failedChecks;
                     self.checkData.backend.metadata.longdescription = self.sceLongDescription = $sce.trustAsHtml(self.checkData.backend.metadata.longdescription);
-                    self.checkData.errorsCount = resp.data.backend.errors.length + resp.data.frontend.errors.length + resp.data.tests.errors.length + resp.data.scripts.errors.length
-                    self.checkData.warningsCount = resp.data.backend.warnings.length + resp.data.frontend.warnings.length + resp.data.tests.warnings.length + resp.data.scripts.warnings.length
+                    self.checkData.errorsCount = resp.data.backend.errors.length + resp.data.frontend.errors.length + resp.data.tests.errors.length + resp.data.scripts.errors.length + failedChecks.length;
+                    self.checkData.warningsCount = resp.data.backend.warnings.length + resp.data.frontend.warnings.length + resp.data.tests.warnings.length + resp.data.scripts.warnings.length;
                     self.checkData.backend.metadata.urls.site = self.__buildHref(self.checkData.backend.metadata.urls.site);
                     self.checkData.backend.metadata.urls.info = self.__buildHref(self.checkData.backend.metadata.urls.info);
                     self.checkData.backend.metadata.urls.help = self.__buildHref(self.checkData.backend.metadata.urls.help);
@@ -343,7 +362,12 @@ function($rootScope, toast, cleepService, developerService, systemService, $time
 
             developerService.getLastCoverageReport(self.config.moduleInDev)
                 .then(function(resp) {
+                    if (resp.error) {
+                        return;
+                    }
                     if (resp.data) {
+                        toast.info('Last coverage report displayed in test output');
+                    } else {
                         toast.info('Last report will be displayed in test output in few seconds');
                     }
                 })
@@ -7,10 +7,18 @@ angular
 .service('developerService', ['$q', '$rootScope', 'rpcService', 'cleepService', '$window', '$timeout',
 function($q, $rootScope, rpcService, cleepService, $window, $timeout) {
     var self = this;
+    self.OUTPUT_MAX_LINES = 1000;
     self.testsOutput = [];
     self.docsOutput = [];
+    self.outputCursors = {
+        tests: { runId: null, seq: -1 },
+        docs: { runId: null, seq: -1 },
+    };
     self.docsHtml = "";
+    self.docsCache = { moduleName: null, etag: null, html: "" };
     self.breakingChanges = {};
+    self.applicationCreation = { moduleName: null, step: null, progress: 0, deferred: null };
+    self.reloadTimer = null;
 
     /**
      * Start remotedev
@@ -29,8 +37,15 @@ function($q, $rootScope, rpcService, cleepService, $window, $timeout) {
     /**
      * Check application
      */
-    self.checkApplication = function(moduleName) {
-        return rpcService.sendCommand('check_application', 'developer', {'module_name':moduleName}, 30);
+    self.checkApplication = function(moduleName, profile) {
+        return rpcService.sendCommand('check_application', 'developer', {'module_name':moduleName, 'profile': !!profile}, 30);
+    };
+
+    /**
+     * Check (and build) several applications at once
+     */
+    self.checkApplications = function(moduleNames, build) {
+        return rpcService.sendCommand('check_applications', 'developer', {'module_names': moduleNames, 'build': !!build}, 600);
     };
 
     /**
@@ -58,23 +73,85 @@ function($q, $rootScope, rpcService, cleepService, $window, $timeout) {
      * Create new applicatin skeleton
      */
     self.createApplication = function(moduleName) {
-        return rpcService.sendCommand('create_application', 'developer', {'module_name': moduleName}, 10);
+        self.applicationCreation = { moduleName: moduleName, step: null, progress: 0, deferred: $q.defer() };
+        const deferred = self.applicationCreation.deferred;
+        rpcService.sendCommand('create_application', 'developer', {'module_name': moduleName})
+            .then((resp) => {
+                if (resp.error) {
+                    deferred.reject(resp.message);
+                }
+            })
+            .catch((error) => {
+                deferred.reject(error);
+            });
+        return deferred.promise;
     };
 
     /**
      * Launch unit tests
      */
-    self.launchTests = function(moduleName) {
+    self.launchTests = function(moduleName, profile) {
         self.testsOutput.splice(0, self.testsOutput.length);
-        return rpcService.sendCommand('launch_tests', 'developer', {'module_name': moduleName});
+        return rpcService.sendCommand('launch_tests', 'developer', {'module_name': moduleName, 'profile': !!profile});
+    };
+
+    /**
+     * Download latest module profile
+     */
+    self.downloadProfile = function(moduleName) {
+        return rpcService.download('download_profile', 'developer', {'module_name': moduleName});
     };
 
     /**
      * Get last coverage report
      */
-    self.getLastCoverageReport = function(moduleName) {
-        self.testsOutput.splice(0, self.testsOutput.length);
-        return rpcService.sendCommand('get_last_coverage_report', 'developer', {'module_name': moduleName});
+    self.getLastCoverageReport = function(moduleName, pattern, maxCoverage) {
+        return rpcService.sendCommand('get_last_coverage_report', 'developer', {'module_name': moduleName, 'pattern': pattern, 'max_coverage': maxCoverage})
+            .then((resp) => {
+                // report is returned when computed at end of last tests run, otherwise it is sent in tests output
+                // output is kept on error (tests running)
+                if (!resp.error && resp.data) {
+                    self.testsOutput.splice(0, self.testsOutput.length);
+                    self.__appendOutput(self.testsOutput, self.__formatCoverageReport(resp.data));
+                }
+                return resp;
+            });
+    };
+
+    /**
+     * Format coverage report as text lines
+     */
+    self.__formatCoverageReport = function(report) {
+        const formatLine = (name, statements, missing, cover, missingLines) => [
+            name.padEnd(50), String(statements).padStart(6), String(missing).padStart(6),
+            cover.padStart(6), missingLines || '',
+        ].join('  ');
+        const formatEntry = (name, entry, missingLines) => formatLine(
+            name, entry.statements, entry.missing, entry.coverage.toFixed(0) + '%', missingLines
+        );
+        const lines = [formatLine('Name', 'Stmts', 'Miss', 'Cover', 'Missing')];
+        Object.entries(report.files).forEach(([path, entry]) => {
+            const missing = entry.missinglines
+                .map(([first, last]) => (first === last ? String(first) : first + '-' + last))
+                .join(', ');
+            lines.push(formatEntry(path, entry, missing));
+        });
+        lines.push(formatEntry('TOTAL', report.total));
+        return lines;
+    };
+
+    /**
+     * Get coverage and duration trends of last tests runs
+     */
+    self.getCoverageTrends = function(moduleName, limit) {
+        return rpcService.sendCommand('get_coverage_trends', 'developer', {'module_name': moduleName, 'limit': limit || 20});
+    };
+
+    /**
+     * Get per-file coverage deltas between two tests runs (last and previous one by default)
+     */
+    self.getCoverageDeltas = function(moduleName, runId, referenceRunId) {
+        return rpcService.sendCommand('get_coverage_deltas', 'developer', {'module_name': moduleName, 'run_id': runId, 'reference_run_id': referenceRunId});
     };
 
     /**
@@ -98,10 +175,15 @@ function($q, $rootScope, rpcService, cleepService, $window, $timeout) {
      */
     self.generateDocumentation = function(moduleName) {
         self.__resetDoc();
-        return rpcService.sendCommand('generate_documentation', 'developer', {'module_name': moduleName}, 15)
+        const etag = self.docsCache.moduleName === moduleName ? self.docsCache.etag : null;
+        return rpcService.sendCommand('generate_documentation', 'developer', {'module_name': moduleName, 'etag': etag}, 15)
             .then((resp) => {
                 if (!resp.error) {
-                    self.docsHtml = self.__checkDocToHtml(resp.data.doc, resp.data.check);
+                    if (resp.data.html !== null) {
+                        // documentation changed, html is rendered by backend
+                        self.docsCache = { moduleName, etag: resp.data.etag, html: resp.data.html };
+                    }
+                    self.docsHtml = self.docsCache.html;
                 }
 
                 return resp.data.valid;
@@ -121,140 +203,177 @@ function($q, $rootScope, rpcService, cleepService, $window, $timeout) {
     };
 
     /**
-     * Reset docs variables
+     * Get range of retained output of last run (job = tests|docs)
      */
-    self.__resetDoc = function() {
-        self.docsOutput.splice(0, self.docsOutput.length);
-        self.docsHtml = "";
+    self.getOutputRange = function(job, start, count) {
+        return rpcService.sendCommand('get_output_range', 'developer', {'job': job, 'start': start, 'count': count});
     };
 
     /**
-     * Transform check doc from json to html
+     * Get output missed since last received message (job = tests|docs)
      */
-    self.__checkDocToHtml = function(doc, check) {
-        let html = "<ul>";
-        for (const [fnName, data] of Object.entries(doc)) {
-            html += "<li class=\"doc-function\"><span>Command " + fnName + "</span><ul>";
+    self.resumeOutput = function(job) {
+        const cursor = self.outputCursors[job];
+        return rpcService.sendCommand('resume_output', 'developer', {'job': job, 'run_id': cursor.runId, 'last_seq': cursor.seq})
+            .then((resp) => {
+                if (!resp.error) {
+                    self.__applyOutput(job, resp.data.runid, resp.data.lines, resp.data.seq, true);
+                }
+                return resp;
+            });
+    };
 
-            // errors
-            const errors =  check[fnName]?.errors || [];
-            if (errors.length > 0) {
-                html += self.__docGenerateHtmlErrors(errors);
-            }
+    /**
+     * Apply output chunk of a run: chunks already received are skipped, missed output is fetched
+     * when a gap is detected (messages dropped while bus was busy or page reloaded)
+     */
+    self.__applyOutput = function(job, runId, messages, seq, resumed) {
+        const cursor = self.outputCursors[job];
+        const output = job === 'tests' ? self.testsOutput : self.docsOutput;
+        const lines = Array.isArray(messages) ? messages : (messages === undefined || messages === null ? [] : [messages]);
+        if (runId !== cursor.runId) {
+            output.splice(0, output.length);
+            cursor.runId = runId;
+            cursor.seq = -1;
+        }
+        if (seq === undefined || seq === null) {
+            self.__appendOutput(output, lines);
+            return;
+        }
 
-            // warnings
-            const warns =  check[fnName]?.warnings || [];
-            if (warns.length > 0) {
-                html += self.__docGenerateHtmlErrors(warns);
-            }
+        const first = seq - lines.length + 1;
+        if (first > cursor.seq + 1 && !resumed) {
+            self.resumeOutput(job);
+            return;
+        }
+        if (seq > cursor.seq) {
+            self.__appendOutput(output, lines.slice(Math.max(cursor.seq + 1 - first, 0)));
+            cursor.seq = seq;
+        }
+    };
 
-            // args
-            if (data.args?.length > 0) {
-                html += "<li><span>Args</span><ul>";
-            }
-            for (const arg of data.args) {
-                const argName = arg.name;
-                html += "<li><span>" + argName + "</span><ul><li>Type: " + self.__specialsToHtml(arg.type) + "</li>";
-                if (arg.optional) {
-                    html += "<li>Optional: true</li>";
-                }
-                if (arg.default !== null) {
-                    html += "<li>default: " + arg.default + "</li>";
-                }
-                html += "<li>Description: " + arg.description + "</li>";
+    /**
+     * Get runs kept in history (job = tests|docs|build), newest first
+     */
+    self.getRuns = function(moduleName, job, limit) {
+        return rpcService.sendCommand('get_runs', 'developer', {'module_name': moduleName, 'job': job, 'limit': limit});
+    };
 
-                html += self.__docGenerateHtmlFormats(arg.formats);
-                html += "</ul></li>";
-            }
-            if (data.args?.length > 0) {
-                html += "</ul></li>";
-            }
+    /**
+     * Get output range of a run kept in history
+     */
+    self.getRunOutput = function(runId, start, count) {
+        return rpcService.sendCommand('get_run_output', 'developer', {'run_id': runId, 'start': start, 'count': count});
+    };
 
-            // returns
-            if (data.returns?.length > 0) {
-                html += "<li><span>Returns</span><ul>";
-            }
-            for (const ret of data.returns) {
-                html += "<li><span>" + self.__specialsToHtml(ret.type) + "</span>";
-                html += "<ul>";
-                html += "<li>Description: " + ret.description + "</li>";
+    /**
+     * Get last lines of a run kept in history
+     */
+    self.tailRunOutput = function(runId, count) {
+        return rpcService.sendCommand('tail_run_output', 'developer', {'run_id': runId, 'count': count});
+    };
 
-                html += self.__docGenerateHtmlFormats(ret.formats);
-                html += "</ul></li>";
-            }
-            if (data.returns?.length > 0) {
-                html += "</ul></li>";
-            }
+    /**
+     * Cancel running job (job = tests|docs)
+     */
+    self.cancelJob = function(job) {
+        return rpcService.sendCommand('cancel_job', 'developer', {'job': job});
+    };
 
-            // raises
-            if (data.raises?.length > 0) {
-                html += "<li><span>Raises</span><ul>";
-            }
-            for (const raise of data.raises) {
-                html += "<li><span>" + self.__specialsToHtml(raise.type) + "</span><ul><li>Description: " + raise.description + "</li>";
-                html += "</ul></li>";
-            }
-            if (data.raises?.length > 0) {
-                html += "</ul></li>";
-            }
-            html += "</ul></li>";
+    /**
+     * Append messages in place to output buffer, dropping oldest lines when buffer is full
+     */
+    self.__appendOutput = function(output, messages) {
+        if (Array.isArray(messages)) {
+            Array.prototype.push.apply(output, messages);
+        } else if (messages !== undefined && messages !== null) {
+            output.push(messages);
         }
-        html += "</ul>";
 
-        return html;
-    }
-
-    self.__docGenerateHtmlFormats = function(formats) {
-        let html = "";
-        if (formats?.length) {
-            html += "<li><span>Formats</span>:<ul>";
-        }
-        for (const format of formats) {
-            html += "<li>" + format + "</li>";
-        }
-        if (formats?.length) {
-            html += "</ul></li>";
+        if (output.length > self.OUTPUT_MAX_LINES) {
+            output.splice(0, output.length - self.OUTPUT_MAX_LINES);
         }
+    };
 
-        return html;
-    }
+    /**
+     * Get cleep-cli commands performance statistics
+     */
+    self.getPerformanceStats = function() {
+        return rpcService.sendCommand('get_performance_stats', 'developer');
+    };
 
-    self.__docGenerateHtmlErrors = function(errors) {
-        let html = "";
-        if (errors.length > 0) {
-            html += "<li><span>Errors:</span><ul class=\"doc-errors\">"
-        }
-        for (const error of errors) {
-            html += "<li>" + error + "</li>";
-        }
-        if (errors.length > 0) {
-            html += "</ul></li>";
-        }
-        return html;
-    }
+    /**
+     * Set performance statistics event interval (0 to disable)
+     */
+    self.setPerformanceStatsInterval = function(interval) {
+        return rpcService.sendCommand('set_performance_stats_interval', 'developer', {'interval': interval});
+    };
 
-    self.__docGenerateHtmlWarns = function(warns) {
-        let html = "";
-        if (warns.length > 0) {
-            html += "<li><span>Warnings:</span><ul class=\"doc-warns\">"
-        }
-        for (const warn of warns) {
-            html += "<li>" + warn + "</li>";
-        }
-        if (warns.length > 0) {
-            html += "</ul></li>";
+    /**
+     * Get developer events dispatching statistics (sent, coalesced, dropped)
+     */
+    self.getEventStats = function() {
+        return rpcService.sendCommand('get_event_stats', 'developer');
+    };
+
+    /**
+     * Get filesystem read-write windows statistics
+     */
+    self.getFilesystemStats = function() {
+        return rpcService.sendCommand('get_filesystem_stats', 'developer');
+    };
+
+    /**
+     * Get installed modules catalog (version, files, size, sources hash)
+     */
+    self.getModulesCatalog = function() {
+        return rpcService.sendCommand('get_modules_catalog', 'developer');
+    };
+
+    /**
+     * Set quiet period (seconds) used by backend to coalesce frontend restarts
+     */
+    self.setFrontendRestartQuietPeriod = function(quietPeriod) {
+        return rpcService.sendCommand('set_frontend_restart_quiet_period', 'developer', {'quiet_period': quietPeriod});
+    };
+
+    /**
+     * Reload page once, even if several restarts are requested meanwhile
+     */
+    self.__reloadFrontend = function() {
+        if (self.reloadTimer) {
+            return;
         }
-        return html;
-    }
+        self.reloadTimer = $timeout(() => { $window.location.reload(true); }, 1000);
+    };
 
     /**
-     * Encode specials chars to HTML
+     * Replace asset (stylesheet or image) of module by its new version
+     * Return false if asset is not loaded in page (page must be reloaded)
      */
-    self.__specialsToHtml = function (raw) {
-        return raw.replace(/[\u00A0-\u9999<>\&]/g, function(i) {
-            return '&#'+i.charCodeAt(0)+';';
+    self.__hotSwapAsset = function(moduleName, file) {
+        const suffix = '/' + moduleName + '/' + file;
+        const version = 'v=' + Date.now();
+        const elements = Array.from($window.document.querySelectorAll('link[rel="stylesheet"][href], img[src]'));
+        let swapped = false;
+        elements.forEach((element) => {
+            const attr = element.tagName === 'LINK' ? 'href' : 'src';
+            const url = element.getAttribute(attr).split('?')[0];
+            if (url.endsWith(suffix)) {
+                element.setAttribute(attr, url + '?' + version);
+                swapped = true;
+            }
         });
-    }
+        return swapped;
+    };
+
+    /**
+     * Reset docs variables
+     */
+    self.__resetDoc = function() {
+        self.docsOutput.splice(0, self.docsOutput.length);
+        self.docsHtml = "";
+    };
 
     /**
      * Watch for config changes
@@ -270,21 +389,49 @@ function($q, $rootScope, rpcService, cleepService, $window, $timeout) {
      * Catch cleep-cli stoped events
      **/
     $rootScope.$on('developer.frontend.restart', function(event, uuid, params) {
-        $timeout(() => { $window.location.reload(true); }, 1000);
+        self.__reloadFrontend();
+    });
+
+    /**
+     * Catch frontend assets changes: hot-swap changed assets instead of reloading page
+     */
+    $rootScope.$on('developer.frontend.assets', function(event, uuid, params) {
+        const files = params.files || [];
+        const swapped = files.every((file) => self.__hotSwapAsset(params.module, file));
+        if (!swapped) {
+            self.__reloadFrontend();
+        }
+    });
+
+    /**
+     * Catch application creation events
+     */
+    $rootScope.$on('developer.application.create', function(event, uuid, params) {
+        const creation = self.applicationCreation;
+        if (creation.moduleName !== params.module) {
+            return;
+        }
+        creation.step = params.step;
+        creation.progress = params.progress;
+        if (params.step === 'done') {
+            creation.deferred?.resolve();
+        } else if (params.step === 'error') {
+            creation.deferred?.reject(params.error);
+        }
     });
 
     /**
      * Catch tests events
      */
     $rootScope.$on('developer.tests.output', function(event, uuid, params) {
-        self.testsOutput = self.testsOutput.concat(params.messages);
+        self.__applyOutput('tests', params.runid, params.messages, params.seq, false);
     });
 
     /**
      * Catch docs events
      */
     $rootScope.$on('developer.docs.output', function(event, uuid, params) {
-        self.docsOutput = self.docsOutput.concat(params.messages);
+        self.__applyOutput('docs', params.runid, params.messages, params.seq, false);
     });
 }]);
 
@@ -12,3 +12,6 @@ fi
 # clone cleep core repo
 /usr/local/bin/cleep-cli coreget; /bin/true
 
+# pre-build new application template
+/usr/local/bin/cleep-cli modcreate --module "devtplskel" && python3 /usr/lib/python3/dist-packages/cleep/modules/developer/apptemplate.py "/root/cleep/modules/devtplskel" "/etc/cleep/developer.template.json"
+rm -rf "/root/cleep/modules/devtplskel"; /bin/true
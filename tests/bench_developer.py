@@ -0,0 +1,343 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Developer module benchmarks
+
+Measure latency, events throughput and memory of developer command paths using a fake
+cleep-cli (see fakecli.py), so it runs offline on any board or workstation.
+
+Usage:
+    python3 bench_developer.py [--iterations 20] [--latency 0.05] [--lines 50]
+                               [--save-baseline bench_baseline.json]
+                               [--compare bench_baseline.json] [--tolerance 0.2]
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import resource
+import tempfile
+import unittest
+import subprocess
+import tracemalloc
+from unittest.mock import Mock
+
+sys.path.append("../")
+from backend.developer import Developer
+from backend.modulecatalog import ModuleCatalog
+from backend.runhistory import RunHistory
+from backend.coveragestore import CoverageStore
+from cleep.libs.tests import session
+
+FAKECLI_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fakecli.py")
+MODULE_NAME = "dummy"
+
+
+def percentile(values, percent):
+    """
+    Compute percentile of specified values (nearest rank)
+
+    Args:
+        values (list): list of values
+        percent (int): percentile to compute (0-100)
+
+    Returns:
+        float: percentile value or 0.0 if no value
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(percent / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class DeveloperBenchmark(unittest.TestCase):
+    """
+    Benchmark runner. It inherits from TestCase to reuse Cleep test session
+    """
+
+    ENTRY_POINTS = [
+        "check_application",
+        "build_application",
+        "launch_tests",
+        "generate_documentation",
+        "sync",
+    ]
+
+    def __init__(self, iterations, latency, lines):
+        unittest.TestCase.__init__(self)
+        self.iterations = iterations
+        os.environ["FAKECLI_LATENCY"] = str(latency)
+        os.environ["FAKECLI_LINES"] = str(lines)
+        self.session = None
+        self.module = None
+        self.cleep_path = None
+
+    def runTest(self):
+        """
+        Unused, required by TestCase
+        """
+
+    def setup_module(self):
+        """
+        Setup developer module with fake cli
+        """
+        self.session = session.TestSession(self)
+        self.module = self.session.setup(Developer)
+        self.module._Developer__start_watcher = Mock()
+        self.module._Developer__stop_watcher = Mock()
+
+        fake_cli = f"{sys.executable} {FAKECLI_PATH}"
+        self.module.CLI = fake_cli
+        self.module.CLI_SYNC_MODULE_CMD = fake_cli + " modsync --module=%s"
+
+        # fake module tree for parameters validation
+        self.cleep_path = tempfile.mkdtemp()
+        module_dir = os.path.join(self.cleep_path, "modules", MODULE_NAME)
+        os.makedirs(module_dir)
+        with open(os.path.join(module_dir, MODULE_NAME + ".py"), "w") as fd:
+            fd.write("# dummy module\n")
+        self.module.cleep_path = self.cleep_path
+        self.module._Developer__catalog = ModuleCatalog(
+            os.path.join(self.cleep_path, "modules")
+        )
+        self.module._Developer__run_history = RunHistory(
+            os.path.join(self.cleep_path, "runs")
+        )
+        self.module.PATH_COVERAGE_SUMMARY = os.path.join(
+            self.cleep_path, "coverage", "%(MODULE_NAME)s.json"
+        )
+
+        # fake cli durations must not be learned by module installed on device
+        self.module.PATH_TIMEOUTS_HISTORY = os.path.join(
+            self.cleep_path, "developer.timeouts.json"
+        )
+        self.module.PATH_APP_TEMPLATE = os.path.join(
+            self.cleep_path, "developer.template.json"
+        )
+        self.module.PATH_COVERAGE_HISTORY = os.path.join(
+            self.cleep_path, "developer.coverage.db"
+        )
+        self.module._Developer__coverage_store = CoverageStore(
+            self.module.PATH_COVERAGE_HISTORY
+        )
+        self.module.PATH_DOC_CACHE = os.path.join(self.cleep_path, "docs")
+        self.module.PATH_PROFILES = os.path.join(self.cleep_path, "profiles")
+        self.session.start_module(self.module)
+
+    def teardown_module(self):
+        """
+        Clean benchmark resources
+        """
+        if self.session:
+            self.session.clean()
+        if self.cleep_path:
+            shutil.rmtree(self.cleep_path, ignore_errors=True)
+
+    def __wait_tests_end(self, timeout=60.0):
+        start = time.time()
+        while self.module._Developer__tests_task is not None:
+            if time.time() - start > timeout:
+                raise Exception("Tests task did not end in time")
+            time.sleep(0.005)
+
+    def __run_entry_point(self, entry_point):
+        if entry_point == "check_application":
+            self.module.check_application(MODULE_NAME)
+        elif entry_point == "build_application":
+            self.module.build_application(MODULE_NAME)
+        elif entry_point == "launch_tests":
+            self.module.launch_tests(MODULE_NAME)
+            self.__wait_tests_end()
+        elif entry_point == "generate_documentation":
+            self.module.generate_documentation(MODULE_NAME)
+        elif entry_point == "sync":
+            self.module._Developer__run_sync(MODULE_NAME)
+
+    def __events_count(self):
+        return sum(
+            self.session.event_call_count(event_name)
+            for event_name in (
+                "developer.tests.output",
+                "developer.docs.output",
+                "developer.frontend.restart",
+            )
+        )
+
+    def bench_entry_point(self, entry_point):
+        """
+        Benchmark specified entry point
+
+        Args:
+            entry_point (str): entry point name
+
+        Returns:
+            dict: entry point measures
+        """
+        durations = []
+        events_before = self.__events_count()
+        tracemalloc.start()
+        start = time.perf_counter()
+        for _ in range(self.iterations):
+            iteration_start = time.perf_counter()
+            self.__run_entry_point(entry_point)
+            durations.append(time.perf_counter() - iteration_start)
+        total = time.perf_counter() - start
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        events = self.__events_count() - events_before
+
+        return {
+            "iterations": self.iterations,
+            "p50": percentile(durations, 50),
+            "p95": percentile(durations, 95),
+            "p99": percentile(durations, 99),
+            "max": max(durations),
+            "events_per_second": events / total if total else 0.0,
+            "peak_memory_kb": peak_memory / 1024.0,
+        }
+
+    def run_all(self, entry_points=None):
+        """
+        Run benchmarks
+
+        Args:
+            entry_points (list): entry points to bench. All if None
+
+        Returns:
+            dict: measures by entry point
+        """
+        results = {}
+        self.setup_module()
+        try:
+            for entry_point in entry_points or self.ENTRY_POINTS:
+                results[entry_point] = self.bench_entry_point(entry_point)
+        finally:
+            self.teardown_module()
+        results["_process"] = {
+            "maxrss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            "children_maxrss_kb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+            "import_ms": measure_import_time(),
+        }
+
+        return results
+
+
+def measure_import_time():
+    """
+    Measure self import time of developer backend modules (excluding Cleep core)
+
+    Returns:
+        float: import time (milliseconds)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import backend.developer"],
+        cwd=os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    backend_us = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip().startswith("backend"):
+            backend_us += int(parts[0].split(":")[1].strip())
+    return backend_us / 1000.0
+
+
+def compare_to_baseline(results, baseline, tolerance):
+    """
+    Compare results to baseline
+
+    Args:
+        results (dict): current results
+        baseline (dict): baseline results
+        tolerance (float): allowed relative regression (0.2 for 20%)
+
+    Returns:
+        list: list of regressions messages
+    """
+    regressions = []
+    for entry_point, measures in results.items():
+        if entry_point.startswith("_") or entry_point not in baseline:
+            continue
+        for measure in ("p50", "p95", "peak_memory_kb"):
+            reference = baseline[entry_point].get(measure)
+            if not reference:
+                continue
+            if measures[measure] > reference * (1.0 + tolerance):
+                regressions.append(
+                    f"{entry_point}.{measure}: {measures[measure]:.4f} > {reference:.4f} (+{tolerance * 100:.0f}%)"
+                )
+
+    return regressions
+
+
+def print_results(results):
+    """
+    Print results table
+
+    Args:
+        results (dict): benchmark results
+    """
+    print(
+        f"{'entry point':<24}{'p50 (s)':>10}{'p95 (s)':>10}{'p99 (s)':>10}{'events/s':>12}{'peak (KB)':>12}"
+    )
+    for entry_point, measures in results.items():
+        if entry_point.startswith("_"):
+            continue
+        print(
+            f"{entry_point:<24}{measures['p50']:>10.4f}{measures['p95']:>10.4f}{measures['p99']:>10.4f}"
+            f"{measures['events_per_second']:>12.1f}{measures['peak_memory_kb']:>12.1f}"
+        )
+    print(f"process maxrss: {results['_process']['maxrss_kb']} KB")
+    print(f"backend import time: {results['_process']['import_ms']:.1f} ms")
+
+
+def main():
+    """
+    Benchmark entry point
+
+    Returns:
+        int: 0 if no regression detected, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(description="Developer module benchmarks")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake cli latency (seconds)")
+    parser.add_argument("--lines", type=int, default=50, help="Fake cli output lines")
+    parser.add_argument("--entry-point", action="append", dest="entry_points")
+    parser.add_argument("--save-baseline", help="Save results to specified file")
+    parser.add_argument("--compare", help="Compare results to specified baseline file")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    benchmark = DeveloperBenchmark(args.iterations, args.latency, args.lines)
+    results = benchmark.run_all(args.entry_points)
+    print_results(results)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as fd:
+            json.dump(results, fd, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if args.compare:
+        with open(args.compare) as fd:
+            baseline = json.load(fd)
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Fake cleep-cli used by benchmarks and load tests
+
+It simulates command latency and output volume without touching the device. Behavior is
+configured through environment variables:
+
+    - FAKECLI_LATENCY (float): seconds to wait before answering (default 0.05)
+    - FAKECLI_LINES (int): number of output lines for streaming commands (default 50)
+    - FAKECLI_RETURNCODE (int): command return code (default 0)
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+
+def get_module_name(args):
+    """
+    Return module name from command arguments
+
+    Args:
+        args (list): command arguments
+
+    Returns:
+        str: module name
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("command")
+    parser.add_argument("--module", default="dummy")
+    known, _ = parser.parse_known_args(args)
+    return known.module
+
+
+def check_output(lines):
+    """
+    Build check command output
+
+    Args:
+        lines (int): number of warnings to generate
+
+    Returns:
+        dict: check output
+    """
+    return {
+        "errors": [],
+        "warnings": [f"warning #{index}" for index in range(lines)],
+        "files": [],
+        "metadata": {},
+    }
+
+
+def doc_output(lines):
+    """
+    Build moddoc command output
+
+    Args:
+        lines (int): number of commands to generate
+
+    Returns:
+        dict: doc output
+    """
+    return {
+        f"command_{index}": {
+            "args": [
+                {
+                    "name": "arg",
+                    "type": "str",
+                    "optional": False,
+                    "default": None,
+                    "description": "an argument",
+                    "formats": [],
+                }
+            ],
+            "returns": [{"type": "dict", "description": "a result", "formats": []}],
+            "raises": [],
+        }
+        for index in range(lines)
+    }
+
+
+def main(args):
+    """
+    Fake cli entry point
+
+    Args:
+        args (list): command arguments
+
+    Returns:
+        int: return code
+    """
+    latency = float(os.environ.get("FAKECLI_LATENCY", "0.05"))
+    lines = int(os.environ.get("FAKECLI_LINES", "50"))
+    returncode = int(os.environ.get("FAKECLI_RETURNCODE", "0"))
+    command = args[0] if args else ""
+    module_name = get_module_name(args)
+
+    time.sleep(latency)
+
+    if command.startswith("modcheckbreakingchanges"):
+        print(json.dumps({"errors": [], "warnings": []}))
+    elif command == "modcheckdoc":
+        print(json.dumps({}))
+    elif command.startswith("modcheck"):
+        print(json.dumps(check_output(lines)))
+    elif command == "modbuild":
+        print(json.dumps({"package": f"/tmp/cleepapp_{module_name}.zip"}))
+    elif command == "moddoc":
+        print(json.dumps(doc_output(lines)))
+    elif command == "modapidocpath":
+        print(f"DOC_ARCHIVE=/tmp/{module_name}.zip")
+    elif command in ("modtests", "modtestscov", "modapidoc"):
+        for index in range(lines):
+            print(f"{command} output line {index}", flush=True)
+    elif command == "watch":
+        while True:
+            time.sleep(1.0)
+
+    return returncode
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,416 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Developer module load test
+
+Simulate several people using developer page of a shared board at the same time: each
+session calls developer commands (checks, tests, downloads) and follows events through
+a fake event bus with a bounded queue per client, as browsers do. A fake cleep-cli (see
+fakecli.py) is used so it runs offline on any board or workstation.
+
+Usage:
+    python3 load_developer.py [--sessions 5] [--requests 10] [--latency 0.05]
+                              [--lines 50] [--client-delay 0.0] [--queue-size 100]
+                              [--report load_report.json]
+"""
+
+import sys
+import json
+import time
+import queue
+import logging
+import argparse
+import threading
+
+sys.path.append("../")
+from bench_developer import DeveloperBenchmark, percentile, MODULE_NAME
+from cleep.exception import CommandError
+
+OUTPUT_EVENTS = {
+    "developer.tests.output": "tests",
+    "developer.docs.output": "docs",
+}
+
+
+class FakeBus:
+    """
+    Fake event bus delivering developer events to simulated clients
+
+    Each client has a bounded queue: events sent while queue of a slow client is full
+    are dropped for this client, like a saturated websocket.
+    """
+
+    def __init__(self, queue_size=100):
+        """
+        Constructor
+
+        Args:
+            queue_size (int): maximum number of events waiting in a client queue
+        """
+        self.queue_size = queue_size
+        self.__lock = threading.Lock()
+        self.__clients = []
+        self.__stats = {"published": 0, "delivered": 0, "dropped": 0}
+
+    def attach(self, dispatcher):
+        """
+        Publish on bus all events sent by specified dispatcher
+
+        Args:
+            dispatcher (EventDispatcher): developer events dispatcher
+        """
+        send = dispatcher._EventDispatcher__send
+
+        def send_and_publish(name, entry):
+            send(name, entry)
+            self.publish(name, entry[1])
+
+        dispatcher._EventDispatcher__send = send_and_publish
+
+    def subscribe(self):
+        """
+        Subscribe new client
+
+        Returns:
+            Queue: client events queue
+        """
+        client = queue.Queue(self.queue_size)
+        with self.__lock:
+            self.__clients.append(client)
+        return client
+
+    def publish(self, name, params):
+        """
+        Deliver event to all clients
+
+        Args:
+            name (str): event name
+            params (dict): event parameters
+        """
+        with self.__lock:
+            self.__stats["published"] += 1
+            for client in self.__clients:
+                try:
+                    client.put_nowait((name, params))
+                    self.__stats["delivered"] += 1
+                except queue.Full:
+                    self.__stats["dropped"] += 1
+
+    def get_stats(self):
+        """
+        Return bus statistics
+
+        Returns:
+            dict: published, delivered and dropped events counters
+        """
+        with self.__lock:
+            return dict(self.__stats)
+
+
+class SimulatedSession:
+    """
+    Simulated developer session: sends commands and follows output events
+
+    Output is followed as frontend does: events carry run id and sequence number, a
+    gap (events dropped by bus or coalesced output overflow) triggers resume_output.
+    """
+
+    def __init__(self, index, module, bus, actions, requests, client_delay):
+        """
+        Constructor
+
+        Args:
+            index (int): session index
+            module (Developer): developer module instance
+            bus (FakeBus): fake event bus
+            actions (list): actions to run, session starts at its index in list
+            requests (int): number of commands to send
+            client_delay (float): time to process an event (seconds)
+        """
+        self.index = index
+        self.module = module
+        self.actions = actions
+        self.requests = requests
+        self.client_delay = client_delay
+        self.events = bus.subscribe()
+        self.calls = []
+        self.received = 0
+        self.gaps = 0
+        self.__cursors = {
+            job: {"runid": None, "seq": -1} for job in OUTPUT_EVENTS.values()
+        }
+
+    def run(self):
+        """
+        Send session commands (session thread)
+        """
+        for request in range(self.requests):
+            action = self.actions[(self.index + request) % len(self.actions)]
+            start = time.perf_counter()
+            try:
+                self.run_action(action)
+                outcome = "ok"
+            except CommandError:
+                # expected under load (tests already running...)
+                outcome = "rejected"
+            except Exception:
+                logging.exception('Session %s: action "%s" failed', self.index, action)
+                outcome = "error"
+            self.calls.append((action, outcome, time.perf_counter() - start))
+
+    def run_action(self, action):
+        """
+        Run developer command
+
+        Args:
+            action (str): action name
+        """
+        if action == "check_application":
+            self.module.check_application(MODULE_NAME)
+        elif action == "launch_tests":
+            self.module.launch_tests(MODULE_NAME)
+        elif action == "get_output_range":
+            self.module.get_output_range("tests", -100, 100)
+        elif action == "download_application":
+            self.module.download_application()
+        elif action == "download_api_documentation":
+            self.module.download_api_documentation(MODULE_NAME)
+
+    def consume(self):
+        """
+        Process received events until None is received (consumer thread)
+        """
+        while True:
+            event = self.events.get()
+            if event is None:
+                return
+            if self.client_delay:
+                time.sleep(self.client_delay)
+            self.received += 1
+            name, params = event
+            if name in OUTPUT_EVENTS:
+                self.__follow_output(OUTPUT_EVENTS[name], params)
+
+    def __follow_output(self, job, params):
+        cursor = self.__cursors[job]
+        messages = params["messages"]
+        count = len(messages) if isinstance(messages, list) else 1
+        if params["runid"] != cursor["runid"]:
+            cursor["runid"] = params["runid"]
+            cursor["seq"] = -1
+        if params["seq"] - count + 1 > cursor["seq"] + 1:
+            self.gaps += 1
+            resumed = self.module.resume_output(job, cursor["runid"], cursor["seq"])
+            cursor["runid"] = resumed["runid"]
+            cursor["seq"] = max(cursor["seq"], resumed["seq"])
+        cursor["seq"] = max(cursor["seq"], params["seq"])
+
+
+class DeveloperLoadTest(DeveloperBenchmark):
+    """
+    Load test runner, it reuses benchmark module setup (fake cli, fake module tree)
+    """
+
+    ACTIONS = [
+        "check_application",
+        "launch_tests",
+        "download_application",
+        "get_output_range",
+        "download_api_documentation",
+    ]
+
+    def __init__(self, sessions, requests, latency, lines, client_delay, queue_size):
+        DeveloperBenchmark.__init__(self, requests, latency, lines)
+        self.sessions = sessions
+        self.requests = requests
+        self.client_delay = client_delay
+        self.queue_size = queue_size
+
+    def setup_module(self):
+        """
+        Setup developer module and build application once for downloads
+        """
+        DeveloperBenchmark.setup_module(self)
+        self.module.build_application(MODULE_NAME)
+
+    def __wait_idle(self, timeout=60.0):
+        """
+        Wait end of tests and docs jobs and of pending events
+        """
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            busy = (
+                self.module._Developer__tests_task is not None
+                or self.module._Developer__docs_task is not None
+                or self.module.get_event_stats()["pending"]
+            )
+            if not busy:
+                return
+            time.sleep(0.05)
+        raise Exception("Developer module did not become idle in time")
+
+    def run_load(self):
+        """
+        Run load test
+
+        Returns:
+            dict: load test report
+        """
+        self.setup_module()
+        try:
+            bus = FakeBus(self.queue_size)
+            bus.attach(self.module._Developer__dispatcher)
+            sessions = [
+                SimulatedSession(
+                    index,
+                    self.module,
+                    bus,
+                    self.ACTIONS,
+                    self.requests,
+                    self.client_delay,
+                )
+                for index in range(self.sessions)
+            ]
+            consumers = [
+                threading.Thread(target=session.consume, daemon=True)
+                for session in sessions
+            ]
+            runners = [threading.Thread(target=session.run) for session in sessions]
+            for consumer in consumers:
+                consumer.start()
+
+            start = time.perf_counter()
+            for runner in runners:
+                runner.start()
+            for runner in runners:
+                runner.join()
+            duration = time.perf_counter() - start
+            self.__wait_idle()
+
+            for session in sessions:
+                session.events.put(None)
+            for consumer in consumers:
+                consumer.join(60.0)
+
+            return self.__build_report(sessions, bus, duration)
+        finally:
+            self.teardown_module()
+
+    def __build_report(self, sessions, bus, duration):
+        calls = [call for session in sessions for call in session.calls]
+        actions = {}
+        for action in self.ACTIONS:
+            action_calls = [call for call in calls if call[0] == action]
+            outcomes = [call[1] for call in action_calls]
+            latencies = [call[2] for call in action_calls]
+            actions[action] = {
+                "count": len(action_calls),
+                "ok": outcomes.count("ok"),
+                "rejected": outcomes.count("rejected"),
+                "errors": outcomes.count("error"),
+                "p50": percentile(latencies, 50),
+                "p95": percentile(latencies, 95),
+                "p99": percentile(latencies, 99),
+                "max": max(latencies) if latencies else 0.0,
+            }
+
+        dispatcher_stats = self.module.get_event_stats()["events"].values()
+        completed = len([call for call in calls if call[1] != "error"])
+        return {
+            "sessions": self.sessions,
+            "requests": len(calls),
+            "duration": duration,
+            "throughput": completed / duration if duration else 0.0,
+            "actions": actions,
+            "events": dict(
+                bus.get_stats(),
+                received=sum(session.received for session in sessions),
+                coalesced=sum(stats["coalesced"] for stats in dispatcher_stats),
+                droppedlines=sum(stats["dropped"] for stats in dispatcher_stats),
+                gaps=sum(session.gaps for session in sessions),
+            ),
+        }
+
+
+def print_report(report):
+    """
+    Print load test report
+
+    Args:
+        report (dict): load test report
+    """
+    print(
+        f"{report['sessions']} sessions, {report['requests']} requests in "
+        f"{report['duration']:.2f}s ({report['throughput']:.1f} requests/s)"
+    )
+    print(
+        f"{'action':<28}{'count':>7}{'ok':>6}{'rejected':>10}{'errors':>8}"
+        f"{'p50 (s)':>10}{'p95 (s)':>10}{'max (s)':>10}"
+    )
+    for action, measures in report["actions"].items():
+        print(
+            f"{action:<28}{measures['count']:>7}{measures['ok']:>6}"
+            f"{measures['rejected']:>10}{measures['errors']:>8}"
+            f"{measures['p50']:>10.4f}{measures['p95']:>10.4f}{measures['max']:>10.4f}"
+        )
+    events = report["events"]
+    print(
+        f"events: {events['published']} published, {events['delivered']} delivered, "
+        f"{events['dropped']} dropped by bus, {events['coalesced']} coalesced, "
+        f"{events['droppedlines']} output lines dropped, {events['gaps']} output gaps "
+        "resumed"
+    )
+
+
+def main():
+    """
+    Load test entry point
+
+    Returns:
+        int: 0 if no command failed unexpectedly, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(description="Developer module load test")
+    parser.add_argument("--sessions", type=int, default=5, help="Simulated sessions")
+    parser.add_argument(
+        "--requests", type=int, default=10, help="Requests per session"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="Fake cli latency (seconds)"
+    )
+    parser.add_argument("--lines", type=int, default=50, help="Fake cli output lines")
+    parser.add_argument(
+        "--client-delay",
+        type=float,
+        default=0.0,
+        help="Client event processing time (seconds)",
+    )
+    parser.add_argument(
+        "--queue-size", type=int, default=100, help="Client events queue size"
+    )
+    parser.add_argument("--report", help="Save report to specified file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    load_test = DeveloperLoadTest(
+        args.sessions,
+        args.requests,
+        args.latency,
+        args.lines,
+        args.client_delay,
+        args.queue_size,
+    )
+    report = load_test.run_load()
+    print_report(report)
+
+    if args.report:
+        with open(args.report, "w") as fd:
+            json.dump(report, fd, indent=2)
+        print(f"Report saved to {args.report}")
+
+    errors = sum(measures["errors"] for measures in report["actions"].values())
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+import unittest
+import logging
+import sys
+
+sys.path.append("../")
+from backend.adaptivetimeout import AdaptiveTimeout
+
+
+class TestAdaptiveTimeout(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.timeouts = AdaptiveTimeout({"modbuild": (60.0, 10.0, 100.0)})
+
+    def test_get_timeout_default(self):
+        self.timeouts.record("modbuild", 1.0, 100)
+
+        self.assertEqual(self.timeouts.get_timeout("modbuild"), 60.0)
+
+    def test_get_timeout_unhandled_command(self):
+        self.timeouts.record("unknown", 1.0, 100)
+
+        self.assertIsNone(self.timeouts.get_timeout("unknown"))
+        self.assertEqual(self.timeouts.to_dict(), {})
+
+    def _record(self, durations, module_size=100):
+        for duration in durations:
+            self.timeouts.record("modbuild", duration, module_size)
+
+    def test_get_timeout_learned(self):
+        self._record((4.0, 5.0, 6.0) * 4)
+
+        self.assertEqual(self.timeouts.get_timeout("modbuild", 100), 18.0)
+
+    def test_get_timeout_not_below_default_until_trusted(self):
+        self._record((4.0, 5.0, 6.0))
+        self.assertEqual(self.timeouts.get_timeout("modbuild", 100), 60.0)
+
+        self._record((25.0, 25.0, 25.0))
+        self.assertEqual(self.timeouts.get_timeout("modbuild", 100), 75.0)
+
+    def test_get_timeout_scaled_by_module_size(self):
+        self._record((4.0, 5.0, 6.0) * 4)
+
+        self.assertEqual(self.timeouts.get_timeout("modbuild", 200), 36.0)
+        self.assertEqual(self.timeouts.get_timeout("modbuild", 50), 18.0)
+
+    def test_get_timeout_bounds(self):
+        self._record((1.0,) * 10)
+        self.assertEqual(self.timeouts.get_timeout("modbuild", 100), 10.0)
+
+        self._record((50.0,) * 20)
+        self.assertEqual(self.timeouts.get_timeout("modbuild", 100), 100.0)
+
+    def test_record_kill_doubles_timeout(self):
+        self._record((1.0,) * 10)
+        self.assertEqual(self.timeouts.get_timeout("modbuild", 100), 10.0)
+
+        self.timeouts.record_kill("modbuild", 10.0, 100)
+        self.assertEqual(self.timeouts.get_timeout("modbuild", 100), 20.0)
+
+        self.timeouts.record_kill("modbuild", 20.0, 100)
+        self.assertEqual(self.timeouts.get_timeout("modbuild", 100), 40.0)
+
+    def test_record_kill_bounded_by_ceiling(self):
+        self.timeouts.record_kill("modbuild", 60.0, 100)
+
+        self.assertEqual(self.timeouts.get_timeout("modbuild", 100), 100.0)
+
+    def test_repeated_kills_reset_history(self):
+        self._record((1.0,) * 10)
+
+        for _ in range(AdaptiveTimeout.MAX_KILLS):
+            self.timeouts.record_kill("modbuild", 10.0, 100)
+
+        self.assertEqual(self.timeouts.to_dict(), {"modbuild": []})
+        self.assertEqual(self.timeouts.get_timeout("modbuild", 100), 60.0)
+
+    def test_success_stops_backoff(self):
+        self.timeouts.record_kill("modbuild", 60.0, 100)
+        self._record((1.0,) * 10)
+
+        self.assertEqual(self.timeouts.get_timeout("modbuild", 100), 10.0)
+
+    def test_record_kill_unhandled_command(self):
+        self.timeouts.record_kill("unknown", 10.0, 100)
+
+        self.assertEqual(self.timeouts.to_dict(), {})
+
+    def test_to_dict_from_dict(self):
+        self._record((4.0, 5.0, 6.0) * 4)
+        data = self.timeouts.to_dict()
+
+        timeouts = AdaptiveTimeout({"modbuild": (60.0, 10.0, 100.0)})
+        timeouts.from_dict(dict(data, unknown=[[1.0, 1]]))
+
+        self.assertEqual(timeouts.get_timeout("modbuild", 100), 18.0)
+        self.assertEqual(timeouts.to_dict(), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+import logging
+import sys
+import os
+import stat
+import tempfile
+import shutil
+
+sys.path.append("../")
+from backend.apptemplate import AppTemplate
+
+
+class TestAppTemplate(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.tmp_dir = tempfile.mkdtemp()
+        self.skeleton_path = os.path.join(self.tmp_dir, "devtplskel")
+        self.__write(
+            "backend/devtplskel.py", "class Devtplskel:\n    NAME = 'devtplskel'\n"
+        )
+        self.__write("frontend/devtplskel.config.js", "// DEVTPLSKEL config\n")
+        self.__write("scripts/preinst.sh", "#!/bin/sh\n", mode=0o755)
+        with open(os.path.join(self.skeleton_path, "icon.bin"), "wb") as fd:
+            fd.write(b"\xff\xd8devtplskel")
+        self.template = AppTemplate()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __write(self, path, content, mode=0o644):
+        path = os.path.join(self.skeleton_path, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as fd:
+            fd.write(content)
+        os.chmod(path, mode)
+
+    def __read(self, path):
+        with open(os.path.join(self.tmp_dir, "myapp", path)) as fd:
+            return fd.read()
+
+    def test_build(self):
+        template = self.template.build(self.skeleton_path)
+
+        self.assertEqual(template["version"], AppTemplate.VERSION)
+        self.assertEqual(
+            [entry["path"] for entry in template["files"]],
+            [
+                "icon.bin",
+                "backend/devtplskel.py",
+                "frontend/devtplskel.config.js",
+                "scripts/preinst.sh",
+            ],
+        )
+        self.assertIn("binary", template["files"][0])
+        self.assertTrue(self.template.loaded)
+
+    def test_render(self):
+        self.template.build(self.skeleton_path)
+        output_path = os.path.join(self.tmp_dir, "myapp")
+
+        files = self.template.render("myapp", output_path)
+
+        self.assertCountEqual(
+            files,
+            [
+                "icon.bin",
+                "backend/myapp.py",
+                "frontend/myapp.config.js",
+                "scripts/preinst.sh",
+            ],
+        )
+        self.assertEqual(
+            self.__read("backend/myapp.py"), "class Myapp:\n    NAME = 'myapp'\n"
+        )
+        self.assertEqual(self.__read("frontend/myapp.config.js"), "// MYAPP config\n")
+        mode = os.stat(os.path.join(output_path, "scripts/preinst.sh")).st_mode
+        self.assertTrue(mode & stat.S_IXUSR)
+        # binary files are copied as is
+        with open(os.path.join(output_path, "icon.bin"), "rb") as fd:
+            self.assertEqual(fd.read(), b"\xff\xd8devtplskel")
+
+    def test_render_not_loaded(self):
+        with self.assertRaises(Exception) as cm:
+            self.template.render("myapp", os.path.join(self.tmp_dir, "myapp"))
+        self.assertEqual(str(cm.exception), "Application template is not loaded")
+
+    def test_render_existing_output(self):
+        self.template.build(self.skeleton_path)
+
+        with self.assertRaises(Exception) as cm:
+            self.template.render("myapp", self.skeleton_path)
+        self.assertEqual(
+            str(cm.exception), f'Directory "{self.skeleton_path}" already exists'
+        )
+
+    def test_load(self):
+        template = AppTemplate().build(self.skeleton_path)
+
+        self.assertTrue(self.template.load(template))
+        self.assertTrue(self.template.loaded)
+
+    def test_load_outdated(self):
+        self.assertFalse(self.template.load({"version": 0, "files": []}))
+        self.assertFalse(self.template.load(None))
+        self.assertFalse(self.template.loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
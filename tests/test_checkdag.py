@@ -0,0 +1,98 @@
+import unittest
+import logging
+import sys
+import time
+import threading
+
+sys.path.append("../")
+from backend.checkdag import CheckDag
+
+
+class TestCheckDag(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+
+    def _fail(self):
+        raise Exception("check failed")
+
+    def test_run(self):
+        dag = CheckDag()
+        dag.add("first", lambda: 1)
+        dag.add("second", lambda: 2, ("first",))
+
+        results = dag.run()
+
+        self.assertEqual(list(results.keys()), ["first", "second"])
+        self.assertEqual(results["first"]["status"], "succeeded")
+        self.assertEqual(results["first"]["result"], 1)
+        self.assertIsNone(results["first"]["error"])
+        self.assertEqual(results["second"]["result"], 2)
+
+    def test_run_empty(self):
+        self.assertEqual(CheckDag().run(), {})
+
+    def test_failed_check_skips_dependents(self):
+        dag = CheckDag()
+        dag.add("backend", self._fail)
+        dag.add("frontend", lambda: "ok")
+        dag.add("breaking", lambda: "ok", ("backend",))
+        dag.add("doc", lambda: "ok", ("breaking",))
+
+        results = dag.run()
+        logging.debug("Results: %s" % results)
+
+        self.assertEqual(results["backend"]["status"], "failed")
+        self.assertEqual(results["backend"]["error"], "check failed")
+        self.assertIsNone(results["backend"]["result"])
+        self.assertEqual(results["frontend"]["status"], "succeeded")
+        self.assertEqual(results["breaking"]["status"], "skipped")
+        self.assertEqual(results["breaking"]["error"], 'Check "backend" did not succeed')
+        self.assertEqual(results["doc"]["status"], "skipped")
+        self.assertEqual(results["doc"]["error"], 'Check "breaking" did not succeed')
+
+    def test_independent_checks_run_in_parallel(self):
+        barrier = threading.Barrier(2, timeout=5.0)
+        dag = CheckDag(max_workers=2)
+        dag.add("first", barrier.wait)
+        dag.add("second", barrier.wait)
+
+        results = dag.run()
+
+        self.assertEqual(results["first"]["status"], "succeeded")
+        self.assertEqual(results["second"]["status"], "succeeded")
+
+    def test_dependent_check_waits_dependency(self):
+        calls = []
+
+        def first():
+            time.sleep(0.1)
+            calls.append("first")
+
+        dag = CheckDag(max_workers=2)
+        dag.add("first", first)
+        dag.add("second", lambda: calls.append("second"), ("first",))
+
+        dag.run()
+
+        self.assertEqual(calls, ["first", "second"])
+
+    def test_add_invalid(self):
+        dag = CheckDag()
+        dag.add("first", lambda: 1)
+
+        with self.assertRaises(ValueError) as cm:
+            dag.add("first", lambda: 1)
+        self.assertEqual(str(cm.exception), 'Check "first" already exists')
+
+        with self.assertRaises(ValueError) as cm:
+            dag.add("second", lambda: 1, ("unknown",))
+        self.assertEqual(
+            str(cm.exception), 'Check "second" depends on unknown check "unknown"'
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
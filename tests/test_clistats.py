@@ -0,0 +1,64 @@
+import unittest
+import logging
+import sys
+
+sys.path.append("../")
+from backend.clistats import CliStats
+
+
+class TestCliStats(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.stats = CliStats(history_size=5)
+
+    def test_record(self):
+        self.stats.record("modcheckbackend", 1.0, 0, output_bytes=10, cpu_time=0.5, peak_rss=100)
+        self.stats.record("modcheckbackend", 3.0, 1, output_bytes=5, cpu_time=0.5, peak_rss=50)
+        self.stats.record("modcheckbackend", 2.0, None, killed=True)
+
+        stats = self.stats.get_stats()
+        logging.debug("Stats: %s" % stats)
+
+        self.assertEqual(stats["modcheckbackend"]["count"], 3)
+        self.assertEqual(stats["modcheckbackend"]["failures"], 1)
+        self.assertEqual(stats["modcheckbackend"]["timeouts"], 1)
+        self.assertEqual(stats["modcheckbackend"]["outputbytes"], 15)
+        self.assertEqual(stats["modcheckbackend"]["cputime"], 1.0)
+        self.assertEqual(stats["modcheckbackend"]["peakrss"], 100)
+        self.assertEqual(stats["modcheckbackend"]["p50"], 2.0)
+        self.assertEqual(stats["modcheckbackend"]["p95"], 3.0)
+        self.assertNotIn("durations", stats["modcheckbackend"])
+
+    def test_history_size(self):
+        for duration in range(10):
+            self.stats.record("modbuild", float(duration), 0)
+
+        self.assertEqual(self.stats.get_durations("modbuild"), [5.0, 6.0, 7.0, 8.0, 9.0])
+        self.assertEqual(self.stats.get_stats()["modbuild"]["count"], 10)
+
+    def test_get_durations_successful_only(self):
+        self.stats.record("modbuild", 1.0, 0)
+        self.stats.record("modbuild", 2.0, 1)
+
+        self.assertEqual(self.stats.get_durations("modbuild"), [1.0])
+        self.assertEqual(self.stats.get_durations("modbuild", successful_only=False), [1.0, 2.0])
+        self.assertEqual(self.stats.get_durations("unknown"), [])
+
+    def test_percentile(self):
+        self.assertIsNone(CliStats.percentile([], 50))
+        self.assertEqual(CliStats.percentile([3.0, 1.0, 2.0], 50), 2.0)
+        self.assertEqual(CliStats.percentile([1.0], 95), 1.0)
+
+    def test_reset(self):
+        self.stats.record("modbuild", 1.0, 0)
+
+        self.stats.reset()
+
+        self.assertEqual(self.stats.get_stats(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+import unittest
+import logging
+import sys
+import os
+import tempfile
+import shutil
+import sqlite3
+
+sys.path.append("../")
+from backend.coveragestore import CoverageStore, parse_coverage_report
+
+REPORT = """
+Ran 12 tests in 0.345s
+
+OK
+Name                       Stmts   Miss  Cover   Missing
+--------------------------------------------------------
+backend/dummy.py              50     10    80%   12-20, 33
+backend/dummyevent.py          8      0   100%
+--------------------------------------------------------
+TOTAL                         58     10    83%
+""".split("\n")
+
+BRANCH_REPORT = """
+===== 3 passed in 0.12s =====
+Name                 Stmts   Miss Branch BrPart  Cover
+------------------------------------------------------
+backend/dummy.py        40      4     10      2  88.5%
+------------------------------------------------------
+TOTAL                   40      4     10      2  88.5%
+""".split("\n")
+
+
+def make_report(coverage, files):
+    return {
+        "files": {
+            path: {"statements": 10, "missing": 0, "coverage": file_coverage}
+            for (path, file_coverage) in files.items()
+        },
+        "total": {"statements": 10, "missing": 0, "coverage": coverage},
+        "tests": 3,
+    }
+
+
+class TestParseCoverageReport(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+
+    def test_parse(self):
+        report = parse_coverage_report(REPORT)
+
+        self.assertEqual(
+            report,
+            {
+                "files": {
+                    "backend/dummy.py": {
+                        "statements": 50,
+                        "missing": 10,
+                        "coverage": 80.0,
+                    },
+                    "backend/dummyevent.py": {
+                        "statements": 8,
+                        "missing": 0,
+                        "coverage": 100.0,
+                    },
+                },
+                "total": {"statements": 58, "missing": 10, "coverage": 83.0},
+                "tests": 12,
+            },
+        )
+
+    def test_parse_branch_report(self):
+        report = parse_coverage_report(BRANCH_REPORT)
+
+        self.assertEqual(
+            report["total"], {"statements": 40, "missing": 4, "coverage": 88.5}
+        )
+        self.assertEqual(report["tests"], 3)
+
+    def test_parse_no_report(self):
+        self.assertIsNone(parse_coverage_report(["Ran 1 test in 0.1s", "OK"]))
+
+
+class TestCoverageStore(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.tmp_dir = tempfile.mkdtemp()
+        self.store = CoverageStore(os.path.join(self.tmp_dir, "coverage.db"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_no_store(self):
+        self.assertEqual(self.store.get_trends("dummy"), [])
+        self.assertIsNone(self.store.get_file_deltas("dummy"))
+        self.assertFalse(os.path.exists(self.store.path))
+
+    def test_get_trends(self):
+        self.store.add_run("dummy", make_report(80.0, {}), 10.0, 0, "1.0.0")
+        self.store.add_run("other", make_report(50.0, {}), 1.0)
+        self.store.add_run("dummy", make_report(75.5, {}), 12.5, 1, "1.1.0")
+
+        trends = self.store.get_trends("dummy")
+
+        self.assertEqual(len(trends), 2)
+        self.assertEqual(trends[0]["version"], "1.0.0")
+        self.assertIsNone(trends[0]["coveragedelta"])
+        self.assertIsNone(trends[0]["durationdelta"])
+        self.assertEqual(trends[1]["version"], "1.1.0")
+        self.assertEqual(trends[1]["returncode"], 1)
+        self.assertEqual(trends[1]["tests"], 3)
+        self.assertEqual(trends[1]["coveragedelta"], -4.5)
+        self.assertEqual(trends[1]["durationdelta"], 2.5)
+        self.assertNotIn("module", trends[1])
+
+    def test_get_trends_limit(self):
+        for coverage in (10.0, 20.0, 30.0):
+            self.store.add_run("dummy", make_report(coverage, {}), 1.0)
+
+        trends = self.store.get_trends("dummy", limit=2)
+
+        self.assertEqual([trend["coverage"] for trend in trends], [20.0, 30.0])
+        # delta of oldest returned run is computed from previous stored run
+        self.assertEqual(trends[0]["coveragedelta"], 10.0)
+
+    def test_add_run_prunes_old_runs(self):
+        store = CoverageStore(os.path.join(self.tmp_dir, "pruned.db"), max_runs=2)
+        for coverage in (10.0, 20.0, 30.0):
+            store.add_run("dummy", make_report(coverage, {"a.py": coverage}), 1.0)
+        store.add_run("other", make_report(50.0, {"b.py": 50.0}), 1.0)
+
+        trends = store.get_trends("dummy")
+
+        self.assertEqual([trend["coverage"] for trend in trends], [20.0, 30.0])
+        self.assertEqual(len(store.get_trends("other")), 1)
+        connection = sqlite3.connect(store.path)
+        try:
+            run_ids = [row[0] for row in connection.execute("SELECT run_id FROM files")]
+        finally:
+            connection.close()
+        self.assertEqual(sorted(run_ids), [2, 3, 4])
+
+    def test_get_file_deltas(self):
+        first = self.store.add_run(
+            "dummy", make_report(80.0, {"a.py": 80.0, "b.py": 50.0}), 1.0
+        )
+        last = self.store.add_run(
+            "dummy", make_report(85.0, {"a.py": 90.0, "c.py": 100.0}), 1.0
+        )
+
+        deltas = self.store.get_file_deltas("dummy")
+
+        self.assertEqual(deltas["runid"], last)
+        self.assertEqual(deltas["referencerunid"], first)
+        self.assertEqual(
+            deltas["files"],
+            {
+                "a.py": {"coverage": 90.0, "reference": 80.0, "delta": 10.0},
+                "b.py": {"coverage": None, "reference": 50.0, "delta": None},
+                "c.py": {"coverage": 100.0, "reference": None, "delta": None},
+            },
+        )
+
+    def test_get_file_deltas_specific_runs(self):
+        first = self.store.add_run("dummy", make_report(80.0, {"a.py": 70.0}), 1.0)
+        second = self.store.add_run("dummy", make_report(80.0, {"a.py": 75.0}), 1.0)
+        self.store.add_run("dummy", make_report(80.0, {"a.py": 90.0}), 1.0)
+
+        deltas = self.store.get_file_deltas("dummy", second)
+        self.assertEqual(deltas["referencerunid"], first)
+        self.assertEqual(deltas["files"]["a.py"]["delta"], 5.0)
+
+        deltas = self.store.get_file_deltas("dummy", reference_run_id=first)
+        self.assertEqual(deltas["files"]["a.py"]["delta"], 20.0)
+
+    def test_get_file_deltas_first_run(self):
+        run_id = self.store.add_run("dummy", make_report(80.0, {"a.py": 70.0}), 1.0)
+
+        deltas = self.store.get_file_deltas("dummy")
+
+        self.assertEqual(deltas["runid"], run_id)
+        self.assertIsNone(deltas["referencerunid"])
+        self.assertEqual(
+            deltas["files"],
+            {"a.py": {"coverage": 70.0, "reference": None, "delta": None}},
+        )
+
+    def test_get_file_deltas_unknown_run(self):
+        self.store.add_run("dummy", make_report(80.0, {}), 1.0)
+
+        self.assertIsNone(self.store.get_file_deltas("other"))
+        self.assertIsNone(self.store.get_file_deltas("dummy", 666))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+import unittest
+import logging
+import sys
+import os
+import json
+import tempfile
+import shutil
+import subprocess
+import importlib.util
+
+sys.path.append("../")
+from backend import coveragesummary
+from backend.coveragesummary import (
+    get_ranges,
+    filter_summary,
+    read_summary,
+    write_summary,
+)
+
+SUMMARY = {
+    "timestamp": 1.0,
+    "files": {
+        "backend/module.py": {
+            "statements": 10,
+            "missing": 4,
+            "coverage": 60.0,
+            "missinglines": [[2, 3], [7, 8]],
+        },
+        "backend/moduleevent.py": {
+            "statements": 4,
+            "missing": 0,
+            "coverage": 100.0,
+            "missinglines": [],
+        },
+    },
+    "total": {"statements": 14, "missing": 4, "coverage": 71.43},
+}
+
+
+class TestCoverageSummary(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_get_ranges(self):
+        self.assertEqual(get_ranges([]), [])
+        self.assertEqual(get_ranges([5, 1, 2, 3, 8, 9]), [[1, 3], [5, 5], [8, 9]])
+
+    def test_filter_summary(self):
+        self.assertEqual(filter_summary(SUMMARY), SUMMARY)
+        self.assertEqual(
+            list(filter_summary(SUMMARY, max_coverage=99)["files"].keys()),
+            ["backend/module.py"],
+        )
+        self.assertEqual(
+            list(filter_summary(SUMMARY, pattern="*event.py")["files"].keys()),
+            ["backend/moduleevent.py"],
+        )
+        self.assertEqual(
+            filter_summary(SUMMARY, pattern="*event.py", max_coverage=99)["files"], {}
+        )
+        self.assertEqual(
+            filter_summary(SUMMARY, max_coverage=0)["total"], SUMMARY["total"]
+        )
+
+    def test_read_summary(self):
+        path = os.path.join(self.tmp_dir, "summary.json")
+        self.assertIsNone(read_summary(path))
+
+        with open(path, "w") as fd:
+            fd.write("{invalid")
+        self.assertIsNone(read_summary(path))
+
+        with open(path, "w") as fd:
+            json.dump(SUMMARY, fd)
+        self.assertEqual(read_summary(path), SUMMARY)
+
+    def test_write_summary_without_data(self):
+        output = os.path.join(self.tmp_dir, "summary.json")
+
+        self.assertFalse(
+            write_summary(
+                [os.path.join(self.tmp_dir, ".coverage")], self.tmp_dir, output
+            )
+        )
+        self.assertFalse(os.path.exists(output))
+
+    def test_script_never_fails(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                coveragesummary.__file__,
+                "--root",
+                self.tmp_dir,
+                "--output",
+                os.path.join(self.tmp_dir, "summary.json"),
+                "--data",
+                os.path.join(self.tmp_dir, ".coverage"),
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("No coverage data found", result.stderr)
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("coverage"), "coverage package is required"
+    )
+    def test_write_summary(self):
+        module_dir = os.path.join(self.tmp_dir, "module")
+        os.makedirs(os.path.join(module_dir, "backend"))
+        os.makedirs(os.path.join(module_dir, "tests"))
+        with open(os.path.join(module_dir, "backend", "module.py"), "w") as fd:
+            fd.write("def used():\n    return 1\n\ndef unused():\n    return 2\n")
+        with open(os.path.join(module_dir, "tests", "test_module.py"), "w") as fd:
+            fd.write("import sys\nsys.path.insert(0, '../backend')\n")
+            fd.write("import module\nmodule.used()\n")
+        subprocess.run(
+            [sys.executable, "-m", "coverage", "run", "test_module.py"],
+            cwd=os.path.join(module_dir, "tests"),
+            check=True,
+        )
+        output = os.path.join(self.tmp_dir, "coverage", "summary.json")
+
+        written = write_summary(
+            [
+                os.path.join(module_dir, ".coverage"),
+                os.path.join(module_dir, "tests", ".coverage"),
+            ],
+            module_dir,
+            output,
+        )
+
+        self.assertTrue(written)
+        summary = read_summary(output)
+        logging.debug("Summary: %s" % summary)
+        self.assertEqual(list(summary["files"].keys()), ["backend/module.py"])
+        self.assertEqual(
+            summary["files"]["backend/module.py"],
+            {
+                "statements": 4,
+                "missing": 1,
+                "coverage": 75.0,
+                "missinglines": [[5, 5]],
+            },
+        )
+        self.assertEqual(
+            summary["total"], {"statements": 4, "missing": 1, "coverage": 75.0}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,22 +1,36 @@
 import unittest
 import logging
 import sys
+import os
 import time
+import threading
+import json
+import shutil
+import tempfile
+import subprocess
 
 sys.path.append("../")
 from backend.developer import Developer
 from backend.developerdocsoutputevent import DeveloperDocsOutputEvent
 from backend.developertestsoutputevent import DeveloperTestsOutputEvent
 from backend.developerfrontendrestartevent import DeveloperFrontendRestartEvent
+from backend.outputlog import OutputLog
+from backend.developerfrontendassetsevent import DeveloperFrontendAssetsEvent
+from backend.eventdispatcher import EventDispatcher
+from backend.modulecatalog import ModuleCatalog
+from backend.runhistory import RunHistory
+from backend.coveragestore import CoverageStore
+from backend.docrenderer import DocRenderer
+from backend.developerperformancestatsevent import DeveloperPerformanceStatsEvent
+from backend.developerapplicationcreateevent import DeveloperApplicationCreateEvent
 from cleep.exception import (
     InvalidParameter,
     MissingParameter,
     CommandError,
-    Unauthorized,
 )
 from cleep.libs.tests import session
 from cleep.libs.tests.common import get_log_level
-from unittest.mock import Mock, DEFAULT, patch
+from unittest.mock import Mock, DEFAULT, patch, ANY
 
 LOG_LEVEL = get_log_level()
 
@@ -30,11 +44,42 @@ class TestDeveloper(unittest.TestCase):
         with open("test.log", "a") as fd:
             fd.write("%s\n" % self.id())
 
+        # installed modules tree
+        self.modules_path = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.modules_path, "dummy"))
+        with open(os.path.join(self.modules_path, "dummy", "dummy.py"), "w") as fd:
+            fd.write('class Dummy:\n    MODULE_VERSION = "1.2.3"\n')
+        self.runs_path = tempfile.mkdtemp()
+        self.data_path = tempfile.mkdtemp()
+
     def tearDown(self):
         self.session.clean()
+        shutil.rmtree(self.modules_path, ignore_errors=True)
+        shutil.rmtree(self.runs_path, ignore_errors=True)
+        shutil.rmtree(self.data_path, ignore_errors=True)
 
     def init(self, start_module=True):
         self.module = self.session.setup(Developer)
+        self.module._Developer__catalog = ModuleCatalog(self.modules_path)
+        self.module._Developer__run_history = RunHistory(self.runs_path)
+        self.module.PATH_COVERAGE_SUMMARY = os.path.join(
+            self.runs_path, "%(MODULE_NAME)s.coverage.json"
+        )
+        # never touch device persistent files
+        self.module.PATH_TIMEOUTS_HISTORY = os.path.join(
+            self.data_path, "developer.timeouts.json"
+        )
+        self.module.PATH_APP_TEMPLATE = os.path.join(
+            self.data_path, "developer.template.json"
+        )
+        self.module.PATH_COVERAGE_HISTORY = os.path.join(
+            self.data_path, "developer.coverage.db"
+        )
+        self.module._Developer__coverage_store = CoverageStore(
+            self.module.PATH_COVERAGE_HISTORY
+        )
+        self.module.PATH_DOC_CACHE = os.path.join(self.data_path, "docs")
+        self.module.PATH_PROFILES = os.path.join(self.data_path, "profiles")
         if start_module:
             self.session.start_module(self.module)
 
@@ -50,6 +95,22 @@ class TestDeveloper(unittest.TestCase):
 
         return my_mock
 
+    def make_stream_result(self, **kwargs):
+        result = {
+            "returncode": 0,
+            "documents": [],
+            "stdout": [],
+            "stderr": [],
+            "killed": False,
+            "stopped": False,
+            "truncated": False,
+            "error": None,
+            "outputsize": 10,
+            "usage": None,
+        }
+        result.update(kwargs)
+        return result
+
     def test_configure_moduleindev(self):
         self.init(False)
         self.module._get_config_field = Mock(
@@ -59,9 +120,14 @@ class TestDeveloper(unittest.TestCase):
         self.session.start_module(self.module)
 
         self.module.cleep_filesystem.enable_write.assert_called_with(
-            root=True, boot=True
+            root=True, boot=False
         )
 
+    def test_configure_no_moduleindev_keeps_ro(self):
+        self.init()
+
+        self.module.cleep_filesystem.enable_write.assert_not_called()
+
     def test_configure_add_device(self):
         self.init(False)
         devices = {
@@ -107,12 +173,29 @@ class TestDeveloper(unittest.TestCase):
     def test_on_start(self):
         self.init(False)
         self.module._Developer__start_watcher = Mock()
+        self.module._Developer__start_test_server = Mock()
+        self.module._get_config_field = Mock(
+            side_effect=self.mock_get_config_field({"moduleindev": "test"})
+        )
 
         self.session.start_module(self.module)
 
         self.assertTrue(self.module._Developer__start_watcher.called)
+        self.assertTrue(self.module._Developer__start_test_server.called)
 
-    def test_on_stop(self):
+    def test_on_start_dormant(self):
+        self.init(False)
+        self.module._Developer__start_watcher = Mock()
+        self.module._get_config_field = Mock(
+            side_effect=self.mock_get_config_field({"moduleindev": None})
+        )
+
+        self.session.start_module(self.module)
+
+        self.assertFalse(self.module._Developer__start_watcher.called)
+
+    @patch("backend.developer.kill_job")
+    def test_on_stop(self, kill_job_mock):
         self.init(False)
         self.module._Developer__watcher_task = Mock()
         self.module._Developer__tests_task = Mock()
@@ -127,16 +210,28 @@ class TestDeveloper(unittest.TestCase):
         self.assertTrue(self.module._Developer__watcher_task.stop.called)
         self.assertTrue(self.module._Developer__tests_task.stop.called)
         self.assertTrue(self.module._Developer__docs_task.stop.called)
+        for job in ("watcher", "tests", "docs"):
+            kill_job_mock.assert_any_call(job)
 
-    @patch("backend.developer.Console")
+    @patch("backend.developer.find_processes")
+    @patch("backend.developer.kill_tree")
+    @patch("backend.developer.kill_job")
     @patch("backend.developer.EndlessConsole")
-    def test_start_watcher(self, endless_console_mock, console_mock):
+    def test_start_watcher(
+        self, endless_console_mock, kill_job_mock, kill_tree_mock, find_processes_mock
+    ):
         self.init()
+        find_processes_mock.return_value = [666]
 
         self.module._Developer__start_watcher()
 
-        console_mock.return_value.command.assert_called()
+        kill_job_mock.assert_called_with("watcher")
+        find_processes_mock.assert_called_with("cleep-cli watch")
+        kill_tree_mock.assert_called_with([666])
         endless_console_mock.return_value.start.assert_called()
+        cmd = endless_console_mock.call_args[0][0]
+        self.assertIn("joblimits.py --job watcher --nice 5", cmd)
+        self.assertTrue(cmd.endswith(f"-- '{self.module.CLI_WATCHER_CMD}'"))
 
     def test_watcher_callback(self):
         self.init(False)
@@ -157,11 +252,23 @@ class TestDeveloper(unittest.TestCase):
         self.module.logger = Mock()
 
         self.session.start_module(self.module)
+        self.module._Developer__watcher_enabled = True
         self.module._Developer__watcher_end_callback(666, False)
 
         self.module.logger.error.assert_called()
         self.session.assert_event_called("developer.tests.output")
-        self.assertEqual(self.module._Developer__start_watcher.call_count, 2)
+        self.assertEqual(self.module._Developer__start_watcher.call_count, 1)
+
+    def test_watcher_end_callback_watcher_stopped(self):
+        self.init(False)
+        self.module._Developer__watcher_task = Mock()
+        self.module._Developer__start_watcher = Mock()
+
+        self.session.start_module(self.module)
+        self.module._Developer__watcher_enabled = False
+        self.module._Developer__watcher_end_callback(0, True)
+
+        self.module._Developer__start_watcher.assert_not_called()
 
     def test_get_module_devices(self):
         self.init(True)
@@ -176,6 +283,7 @@ class TestDeveloper(unittest.TestCase):
         self.init()
 
         self.module.restart_frontend()
+        self.module._Developer__frontend_assets.flush()
 
         self.session.assert_event_called("developer.frontend.restart")
 
@@ -191,8 +299,50 @@ class TestDeveloper(unittest.TestCase):
 
         self.module._Developer__set_module_debug.assert_any_call("test", False)
         self.module._Developer__set_module_debug.assert_any_call("dummy", True)
-        self.module.cleep_filesystem.enable_write.assert_any_call(root=True, boot=True)
+        self.module.cleep_filesystem.enable_write.assert_any_call(
+            root=True, boot=False
+        )
         self.module.cleep_filesystem.disable_write.assert_not_called()
+        self.assertEqual(self.module.get_filesystem_stats()["sessions"], ["watcher"])
+
+    def test_select_application_for_development_switch_tracks_frontend(self):
+        self.init()
+        self.module._get_config_field = Mock(
+            side_effect=self.mock_get_config_field({"moduleindev": "dummy"})
+        )
+        self.module._set_config_field = Mock()
+        self.module._Developer__set_module_debug = Mock()
+        self.module._Developer__start_watcher = Mock()
+        self.module._Developer__start_test_server = Mock()
+        self.module._Developer__frontend_assets = Mock()
+        self.module._Developer__watcher_enabled = True
+
+        self.module.select_application_for_development("other")
+
+        self.module._Developer__start_watcher.assert_not_called()
+        self.module._Developer__frontend_assets.track.assert_called_once_with(
+            self.module.PATH_MODULE_FRONTEND % {"MODULE_NAME": "other"}
+        )
+
+    def test_select_application_for_development_starts_watcher(self):
+        self.init()
+        self.module._get_config_field = Mock(
+            side_effect=self.mock_get_config_field({"moduleindev": None})
+        )
+        self.module._set_config_field = Mock()
+        self.module._Developer__set_module_debug = Mock()
+        self.module._Developer__start_watcher = Mock()
+        self.module._Developer__stop_watcher = Mock()
+        self.module._Developer__start_test_server = Mock()
+        self.module._Developer__stop_test_server = Mock()
+
+        self.module.select_application_for_development("dummy")
+        self.module.select_application_for_development(None)
+
+        self.module._Developer__start_watcher.assert_called_once()
+        self.module._Developer__stop_watcher.assert_called_once()
+        self.module._Developer__start_test_server.assert_called_once()
+        self.module._Developer__stop_test_server.assert_called_once()
 
     def test_select_application_for_development_disable_dev(self):
         self.init()
@@ -206,9 +356,23 @@ class TestDeveloper(unittest.TestCase):
 
         self.module._Developer__set_module_debug.assert_called_once()
         self.module.cleep_filesystem.enable_write.assert_not_called()
-        self.module.cleep_filesystem.disable_write.assert_called_with(
-            root=True, boot=True
+        # nothing was enabled, nothing to disable
+        self.module.cleep_filesystem.disable_write.assert_not_called()
+
+    def test_select_application_for_development_disable_dev_keeps_job_sessions(self):
+        self.init()
+        self.module._get_config_field = Mock(
+            side_effect=self.mock_get_config_field({"moduleindev": "test"})
         )
+        self.module._set_config_field = Mock()
+        self.module._Developer__set_module_debug = Mock()
+        self.module.select_application_for_development("test")
+        self.module._Developer__write_session.open("tests")
+
+        self.module.select_application_for_development(None)
+
+        self.assertEqual(self.module.get_filesystem_stats()["sessions"], ["tests"])
+        self.module.cleep_filesystem.disable_write.assert_not_called()
 
     def test_set_module_debug_enable(self):
         self.init()
@@ -259,6 +423,7 @@ class TestDeveloper(unittest.TestCase):
         self.module.logger.exception.assert_called_with("Unable to change debug status")
 
     @patch("backend.developer.Console")
+    @patch("backend.developer.os.path.exists", Mock(return_value=False))
     def test_create_application(self, console_mock):
         self.init()
         console_mock.return_value.command.return_value = {
@@ -266,62 +431,217 @@ class TestDeveloper(unittest.TestCase):
             "stdout": "stdout",
             "stderr": "stderr",
         }
+        self.module._Developer__load_app_template = Mock()
+        self.module._Developer__app_template = Mock()
+        self.module._Developer__app_template.render.return_value = ["test.py"]
+
+        self.module.create_application("test")
+        self.module._Developer__create_job.join()
+
+        self.module._Developer__app_template.render.assert_called_with(
+            "test", "/root/cleep/modules/test/"
+        )
+        commands = [
+            call[0][0] for call in console_mock.return_value.command.call_args_list
+        ]
+        self.assertTrue(
+            any(self.module.CLI_SYNC_MODULE_CMD % "test" in cmd for cmd in commands)
+        )
+        self.assertEqual(
+            self.session.event_call_count("developer.application.create"), 4
+        )
+        self.assertEqual(
+            self.session.get_last_event_params("developer.application.create"),
+            {"module": "test", "step": "done", "progress": 100, "error": None},
+        )
+
+    @patch("backend.developer.os.path.exists", Mock(return_value=False))
+    def test_create_application_exception(self):
+        self.init()
+        self.module._Developer__load_app_template = Mock(
+            side_effect=CommandError(
+                "Error during application creation. Check Cleep logs."
+            )
+        )
 
         self.module.create_application("test")
+        self.module._Developer__create_job.join()
+
+        self.assertEqual(
+            self.session.get_last_event_params("developer.application.create"),
+            {
+                "module": "test",
+                "step": "error",
+                "progress": 100,
+                "error": "Error during application creation. Check Cleep logs.",
+            },
+        )
+
+    def test_create_application_invalid_params(self):
+        self.init()
+
+        with self.assertRaises(MissingParameter) as cm:
+            self.module.create_application(None)
+        self.assertEqual(str(cm.exception), 'Parameter "module_name" is missing')
+
+        with patch("backend.developer.os.path.exists", return_value=True):
+            with self.assertRaises(InvalidParameter) as cm:
+                self.module.create_application("test")
+        self.assertEqual(str(cm.exception), 'Application "test" already exists')
+
+    @patch("backend.developer.os.path.exists", Mock(return_value=False))
+    def test_create_application_invalid_module_name(self):
+        self.init()
+        self.module._Developer__create_application = Mock()
+
+        for module_name in ("../../etc/x", "x; reboot", "Test", "1test", "te-st", 1):
+            with self.assertRaises(InvalidParameter) as cm:
+                self.module.create_application(module_name)
+            self.assertEqual(
+                str(cm.exception),
+                'Parameter "module_name" must contain only lowercase letters and '
+                "digits and start with a letter",
+            )
+
+        self.assertIsNone(self.module._Developer__create_job)
+        self.module._Developer__create_application.assert_not_called()
 
-        console_mock.return_value.command.assert_called()
+    @patch("backend.developer.os.path.exists", Mock(return_value=False))
+    def test_create_application_already_running(self):
+        self.init()
+        self.module._Developer__create_job = Mock()
+        self.module._Developer__create_job.is_alive.return_value = True
+
+        with self.assertRaises(CommandError) as cm:
+            self.module.create_application("test")
+        self.assertEqual(str(cm.exception), "Application creation is already running")
 
     @patch("backend.developer.Console")
-    def test_create_application_exception(self, console_mock):
+    def test_load_app_template_from_file(self, console_mock):
         self.init()
-        console_mock.return_value.command.return_value = {
-            "returncode": 1,
-            "stdout": "stdout",
-            "stderr": "stderr",
+        self.module.cleep_filesystem.read_json.return_value = {
+            "version": 1,
+            "files": [],
         }
 
-        with self.assertRaises(Exception) as cm:
-            self.module.create_application("test")
-        self.assertEqual(
-            str(cm.exception), "Error during application creation. Check Cleep logs."
+        with patch("backend.developer.os.path.exists", return_value=True):
+            self.module._Developer__load_app_template()
+            self.module._Developer__load_app_template()
+
+        self.module.cleep_filesystem.read_json.assert_called_once_with(
+            self.module.PATH_APP_TEMPLATE
         )
+        console_mock.return_value.command.assert_not_called()
 
+    @patch("backend.developer.shutil.rmtree")
     @patch("backend.developer.Console")
-    def test_cli_check(self, console_mock):
+    def test_load_app_template_build(self, console_mock, rmtree_mock):
         self.init()
         console_mock.return_value.command.return_value = {
             "returncode": 0,
-            "stdout": ['{"hello": "world"}'],
+            "stdout": "stdout",
             "stderr": "stderr",
         }
+        self.module._Developer__write_session = Mock()
 
-        result = self.module._Developer__cli_check("a command", "an error")
-        logging.debug("Result: %s" % result)
+        with patch("backend.developer.os.path.exists", return_value=False), patch(
+            "backend.developer.AppTemplate.build",
+            return_value={"version": 1, "files": []},
+        ):
+            self.module._Developer__load_app_template()
 
-        self.assertEqual(result, {"hello": "world"})
+        self.assertIn(
+            self.module.CLI_NEW_APPLICATION_CMD % (self.module.CLI, "devtplskel"),
+            console_mock.return_value.command.call_args[0][0],
+        )
+        rmtree_mock.assert_called_with(
+            "/root/cleep/modules/devtplskel/", ignore_errors=True
+        )
+        self.module._Developer__write_session.queue_write.assert_called_with(
+            self.module.PATH_APP_TEMPLATE, '{"version": 1, "files": []}'
+        )
 
+    @patch("backend.developer.shutil.rmtree")
     @patch("backend.developer.Console")
-    def test_cli_check_invalid_command_failed(self, console_mock):
+    def test_load_app_template_build_failed(self, console_mock, rmtree_mock):
         self.init()
         console_mock.return_value.command.return_value = {
             "returncode": 1,
-            "stdout": ['{"hello": "world"}'],
+            "stdout": "stdout",
             "stderr": "stderr",
         }
 
+        with patch("backend.developer.os.path.exists", return_value=False):
+            with self.assertRaises(CommandError) as cm:
+                self.module._Developer__load_app_template()
+        self.assertEqual(
+            str(cm.exception), "Error during application creation. Check Cleep logs."
+        )
+        self.assertEqual(rmtree_mock.call_count, 2)
+
+    @patch("backend.developer.stream_command")
+    def test_cli_check(self, stream_command_mock):
+        self.init()
+        stream_command_mock.return_value = self.make_stream_result(
+            documents=[{"hello": "world"}]
+        )
+
+        result = self.module._Developer__cli_check("a command", "an error")
+        logging.debug("Result: %s" % result)
+
+        self.assertEqual(result, {"hello": "world"})
+        stream_command_mock.assert_called_with(
+            "a command",
+            self.module.CLI_DEFAULT_TIMEOUT,
+            self.module.CLI_OUTPUT_MAX_SIZE,
+            nice=10,
+            memory=ANY,
+        )
+
+    @patch("backend.developer.stream_command")
+    def test_cli_check_invalid_command_failed(self, stream_command_mock):
+        self.init()
+        stream_command_mock.return_value = self.make_stream_result(
+            returncode=1, documents=[{"hello": "world"}]
+        )
+
         with self.assertRaises(CommandError) as cm:
             self.module._Developer__cli_check("a command", "an error")
 
         self.assertEqual(str(cm.exception), "an error")
 
-    @patch("backend.developer.Console")
-    def test_cli_check_invalid_json(self, console_mock):
+    @patch("backend.developer.stream_command")
+    def test_cli_check_invalid_json(self, stream_command_mock):
         self.init()
-        console_mock.return_value.command.return_value = {
-            "returncode": 0,
-            "stdout": ['{hello: "world"}'],
-            "stderr": "stderr",
-        }
+        stream_command_mock.return_value = self.make_stream_result(
+            returncode=-9, error="Expecting property name enclosed in double quotes"
+        )
+
+        with self.assertRaises(CommandError) as cm:
+            self.module._Developer__cli_check("a command", "an error")
+
+        self.assertEqual(
+            str(cm.exception), "Error parsing check result. Check Cleep logs"
+        )
+
+    @patch("backend.developer.stream_command")
+    def test_cli_check_output_too_large(self, stream_command_mock):
+        self.init()
+        stream_command_mock.return_value = self.make_stream_result(
+            returncode=-9, truncated=True
+        )
+
+        with self.assertRaises(CommandError) as cm:
+            self.module._Developer__cli_check("a command", "an error")
+
+        self.assertEqual(
+            str(cm.exception), "Error parsing check result. Check Cleep logs"
+        )
+
+    @patch("backend.developer.stream_command")
+    def test_cli_check_no_output(self, stream_command_mock):
+        self.init()
+        stream_command_mock.return_value = self.make_stream_result(stdout=["text"])
 
         with self.assertRaises(CommandError) as cm:
             self.module._Developer__cli_check("a command", "an error")
@@ -330,6 +650,19 @@ class TestDeveloper(unittest.TestCase):
             str(cm.exception), "Error parsing check result. Check Cleep logs"
         )
 
+    @patch("backend.developer.stream_command")
+    def test_cli_check_ndjson(self, stream_command_mock):
+        self.init()
+        stream_command_mock.return_value = self.make_stream_result(
+            documents=[{"file": "a.py"}, {"file": "b.py"}]
+        )
+
+        with self.assertRaises(CommandError) as cm:
+            self.module._Developer__cli_check("a command", "an error")
+        self.assertEqual(
+            str(cm.exception), "Error parsing check result. Check Cleep logs"
+        )
+
     def test_check_application(self):
         self.init()
         self.module._Developer__cli_check = Mock(return_value="result")
@@ -339,6 +672,7 @@ class TestDeveloper(unittest.TestCase):
             result = self.module.check_application("dummy")
             logging.debug("Result: %s" % result)
 
+        checks = result.pop("checks")
         self.assertEqual(
             result,
             {
@@ -347,9 +681,13 @@ class TestDeveloper(unittest.TestCase):
                 "scripts": "result",
                 "tests": "result",
                 "changelog": "result",
-                "breakingChanges": "result",
+                "breaking_changes": "result",
             },
         )
+        self.assertEqual(
+            {name: check["status"] for (name, check) in checks.items()},
+            {name: "succeeded" for name in result.keys()},
+        )
         self.assertEqual(self.module._Developer__cli_check.call_count, 6)
 
     def test_check_application_invalid_params(self):
@@ -365,28 +703,26 @@ class TestDeveloper(unittest.TestCase):
             self.module.check_application("")
         self.assertEqual(str(cm.exception), 'Parameter "module_name" is missing')
 
-    @patch("backend.developer.Console")
-    def test_build_application(self, console_mock):
+    @patch("backend.developer.stream_command")
+    def test_build_application(self, stream_command_mock):
         self.init()
-        console_mock.return_value.command.return_value = {
-            "returncode": 0,
-            "stdout": ['{"hello": "world"}'],
-            "stderr": "stderr",
-        }
+        stream_command_mock.return_value = self.make_stream_result(
+            documents=[{"package": "/tmp/cleepapp_dummy.zip"}]
+        )
 
-        try:
-            self.module.build_application("dummy")
-        except:
-            self.fail("It should not fails")
+        self.module.build_application("dummy")
 
-    @patch("backend.developer.Console")
-    def test_build_application_failed(self, console_mock):
+        self.assertEqual(
+            self.module._Developer__last_application_build,
+            {"package": "/tmp/cleepapp_dummy.zip"},
+        )
+
+    @patch("backend.developer.stream_command")
+    def test_build_application_failed(self, stream_command_mock):
         self.init()
-        console_mock.return_value.command.return_value = {
-            "returncode": 2,
-            "stdout": ['{"hello": "world"}'],
-            "stderr": "stderr",
-        }
+        stream_command_mock.return_value = self.make_stream_result(
+            returncode=2, documents=[{"hello": "world"}]
+        )
 
         with self.assertRaises(CommandError) as cm:
             self.module.build_application("dummy")
@@ -394,14 +730,12 @@ class TestDeveloper(unittest.TestCase):
             str(cm.exception), "Error building application. Check Cleep logs."
         )
 
-    @patch("backend.developer.Console")
-    def test_build_application_invalid_command_response(self, console_mock):
+    @patch("backend.developer.stream_command")
+    def test_build_application_invalid_command_response(self, stream_command_mock):
         self.init()
-        console_mock.return_value.command.return_value = {
-            "returncode": 0,
-            "stdout": ['{hello: "world"}'],
-            "stderr": "stderr",
-        }
+        stream_command_mock.return_value = self.make_stream_result(
+            error="Expecting property name enclosed in double quotes"
+        )
 
         with self.assertRaises(CommandError) as cm:
             self.module.build_application("dummy")
@@ -581,44 +915,1422 @@ class TestDeveloper(unittest.TestCase):
             self.module.download_api_documentation("dummy")
         self.assertEqual(str(cm.exception), "error")
 
+    @patch("backend.developer.Console")
+    def test_run_command_records_stats(self, console_mock):
+        self.init()
+        console_mock.return_value.command.return_value = {
+            "returncode": 0,
+            "killed": False,
+            "stdout": ['{"hello": "world"}'],
+            "stderr": [],
+        }
 
-class TestsDeveloperDocsOutputEvent(unittest.TestCase):
-    def setUp(self):
-        logging.basicConfig(
-            level=LOG_LEVEL,
-            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        self.module._Developer__cli_check(
+            self.module.CLI_CHECK_BACKEND_CMD % (self.module.CLI, "dummy"), "an error"
         )
-        self.session = session.TestSession(self)
-        self.event = self.session.setup_event(DeveloperDocsOutputEvent)
+        stats = self.module.get_performance_stats()
+        logging.debug("Stats: %s" % stats)
 
-    def test_event_params(self):
-        self.assertCountEqual(self.event.EVENT_PARAMS, ["messages"])
+        self.assertEqual(stats["modcheckbackend"]["count"], 1)
+        self.assertEqual(stats["modcheckbackend"]["failures"], 0)
+        self.assertEqual(stats["modcheckbackend"]["outputbytes"], 18)
+        self.assertIsNotNone(stats["modcheckbackend"]["p50"])
 
+    @patch("backend.developer.read_usage")
+    @patch("backend.developer.Console")
+    def test_run_command_records_own_usage(self, console_mock, read_usage_mock):
+        self.init()
+        console_mock.return_value.command.return_value = {
+            "returncode": 0,
+            "stdout": [],
+            "stderr": [],
+        }
+        read_usage_mock.return_value = {"cputime": 1.5, "maxrss": 2048}
 
-class TestsDeveloperTestsOutputEvent(unittest.TestCase):
-    def setUp(self):
-        logging.basicConfig(
-            level=LOG_LEVEL,
-            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        self.module._Developer__run_command(
+            self.module.CLI_BUILD_APP_CMD % (self.module.CLI, "dummy")
         )
-        self.session = session.TestSession(self)
-        self.event = self.session.setup_event(DeveloperTestsOutputEvent)
+        read_usage_mock.return_value = {"cputime": 0.5, "maxrss": 1024}
+        self.module._Developer__run_command(
+            self.module.CLI_BUILD_APP_CMD % (self.module.CLI, "dummy")
+        )
+        stats = self.module.get_performance_stats()
 
-    def test_event_params(self):
-        self.assertCountEqual(self.event.EVENT_PARAMS, ["messages"])
+        cmd = console_mock.return_value.command.call_args[0][0]
+        usage_path = read_usage_mock.call_args[0][0]
+        self.assertIn(f"--usage-file {usage_path}", cmd)
+        self.assertEqual(stats["modbuild"]["cputime"], 2.0)
+        self.assertEqual(stats["modbuild"]["peakrss"], 2048)
+
+    @patch("backend.developer.stream_command")
+    def test_run_json_command_records_own_usage(self, stream_command_mock):
+        self.init()
+        stream_command_mock.return_value = self.make_stream_result(
+            documents=[{"package": "/tmp/dummy.zip"}],
+            usage={"cputime": 1.5, "maxrss": 2048},
+        )
 
+        self.module.build_application("dummy")
+        stats = self.module.get_performance_stats()
 
-class TestsDeveloperFrontendRestartEvent(unittest.TestCase):
-    def setUp(self):
-        logging.basicConfig(
-            level=LOG_LEVEL,
-            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        self.assertEqual(stats["modbuild"]["cputime"], 1.5)
+        self.assertEqual(stats["modbuild"]["peakrss"], 2048)
+
+    @patch("backend.developer.find_processes")
+    @patch("backend.developer.kill_tree")
+    @patch("backend.developer.Console")
+    def test_run_command_records_timeout(
+        self, console_mock, kill_tree_mock, find_processes_mock
+    ):
+        self.init()
+        find_processes_mock.return_value = [666]
+        console_mock.return_value.command.return_value = {
+            "returncode": None,
+            "killed": True,
+            "stdout": [],
+            "stderr": [],
+        }
+
+        self.module._Developer__run_command(
+            self.module.CLI_BUILD_APP_CMD % (self.module.CLI, "dummy"), 1.0
         )
-        self.session = session.TestSession(self)
-        self.event = self.session.setup_event(DeveloperFrontendRestartEvent)
+        stats = self.module.get_performance_stats()
+
+        self.assertEqual(stats["modbuild"]["timeouts"], 1)
+        cmd, timeout = console_mock.return_value.command.call_args[0]
+        self.assertIn("joblimits.py --job cli", cmd)
+        self.assertIn(self.module.CLI_BUILD_APP_CMD % (self.module.CLI, "dummy"), cmd)
+        self.assertEqual(timeout, 1.0)
+        find_processes_mock.assert_called_with(
+            self.module.CLI + " modbuild --module dummy"
+        )
+        kill_tree_mock.assert_called_with([666])
 
-    def test_event_params(self):
-        self.assertCountEqual(self.event.EVENT_PARAMS, [])
+    @patch("backend.developer.EndlessConsole")
+    def test_start_endless_command_records_stats(self, endless_console_mock):
+        self.init()
+        callback = Mock()
+        end_callback = Mock()
+
+        self.module._Developer__start_endless_command(
+            self.module.CLI_TESTS_CMD % (self.module.CLI, "dummy"),
+            callback,
+            end_callback,
+            "tests",
+        )
+        output_callback = endless_console_mock.call_args[0][1]
+        command_end_callback = endless_console_mock.call_args[0][2]
+        output_callback("line", None)
+        command_end_callback(1, False)
+        stats = self.module.get_performance_stats()
+
+        callback.assert_called_with("line", None)
+        end_callback.assert_called_with(1, False)
+        self.assertEqual(stats["modtests"]["count"], 1)
+        self.assertEqual(stats["modtests"]["failures"], 1)
+        self.assertEqual(stats["modtests"]["outputbytes"], 4)
+
+    def test_set_performance_stats_interval(self):
+        self.init()
+        self.module._set_config_field = Mock()
+        self.module._Developer__start_stats_task = Mock()
+
+        self.module.set_performance_stats_interval(60)
+
+        self.module._set_config_field.assert_called_with("statsinterval", 60)
+        self.module._Developer__start_stats_task.assert_called()
+
+    def test_set_performance_stats_interval_invalid_params(self):
+        self.init()
+
+        with self.assertRaises(MissingParameter) as cm:
+            self.module.set_performance_stats_interval(None)
+        self.assertEqual(str(cm.exception), 'Parameter "interval" is missing')
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.set_performance_stats_interval(-1)
+        self.assertEqual(
+            str(cm.exception), 'Parameter "interval" must be a positive integer'
+        )
+
+    @patch("backend.developer.Task")
+    def test_start_stats_task(self, task_mock):
+        self.init()
+        self.module._get_config_field = Mock(
+            side_effect=self.mock_get_config_field({"statsinterval": 30})
+        )
+
+        self.module._Developer__start_stats_task()
+
+        task_mock.return_value.start.assert_called()
+
+    def test_send_performance_stats(self):
+        self.init()
+
+        self.module._Developer__send_performance_stats()
+
+        self.session.assert_event_called("developer.performance.stats")
+
+    @patch("backend.developer.EndlessConsole")
+    def test_launch_tests_profile(self, endless_console_mock):
+        self.init()
+        self.module._Developer__get_profile_path = Mock(return_value="/tmp/dummy.prof")
+
+        self.module.launch_tests("dummy", profile=True)
+
+        cmd = endless_console_mock.call_args[0][0]
+        self.assertIn('-m cProfile -o "/tmp/dummy.prof" -m pytest', cmd)
+        self.assertEqual(
+            self.module._Developer__tests_profile, ("dummy", "/tmp/dummy.prof")
+        )
+
+    @patch("backend.developer.get_hotspots")
+    def test_tests_end_callback_profile(self, get_hotspots_mock):
+        self.init()
+        get_hotspots_mock.return_value = [
+            {
+                "function": "func",
+                "file": "file.py",
+                "line": 1,
+                "calls": 1,
+                "tottime": 0.1,
+                "cumtime": 0.2,
+            }
+        ]
+        self.module._Developer__tests_task = Mock()
+        self.module._Developer__tests_profile = ("dummy", "/tmp/dummy.prof")
+
+        self.module._Developer__tests_end_callback(0, False)
+
+        self.assertEqual(self.session.event_call_count("developer.tests.output"), 3)
+        self.assertIsNone(self.module._Developer__tests_profile)
+        with patch("backend.developer.os.path.exists", return_value=True):
+            self.assertEqual(
+                self.module.download_profile("dummy"),
+                {"filepath": "/tmp/dummy.prof", "filename": "dummy.prof"},
+            )
+
+    def test_check_application_profile(self):
+        self.init()
+        self.module._Developer__cli_check = Mock(return_value="result")
+        self.module._Developer__get_profile_path = Mock(return_value="/tmp/dummy.prof")
+        self.module._Developer__merge_check_profiles = Mock(return_value="profile")
+
+        with patch("backend.developer.os.path.exists") as os_path_exists:
+            os_path_exists.return_value = True
+            result = self.module.check_application("dummy", profile=True)
+
+        self.assertEqual(result["profile"], "profile")
+        self.module._Developer__cli_check.assert_any_call(
+            self.module.CLI_CHECK_BACKEND_CMD % (self.module.CLI, "dummy"),
+            "Backend source code check failed",
+            profile_path="/tmp/dummy.prof.backend",
+            module_name="dummy",
+        )
+
+    @patch("backend.developer.stream_command")
+    def test_cli_check_profile(self, stream_command_mock):
+        self.init()
+        stream_command_mock.return_value = self.make_stream_result(
+            documents=[{"hello": "world"}]
+        )
+
+        self.module._Developer__cli_check(
+            "a command", "an error", profile_path="/tmp/dummy.prof"
+        )
+
+        stream_command_mock.assert_called_with(
+            'python3 -m cProfile -o "/tmp/dummy.prof" a command',
+            self.module.CLI_DEFAULT_TIMEOUT,
+            self.module.CLI_OUTPUT_MAX_SIZE,
+            nice=10,
+            memory=ANY,
+        )
+
+    def test_download_profile_no_profile(self):
+        self.init()
+
+        with self.assertRaises(CommandError) as cm:
+            self.module.download_profile("dummy")
+        self.assertEqual(
+            str(cm.exception),
+            "No profile available. Please run a profiled execution first",
+        )
+
+    @patch("backend.developer.stream_command")
+    def test_run_command_learned_timeout(self, stream_command_mock):
+        self.init()
+        stream_command_mock.return_value = self.make_stream_result(
+            documents=[{"package": "/tmp/dummy.zip"}]
+        )
+        self.module._Developer__get_module_size = Mock(return_value=10)
+        cmd = self.module.CLI_BUILD_APP_CMD % (self.module.CLI, "dummy")
+
+        self.module.build_application("dummy")
+        self.assertEqual(stream_command_mock.call_args[0][:2], (cmd, 60.0))
+
+        for _ in range(3):
+            self.module._Developer__timeouts.record("modbuild", 30.0, 10)
+        self.module.build_application("dummy")
+
+        self.assertEqual(stream_command_mock.call_args[0][:2], (cmd, 90.0))
+        timeouts = self.module.get_command_timeouts("dummy")
+        self.assertEqual(timeouts["modbuild"], 90.0)
+        self.assertEqual(timeouts["modcreate"], 10.0)
+
+    @patch("backend.developer.stream_command")
+    def test_run_command_killed_backs_off_timeout(self, stream_command_mock):
+        self.init()
+        stream_command_mock.return_value = self.make_stream_result(
+            returncode=None, killed=True
+        )
+        self.module._Developer__get_module_size = Mock(return_value=10)
+        cmd = self.module.CLI_BUILD_APP_CMD % (self.module.CLI, "dummy")
+
+        with self.assertRaises(CommandError):
+            self.module.build_application("dummy")
+        self.assertEqual(stream_command_mock.call_args[0][:2], (cmd, 60.0))
+
+        with self.assertRaises(CommandError):
+            self.module.build_application("dummy")
+        self.assertEqual(stream_command_mock.call_args[0][:2], (cmd, 120.0))
+
+    def test_load_timeouts_history(self):
+        self.init(False)
+        self.module.cleep_filesystem.read_json.return_value = {
+            "modbuild": [[1.0, 10], [1.0, 10], [100.0, 10]]
+        }
+
+        with patch("backend.developer.os.path.exists", return_value=True):
+            self.session.start_module(self.module)
+
+        self.assertEqual(self.module.get_command_timeouts()["modbuild"], 300.0)
+
+    def test_save_timeouts_history(self):
+        self.init()
+
+        self.module._on_stop()
+
+        self.module.cleep_filesystem.write_data.assert_called_with(
+            self.module.PATH_TIMEOUTS_HISTORY, "{}", encoding="utf-8"
+        )
+        self.module.cleep_filesystem.enable_write.assert_called_once_with(
+            root=True, boot=False
+        )
+        self.module.cleep_filesystem.disable_write.assert_called_once_with(
+            root=True, boot=False
+        )
+
+    def test_get_module_devices_cached(self):
+        self.init(True)
+        self.module._get_config_field = Mock(
+            side_effect=self.mock_get_config_field({})
+        )
+
+        devices = self.module.get_module_devices()
+        devices[list(devices.keys())[0]]["name"] = "changed"
+        devices_again = self.module.get_module_devices()
+
+        self.module._get_config_field.assert_not_called()
+        self.assertNotEqual(devices_again[list(devices.keys())[0]]["name"], "changed")
+        self.assertIsNotNone(self.module._Developer__developer_uuid)
+
+    def test_get_module_devices_cache_invalidated(self):
+        self.init(True)
+        devices = self.module.get_module_devices()
+        device_uuid = list(devices.keys())[0]
+        self.assertIsNotNone(self.module._Developer__devices_cache)
+
+        self.module._update_device(device_uuid, {"type": "developer", "name": "New"})
+        self.assertIsNone(self.module._Developer__devices_cache)
+        devices = self.module.get_module_devices()
+        self.assertEqual(devices[device_uuid]["name"], "New")
+
+        self.module._delete_device(device_uuid)
+        self.assertIsNone(self.module._Developer__devices_cache)
+
+    def test_configure_device_count_read_once(self):
+        self.init(False)
+        self.module._get_device_count = Mock(return_value=1)
+        self.module._add_device = Mock()
+
+        self.session.start_module(self.module)
+
+        self.assertEqual(self.module._get_device_count.call_count, 1)
+
+    @patch("backend.developer.Console")
+    def test_generate_documentation(self, console_mock):
+        self.init()
+        console_mock.return_value.command.side_effect = [
+            {
+                "returncode": 0,
+                "stdout": ['{"cmd": {"args": [], "returns": [], "raises": []}}'],
+                "stderr": [],
+            },
+            {"returncode": 0, "stdout": ["{}"], "stderr": []},
+        ]
+        self.module._Developer__get_module_source_hash = Mock(return_value="hash")
+        self.module._Developer__read_doc_cache = Mock(return_value=None)
+        self.module._Developer__write_doc_cache = Mock()
+
+        result = self.module.generate_documentation("dummy")
+        logging.debug("Result: %s" % result)
+
+        self.assertTrue(result["valid"])
+        self.assertEqual(result["etag"], "hash-%s" % DocRenderer.VERSION)
+        self.assertIn("Command cmd", result["html"])
+        self.module._Developer__write_doc_cache.assert_called_with("dummy", result)
+
+    @patch("backend.developer.Console")
+    def test_generate_documentation_cached(self, console_mock):
+        self.init()
+        etag = "hash-%s" % DocRenderer.VERSION
+        self.module._Developer__get_module_source_hash = Mock(return_value="hash")
+        self.module._Developer__read_doc_cache = Mock(
+            return_value={"valid": False, "etag": etag, "html": "<ul></ul>"}
+        )
+
+        result = self.module.generate_documentation("dummy")
+        not_modified = self.module.generate_documentation("dummy", etag)
+
+        console_mock.return_value.command.assert_not_called()
+        self.assertEqual(result, {"valid": False, "etag": etag, "html": "<ul></ul>"})
+        self.assertEqual(not_modified, {"valid": False, "etag": etag, "html": None})
+
+    @patch("backend.developer.Console")
+    def test_generate_documentation_failed(self, console_mock):
+        self.init()
+        console_mock.return_value.command.return_value = {
+            "returncode": 1,
+            "stdout": ["error"],
+            "stderr": [],
+        }
+        self.module._Developer__read_doc_cache = Mock(return_value=None)
+        self.module._Developer__write_doc_cache = Mock()
+
+        with self.assertRaises(CommandError) as cm:
+            self.module.generate_documentation("dummy")
+        self.assertEqual(str(cm.exception), "Unable to generate doc")
+        self.module._Developer__write_doc_cache.assert_not_called()
+
+    def test_get_output_range(self):
+        self.init()
+        self.module._Developer__tests_task = Mock()
+        for i in range(self.module.BUFFER_SIZE):
+            self.module._Developer__tests_callback("stdout", "stderr")
+
+        result = self.module.get_output_range("tests", 0, 3)
+        logging.debug("Result: %s" % result)
+
+        self.assertEqual(result["lines"], ["stdoutstderr"] * 3)
+        self.assertEqual(result["total"], self.module.BUFFER_SIZE)
+
+    @patch("backend.developer.EndlessConsole")
+    def test_get_output_range_new_run(self, endless_console_mock):
+        self.init()
+        self.module._Developer__send_tests_output(["old"])
+
+        self.module.launch_tests("dummy")
+        result = self.module.get_output_range("tests")
+
+        self.assertEqual(result["lines"], ["Tests execution started. Please wait..."])
+
+    def test_get_output_range_invalid_params(self):
+        self.init()
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.get_output_range("dummy")
+        self.assertEqual(
+            str(cm.exception), "Parameter \"job\" must be one of ['tests', 'docs']"
+        )
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.get_output_range("tests", "0")
+        self.assertEqual(str(cm.exception), 'Parameter "start" must be an integer')
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.get_output_range("tests", 0, 0)
+        self.assertEqual(
+            str(cm.exception), 'Parameter "count" must be a positive integer'
+        )
+
+    def test_check_applications(self):
+        self.init()
+        self.module.check_application = Mock(
+            side_effect=[{"backend": {"errors": []}}, {"backend": {"errors": ["error"]}}]
+        )
+        self.module._Developer__build_application = Mock(return_value={"package": "pkg"})
+
+        with patch("backend.developer.os.path.exists", return_value=True):
+            result = self.module.check_applications(["mod1", "mod2"], build=True)
+        logging.debug("Result: %s" % result)
+
+        self.assertEqual(result["succeeded"], 2)
+        self.assertEqual(result["failed"], 0)
+        self.assertCountEqual(result["modules"].keys(), ["mod1", "mod2"])
+        self.assertEqual(self.module._Developer__build_application.call_count, 1)
+        builds = [report["build"] for report in result["modules"].values()]
+        self.assertCountEqual(builds, [{"package": "pkg"}, None])
+
+    @patch("backend.developer.stream_command")
+    def test_check_applications_limits_cli_concurrency(self, stream_command_mock):
+        self.init()
+        lock = threading.Lock()
+        running = {"current": 0, "max": 0}
+
+        def run_check(*args, **kwargs):
+            with lock:
+                running["current"] += 1
+                running["max"] = max(running["max"], running["current"])
+            time.sleep(0.05)
+            with lock:
+                running["current"] -= 1
+            return self.make_stream_result(documents=[{"errors": []}])
+
+        stream_command_mock.side_effect = run_check
+
+        with patch("backend.developer.os.path.exists", return_value=True):
+            self.module.check_applications(["mod1", "mod2"])
+
+        self.assertEqual(stream_command_mock.call_count, 12)
+        self.assertLessEqual(running["max"], self.module.CLI_MAX_CONCURRENCY)
+
+    def test_check_applications_failure(self):
+        self.init()
+        self.module.check_application = Mock(side_effect=CommandError("Tests check failed"))
+
+        with patch("backend.developer.os.path.exists", return_value=True):
+            result = self.module.check_applications(["mod1"])
+
+        self.assertEqual(result["failed"], 1)
+        self.assertEqual(result["modules"]["mod1"]["error"], "Tests check failed")
+
+    def test_check_applications_cached(self):
+        self.init()
+        self.module._Developer__cli_check = Mock(return_value={"errors": []})
+        self.module._Developer__get_module_source_hash = Mock(return_value="hash")
+
+        with patch("backend.developer.os.path.exists", return_value=True):
+            self.module.check_application("mod1")
+            result = self.module.check_applications(["mod1"])
+            not_cached = self.module.check_applications(["mod1"], use_cache=False)
+
+        self.assertTrue(result["modules"]["mod1"]["cached"])
+        self.assertFalse(not_cached["modules"]["mod1"]["cached"])
+        self.assertEqual(self.module._Developer__cli_check.call_count, 12)
+
+    def test_check_applications_invalid_params(self):
+        self.init()
+
+        with self.assertRaises(MissingParameter) as cm:
+            self.module.check_applications([])
+        self.assertEqual(str(cm.exception), 'Parameter "module_names" is missing')
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.check_applications("mod1")
+        self.assertEqual(str(cm.exception), 'Parameter "module_names" must be a list')
+
+        with patch("backend.developer.os.path.exists", return_value=False):
+            with self.assertRaises(InvalidParameter) as cm:
+                self.module.check_applications(["mod1"])
+            self.assertEqual(str(cm.exception), 'Module "mod1" does not exist')
+
+    def test_run_pipeline(self):
+        self.init()
+        self.module.check_application = Mock(return_value={"backend": {"errors": []}})
+        self.module._Developer__run_tests = Mock(return_value={"returncode": 0, "output": []})
+        self.module.generate_documentation = Mock(return_value={"valid": True})
+        self.module._Developer__build_application = Mock(return_value={"package": "pkg"})
+
+        with patch("backend.developer.os.path.exists", return_value=True):
+            result = self.module.run_pipeline(["mod1"], use_cache=False)
+        logging.debug("Result: %s" % result)
+
+        self.assertTrue(result["success"])
+        self.assertTrue(result["modules"]["mod1"]["success"])
+        self.assertEqual(result["modules"]["mod1"]["build"], {"package": "pkg"})
+
+    def test_run_pipeline_tests_failed(self):
+        self.init()
+        self.module._Developer__run_tests = Mock(return_value={"returncode": 1, "output": []})
+        self.module._Developer__build_application = Mock()
+
+        with patch("backend.developer.os.path.exists", return_value=True):
+            result = self.module.run_pipeline(["mod1"], ["tests", "build"])
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["failed"], 0)
+        self.module._Developer__build_application.assert_not_called()
+
+    @patch("backend.developer.Console")
+    def test_run_tests(self, console_mock):
+        self.init()
+        console_mock.return_value.command.return_value = {
+            "returncode": 0,
+            "stdout": ["line%s" % i for i in range(100)],
+            "stderr": [],
+        }
+
+        result = self.module._Developer__run_tests("dummy")
+
+        self.assertEqual(result["returncode"], 0)
+        self.assertEqual(len(result["output"]), self.module.PIPELINE_OUTPUT_LINES)
+        self.assertEqual(result["output"][-1], "line99")
+
+    def test_run_tests_writes_coverage_summary(self):
+        self.init()
+        self.module._Developer__run_command = Mock(
+            return_value={"returncode": 0, "stdout": [], "stderr": []}
+        )
+
+        self.module._Developer__run_tests("dummy")
+
+        cmd = self.module._Developer__run_command.call_args[0][0]
+        self.assertTrue(
+            cmd.startswith(self.module.CLI_TESTS_CMD % (self.module.CLI, "dummy"))
+        )
+        self.assertIn(
+            self.module.PATH_COVERAGE_SUMMARY % {"MODULE_NAME": "dummy"}, cmd
+        )
+        self.assertIn("exit $RC", cmd)
+
+    def test_run_tests_opens_write_session(self):
+        self.init()
+        writable = []
+
+        def run_command(cmd, module_name=None):
+            writable.append(self.module.get_filesystem_stats()["writable"]["root"])
+            return {"returncode": 0, "stdout": [], "stderr": []}
+
+        self.module._Developer__run_command = Mock(side_effect=run_command)
+
+        self.module._Developer__run_tests("dummy")
+
+        self.assertEqual(writable, [True])
+        self.module.cleep_filesystem.enable_write.assert_called_with(
+            root=True, boot=False
+        )
+
+    def test_run_pipeline_invalid_params(self):
+        self.init()
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.run_pipeline(["mod1"], ["deploy"])
+        self.assertEqual(
+            str(cm.exception),
+            "Parameter \"steps\" must be a list of ['check', 'tests', 'doc', 'build']",
+        )
+
+    @patch("backend.developer.EndlessConsole")
+    def test_launch_tests_stores_run(self, endless_console_mock):
+        self.init()
+        self.module._Developer__coverage_store = Mock()
+        self.module._Developer__get_module_version = Mock(return_value="1.0.0")
+
+        self.module.launch_tests("dummy")
+        self.module._Developer__outputs["tests"].append(
+            [
+                "Ran 2 tests in 0.1s",
+                "Name               Stmts   Miss  Cover",
+                "backend/dummy.py      10      1    90%",
+                "TOTAL                 10      1    90%",
+            ]
+        )
+        self.module._Developer__tests_end_callback(0, False)
+
+        self.module._Developer__coverage_store.add_run.assert_called_once()
+        args = self.module._Developer__coverage_store.add_run.call_args[0]
+        self.assertEqual(args[0], "dummy")
+        self.assertEqual(
+            args[1]["total"], {"statements": 10, "missing": 1, "coverage": 90.0}
+        )
+        self.assertEqual(args[1]["tests"], 2)
+        self.assertEqual(args[3], 0)
+        self.assertEqual(args[4], "1.0.0")
+        self.assertIsNone(self.module._Developer__tests_run)
+
+    @patch("backend.developer.EndlessConsole")
+    def test_launch_tests_killed_not_stored(self, endless_console_mock):
+        self.init()
+        self.module._Developer__coverage_store = Mock()
+
+        self.module.launch_tests("dummy")
+        self.module._Developer__outputs["tests"].append("TOTAL   10   1   90%")
+        self.module._Developer__tests_end_callback(-9, True)
+
+        self.module._Developer__coverage_store.add_run.assert_not_called()
+
+    @patch("backend.developer.EndlessConsole")
+    def test_launch_tests_no_report_not_stored(self, endless_console_mock):
+        self.init()
+        self.module._Developer__coverage_store = Mock()
+
+        self.module.launch_tests("dummy")
+        self.module._Developer__tests_end_callback(1, False)
+
+        self.module._Developer__coverage_store.add_run.assert_not_called()
+
+    def test_get_coverage_trends(self):
+        self.init()
+        self.module._Developer__coverage_store = Mock()
+        self.module._Developer__coverage_store.get_trends.return_value = []
+
+        self.assertEqual(self.module.get_coverage_trends("dummy", 10), [])
+
+        self.module._Developer__coverage_store.get_trends.assert_called_with(
+            "dummy", 10
+        )
+
+    def test_get_coverage_trends_invalid_params(self):
+        self.init()
+
+        with self.assertRaises(MissingParameter) as cm:
+            self.module.get_coverage_trends("")
+        self.assertEqual(str(cm.exception), 'Parameter "module_name" is missing')
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.get_coverage_trends("dummy", 0)
+        self.assertEqual(
+            str(cm.exception), 'Parameter "limit" must be between 1 and 100'
+        )
+
+    def test_get_coverage_deltas(self):
+        self.init()
+        self.module._Developer__coverage_store = Mock()
+        self.module._Developer__coverage_store.get_file_deltas.return_value = {
+            "runid": 2,
+            "referencerunid": 1,
+            "files": {},
+        }
+
+        deltas = self.module.get_coverage_deltas("dummy", reference_run_id=1)
+
+        self.assertEqual(deltas["runid"], 2)
+        self.module._Developer__coverage_store.get_file_deltas.assert_called_with(
+            "dummy", None, 1
+        )
+
+    def test_get_coverage_deltas_no_run(self):
+        self.init()
+        self.module._Developer__coverage_store = Mock()
+        self.module._Developer__coverage_store.get_file_deltas.return_value = None
+
+        with self.assertRaises(CommandError) as cm:
+            self.module.get_coverage_deltas("dummy")
+        self.assertEqual(str(cm.exception), 'No tests run found for module "dummy"')
+
+        with self.assertRaises(MissingParameter):
+            self.module.get_coverage_deltas(None)
+
+    def test_get_module_version(self):
+        self.init()
+
+        self.assertEqual(self.module._Developer__get_module_version("dummy"), "1.2.3")
+        self.assertIsNone(self.module._Developer__get_module_version("unknown"))
+
+    def test_tests_output_rate_limited(self):
+        self.init()
+        self.module._Developer__dispatcher = EventDispatcher(rate=0.1, burst=1)
+        self.module._Developer__tests_task = Mock()
+
+        for index in range(3):
+            self.module._Developer__tests_callback(f"line{index}", None)
+        self.module._Developer__send_tests_output(["a", "b"])
+        self.module._Developer__send_tests_output(["c"])
+        self.module._Developer__tests_end_callback(0, False)
+
+        # first chunk sent, next ones coalesced and flushed before end of run message
+        self.assertEqual(self.session.event_call_count("developer.tests.output"), 3)
+        self.assertEqual(
+            self.session.get_last_event_params("developer.tests.output"),
+            {"messages": "===== Done =====", "runid": None, "seq": 6},
+        )
+        stats = self.module.get_event_stats()
+        self.assertEqual(stats["events"]["developer.tests.output"]["coalesced"], 1)
+        self.assertEqual(stats["pending"], [])
+
+    def test_restart_frontend_not_rate_limited(self):
+        self.init()
+        self.module._Developer__dispatcher = EventDispatcher(rate=0.1, burst=1)
+        self.module._Developer__send_tests_output(["a"])
+        self.module._Developer__send_tests_output(["b"])
+
+        self.module.restart_frontend()
+        self.module._Developer__frontend_assets.flush()
+
+        self.session.assert_event_called("developer.frontend.restart")
+        self.assertEqual(
+            self.module.get_event_stats()["pending"], ["developer.tests.output"]
+        )
+
+
+    def test_restart_frontend_coalesced(self):
+        self.init()
+        self.module._Developer__frontend_assets.quiet_period = 10.0
+
+        for _ in range(5):
+            self.module.restart_frontend()
+        self.assertEqual(self.session.event_call_count("developer.frontend.restart"), 0)
+        self.module._Developer__frontend_assets.flush()
+
+        self.assertEqual(self.session.event_call_count("developer.frontend.restart"), 1)
+        stats = self.module.get_frontend_restart_stats()
+        self.assertEqual(stats["notifications"], 5)
+        self.assertEqual(stats["sent"], 1)
+        self.assertFalse(stats["pending"])
+
+    def test_restart_frontend_assets_changed(self):
+        self.init()
+        self.module._get_config_field = Mock(
+            side_effect=self.mock_get_config_field({"moduleindev": "test"})
+        )
+        self.module._Developer__frontend_assets.quiet_period = 10.0
+
+        self.module.restart_frontend(["css/test.css"])
+        self.module.restart_frontend(["images/logo.png", "css/test.css"])
+        self.module._Developer__frontend_assets.flush()
+
+        self.assertEqual(self.session.event_call_count("developer.frontend.restart"), 0)
+        self.assertEqual(
+            self.session.get_last_event_params("developer.frontend.assets"),
+            {"module": "test", "files": ["css/test.css", "images/logo.png"]},
+        )
+
+    def test_restart_frontend_script_changed(self):
+        self.init()
+        self.module._Developer__frontend_assets.quiet_period = 10.0
+
+        self.module.restart_frontend(["css/test.css", "js/test.js"])
+        self.module._Developer__frontend_assets.flush()
+
+        self.session.assert_event_called("developer.frontend.restart")
+        self.assertEqual(self.session.event_call_count("developer.frontend.assets"), 0)
+
+    def test_restart_frontend_invalid_params(self):
+        self.init()
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.restart_frontend("test.css")
+        self.assertEqual(str(cm.exception), 'Parameter "files" must be a list')
+
+    def test_set_frontend_restart_quiet_period(self):
+        self.init()
+        self.module._set_config_field = Mock()
+
+        self.module.set_frontend_restart_quiet_period(0)
+        self.module.restart_frontend()
+
+        self.module._set_config_field.assert_called_with("restartquietperiod", 0.0)
+        self.session.assert_event_called("developer.frontend.restart")
+
+    def test_set_frontend_restart_quiet_period_invalid_params(self):
+        self.init()
+
+        with self.assertRaises(MissingParameter) as cm:
+            self.module.set_frontend_restart_quiet_period(None)
+        self.assertEqual(str(cm.exception), 'Parameter "quiet_period" is missing')
+
+        for quiet_period in (-1, 31, "1", True):
+            with self.assertRaises(InvalidParameter) as cm:
+                self.module.set_frontend_restart_quiet_period(quiet_period)
+            self.assertEqual(
+                str(cm.exception),
+                'Parameter "quiet_period" must be a number between 0 and 30.0',
+            )
+
+
+    @patch("backend.developer.kill_job")
+    def test_cancel_job(self, kill_job_mock):
+        self.init()
+        tests_task = Mock()
+        self.module._Developer__tests_task = tests_task
+        kill_job_mock.return_value = [666]
+
+        self.module.cancel_job("tests")
+
+        kill_job_mock.assert_called_with("tests")
+        tests_task.stop.assert_called()
+
+    def test_cancel_job_invalid_params(self):
+        self.init()
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.cancel_job("watcher")
+        self.assertEqual(
+            str(cm.exception), "Parameter \"job\" must be one of ['tests', 'docs']"
+        )
+
+        with self.assertRaises(CommandError) as cm:
+            self.module.cancel_job("docs")
+        self.assertEqual(str(cm.exception), 'No "docs" job is running')
+
+    @patch("backend.developer.kill_job")
+    def test_stop_job_kill_failed(self, kill_job_mock):
+        self.init()
+        kill_job_mock.side_effect = Exception("Test exception")
+        task = Mock()
+
+        self.module._Developer__stop_job("tests", task)
+
+        task.stop.assert_called()
+
+    @patch("backend.developer.EndlessConsole")
+    def test_launch_tests_limited(self, endless_console_mock):
+        self.init()
+
+        self.module.launch_tests("dummy")
+
+        cmd = endless_console_mock.call_args[0][0]
+        limits = self.module.JOB_LIMITS["tests"]
+        self.assertIn(
+            f"--job tests --nice {limits['nice']} --memory {limits['memory']} "
+            f"--wall-time {limits['walltime']} -- ",
+            cmd,
+        )
+
+
+    @patch("backend.developer.EndlessConsole")
+    def test_launch_tests_with_test_server(self, endless_console_mock):
+        self.init()
+        self.module._Developer__test_server_task = Mock()
+
+        self.module.launch_tests("dummy")
+
+        cmd = endless_console_mock.call_args[0][0]
+        self.assertIn("testserver.py", cmd)
+        self.assertIn(
+            '--cwd "/root/cleep/modules/dummy/tests/" '
+            '--source "/root/cleep/modules/dummy/backend"',
+            cmd,
+        )
+        self.assertIn(self.module.CLI_TESTS_CMD % (self.module.CLI, "dummy"), cmd)
+        self.assertEqual(self.module._Developer__tests_run[0], "dummy")
+
+    @patch("backend.developer.EndlessConsole")
+    def test_launch_tests_without_test_server(self, endless_console_mock):
+        self.init()
+
+        self.module.launch_tests("dummy")
+
+        cmd = endless_console_mock.call_args[0][0]
+        self.assertNotIn("testserver.py", cmd)
+        self.assertIn(self.module.CLI_TESTS_CMD % (self.module.CLI, "dummy"), cmd)
+
+    @patch("backend.developer.EndlessConsole")
+    def test_start_test_server(self, endless_console_mock):
+        self.init()
+
+        self.module._Developer__start_test_server()
+        self.module._Developer__start_test_server()
+
+        endless_console_mock.assert_called_once()
+        endless_console_mock.return_value.start.assert_called_once()
+        cmd = endless_console_mock.call_args[0][0]
+        self.assertIn("joblimits.py --job testserver", cmd)
+        self.assertIn(
+            f'--socket "{self.module.PATH_TEST_SERVER_SOCKET}" --serve', cmd
+        )
+
+    @patch("backend.developer.kill_job")
+    def test_stop_test_server(self, kill_job_mock):
+        self.init()
+        task = Mock()
+        self.module._Developer__test_server_task = task
+
+        self.module._Developer__stop_test_server()
+
+        kill_job_mock.assert_called_with("testserver")
+        task.stop.assert_called()
+        self.assertIsNone(self.module._Developer__test_server_task)
+
+    def test_test_server_end_callback(self):
+        self.init()
+        self.module._Developer__test_server_task = Mock()
+
+        self.module._Developer__test_server_end_callback(1, False)
+
+        self.assertIsNone(self.module._Developer__test_server_task)
+
+
+    def test_commands_validate_module_name(self):
+        self.init()
+        commands = (
+            self.module.launch_tests,
+            self.module.get_last_coverage_report,
+            self.module.build_application,
+            self.module.generate_api_documentation,
+            self.module.generate_documentation,
+            self.module.detect_breaking_changes,
+        )
+        self.module._Developer__start_endless_command = Mock()
+        self.module._Developer__run_command = Mock()
+        self.module._Developer__run_json_command = Mock()
+
+        for command in commands:
+            with self.assertRaises(InvalidParameter) as cm:
+                command("unknown")
+            self.assertEqual(str(cm.exception), 'Module "unknown" does not exist')
+            with self.assertRaises(MissingParameter):
+                command("")
+
+        self.module._Developer__start_endless_command.assert_not_called()
+        self.module._Developer__run_command.assert_not_called()
+        self.module._Developer__run_json_command.assert_not_called()
+
+    def test_module_source_hash_follows_changes(self):
+        self.init()
+        hash_before = self.module._Developer__get_module_source_hash("dummy")
+        with open(os.path.join(self.modules_path, "dummy", "extra.py"), "w") as fd:
+            fd.write("#" * 4096)
+
+        self.assertNotEqual(
+            self.module._Developer__get_module_source_hash("dummy"), hash_before
+        )
+        self.assertEqual(self.module._Developer__get_module_size("dummy"), 4)
+
+    def test_restart_frontend_invalidates_catalog(self):
+        self.init()
+        self.module._get_config_field = Mock(
+            side_effect=self.mock_get_config_field({"moduleindev": "dummy"})
+        )
+        self.module._Developer__catalog = Mock()
+        self.module._Developer__frontend_assets = Mock()
+
+        self.module.restart_frontend(["js/app.js"])
+
+        self.module._Developer__catalog.invalidate.assert_called_with("dummy")
+
+    def test_watcher_output_invalidates_catalog(self):
+        self.init()
+        self.module._get_config_field = Mock(
+            side_effect=self.mock_get_config_field({"moduleindev": "dummy"})
+        )
+        self.module._Developer__catalog = Mock()
+
+        self.module._Developer__watcher_callback("synced", "")
+
+        self.module._Developer__catalog.invalidate.assert_called_with("dummy")
+
+    def test_run_sync_invalidates_catalog(self):
+        self.init()
+        self.module._Developer__run_command = Mock()
+        self.module._Developer__catalog = Mock()
+
+        self.module._Developer__run_sync("dummy")
+
+        self.module._Developer__catalog.invalidate.assert_called_with("dummy")
+
+    def test_get_modules_catalog(self):
+        self.init()
+
+        catalog = self.module.get_modules_catalog()
+
+        self.assertEqual(len(catalog), 1)
+        self.assertEqual(catalog[0]["name"], "dummy")
+        self.assertEqual(catalog[0]["version"], "1.2.3")
+        self.assertEqual(catalog[0]["files"], ["dummy.py"])
+
+
+    @patch("backend.developer.EndlessConsole")
+    def test_launch_tests_kept_in_run_history(self, endless_console_mock):
+        self.init()
+
+        self.module.launch_tests("dummy")
+        self.module._Developer__tests_end_callback(0, False)
+        runs = self.module.get_runs("dummy")
+        logging.debug("Runs: %s" % runs)
+
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(runs[0]["job"], "tests")
+        self.assertEqual(runs[0]["status"], "succeeded")
+        self.assertEqual(runs[0]["runid"], self.module.get_output_range("tests")["runid"])
+        output = self.module.get_run_output(runs[0]["runid"])
+        self.assertEqual(
+            output["lines"],
+            ["Tests execution started. Please wait...", "===== Done ====="],
+        )
+        self.assertFalse(output["running"])
+
+    @patch("backend.developer.EndlessConsole")
+    def test_generate_api_documentation_kept_in_run_history(
+        self, endless_console_mock
+    ):
+        self.init()
+
+        self.module.generate_api_documentation("dummy")
+        self.module._Developer__docs_callback("line", None)
+        runs = self.module.get_runs(job="docs")
+
+        self.assertEqual(runs[0]["status"], "running")
+        self.assertEqual(
+            self.module.tail_run_output(runs[0]["runid"], 1)["lines"],
+            ["API documentation generation started. Please wait..."],
+        )
+
+        self.module._Developer__docs_end_callback(1, True)
+
+        self.assertEqual(self.module.get_runs(job="docs")[0]["status"], "killed")
+        self.assertEqual(
+            self.module.tail_run_output(runs[0]["runid"], 1)["lines"], ["line"]
+        )
+
+    @patch("backend.developer.stream_command")
+    def test_build_application_kept_in_run_history(self, stream_command_mock):
+        self.init()
+        stream_command_mock.return_value = self.make_stream_result(
+            documents=[{"package": "/tmp/cleepapp_dummy.zip"}],
+            stdout=['{"package": "/tmp/cleepapp_dummy.zip"}'],
+        )
+
+        self.module.build_application("dummy")
+        runs = self.module.get_runs("dummy", "build")
+
+        self.assertEqual(runs[0]["status"], "succeeded")
+        self.assertEqual(
+            self.module.get_run_output(runs[0]["runid"])["lines"],
+            ['{"package": "/tmp/cleepapp_dummy.zip"}'],
+        )
+
+    def test_get_runs_invalid_params(self):
+        self.init()
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.get_runs(job="check")
+        self.assertEqual(
+            str(cm.exception),
+            "Parameter \"job\" must be one of ['tests', 'docs', 'build']",
+        )
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.get_runs(limit=0)
+        self.assertEqual(
+            str(cm.exception), 'Parameter "limit" must be between 1 and 100'
+        )
+
+    def test_get_run_output_invalid_params(self):
+        self.init()
+
+        with self.assertRaises(MissingParameter) as cm:
+            self.module.get_run_output("")
+        self.assertEqual(str(cm.exception), 'Parameter "run_id" is missing')
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.get_run_output("tests-123")
+        self.assertEqual(str(cm.exception), 'Run "tests-123" does not exist')
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.get_run_output("tests-123", "0")
+        self.assertEqual(str(cm.exception), 'Parameter "start" must be an integer')
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.tail_run_output("tests-123", 0)
+        self.assertEqual(
+            str(cm.exception), 'Parameter "count" must be a positive integer'
+        )
+
+
+    @patch("backend.developer.EndlessConsole")
+    def test_tests_output_event_sequence(self, endless_console_mock):
+        self.init()
+
+        self.module.launch_tests("dummy")
+        run_id = self.module.get_output_range("tests")["runid"]
+        self.module._Developer__send_tests_output(["line1", "line2"])
+
+        self.assertEqual(
+            self.session.get_last_event_params("developer.tests.output"),
+            {"messages": ["line1", "line2"], "runid": run_id, "seq": 2},
+        )
+
+    @patch("backend.developer.EndlessConsole")
+    def test_resume_output(self, endless_console_mock):
+        self.init()
+        self.module.launch_tests("dummy")
+        run_id = self.module.get_output_range("tests")["runid"]
+        self.module._Developer__send_tests_output(["line1", "line2", "line3"])
+
+        result = self.module.resume_output("tests", run_id, 1)
+        logging.debug("Result: %s" % result)
+
+        self.assertEqual(result["runid"], run_id)
+        self.assertEqual(result["start"], 2)
+        self.assertEqual(result["lines"], ["line2", "line3"])
+        self.assertEqual(result["seq"], 3)
+        self.assertTrue(result["running"])
+
+    @patch("backend.developer.EndlessConsole")
+    def test_resume_output_up_to_date(self, endless_console_mock):
+        self.init()
+        self.module.launch_tests("dummy")
+        run_id = self.module.get_output_range("tests")["runid"]
+
+        result = self.module.resume_output("tests", run_id, 0)
+
+        self.assertEqual(result["lines"], [])
+        self.assertEqual(result["seq"], 0)
+
+    @patch("backend.developer.EndlessConsole")
+    def test_resume_output_other_run(self, endless_console_mock):
+        self.init()
+        self.module.generate_api_documentation("dummy")
+        self.module._Developer__docs_end_callback(0, False)
+
+        result = self.module.resume_output("docs", "docs-123", 10)
+
+        self.assertEqual(result["start"], 0)
+        self.assertEqual(
+            result["lines"], ["API documentation generation started. Please wait..."]
+        )
+        self.assertFalse(result["running"])
+
+    @patch("backend.developer.EndlessConsole")
+    def test_resume_output_from_run_history(self, endless_console_mock):
+        self.init()
+        self.module._Developer__outputs["tests"] = OutputLog(2)
+        self.module.launch_tests("dummy")
+        run_id = self.module.get_output_range("tests")["runid"]
+        self.module._Developer__send_tests_output(["line1", "line2", "line3"])
+
+        result = self.module.resume_output("tests", run_id, 0)
+
+        self.assertEqual(result["start"], 1)
+        self.assertEqual(result["lines"], ["line1", "line2", "line3"])
+        self.assertEqual(result["seq"], 3)
+
+    def test_resume_output_invalid_params(self):
+        self.init()
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.resume_output("build")
+        self.assertEqual(
+            str(cm.exception), "Parameter \"job\" must be one of ['tests', 'docs']"
+        )
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.resume_output("tests", None, "1")
+        self.assertEqual(str(cm.exception), 'Parameter "last_seq" must be an integer')
+
+
+    def test_check_application_backend_failed(self):
+        self.init()
+
+        def cli_check(command, error_message, **kwargs):
+            if error_message == "Backend source code check failed":
+                raise CommandError(error_message)
+            return "result"
+
+        self.module._Developer__cli_check = Mock(side_effect=cli_check)
+
+        result = self.module.check_application("dummy")
+        logging.debug("Result: %s" % result)
+
+        self.assertIsNone(result["backend"])
+        self.assertIsNone(result["breaking_changes"])
+        self.assertEqual(result["frontend"], "result")
+        self.assertEqual(result["changelog"], "result")
+        self.assertEqual(result["checks"]["backend"]["status"], "failed")
+        self.assertEqual(
+            result["checks"]["backend"]["error"], "Backend source code check failed"
+        )
+        self.assertEqual(result["checks"]["breaking_changes"]["status"], "skipped")
+        self.assertEqual(self.module._Developer__cli_check.call_count, 5)
+        self.assertIsNone(self.module._Developer__get_cached_check("dummy"))
+
+    def test_check_application_failed_check_has_errors(self):
+        self.init()
+        self.module._Developer__cli_check = Mock(
+            side_effect=CommandError("Scripts check failed")
+        )
+
+        result = self.module.check_application("dummy")
+
+        self.assertTrue(self.module._Developer__check_has_errors(result))
+
+
+    @patch("backend.developer.EndlessConsole")
+    def test_launch_tests_writes_coverage_summary(self, endless_console_mock):
+        self.init()
+
+        self.module.launch_tests("dummy")
+
+        cmd = endless_console_mock.call_args[0][0]
+        logging.debug("Cmd: %s" % cmd)
+        self.assertIn("coveragesummary.py", cmd)
+        self.assertIn(
+            self.module.PATH_COVERAGE_SUMMARY % {"MODULE_NAME": "dummy"}, cmd
+        )
+        self.assertIn("exit $RC", cmd)
+
+    @patch("backend.developer.EndlessConsole")
+    def test_get_last_coverage_report_from_summary(self, endless_console_mock):
+        self.init()
+        summary = {
+            "timestamp": 1.0,
+            "files": {
+                "backend/dummy.py": {
+                    "statements": 10,
+                    "missing": 2,
+                    "coverage": 80.0,
+                    "missinglines": [[3, 4]],
+                },
+                "backend/dummyevent.py": {
+                    "statements": 5,
+                    "missing": 0,
+                    "coverage": 100.0,
+                    "missinglines": [],
+                },
+            },
+            "total": {"statements": 15, "missing": 2, "coverage": 86.67},
+        }
+        with open(
+            self.module.PATH_COVERAGE_SUMMARY % {"MODULE_NAME": "dummy"}, "w"
+        ) as fd:
+            json.dump(summary, fd)
+
+        result = self.module.get_last_coverage_report("dummy")
+        filtered = self.module.get_last_coverage_report("dummy", max_coverage=90)
+        by_pattern = self.module.get_last_coverage_report("dummy", "*event.py")
+
+        self.assertEqual(result, summary)
+        self.assertEqual(list(filtered["files"].keys()), ["backend/dummy.py"])
+        self.assertEqual(filtered["total"], summary["total"])
+        self.assertEqual(list(by_pattern["files"].keys()), ["backend/dummyevent.py"])
+        endless_console_mock.assert_not_called()
+
+    @patch("backend.developer.EndlessConsole")
+    def test_get_last_coverage_report_from_summary_tests_running(
+        self, endless_console_mock
+    ):
+        self.init()
+        with open(
+            self.module.PATH_COVERAGE_SUMMARY % {"MODULE_NAME": "dummy"}, "w"
+        ) as fd:
+            json.dump({"timestamp": 1.0, "files": {}, "total": {}}, fd)
+        self.module._Developer__tests_task = Mock()
+
+        with self.assertRaises(CommandError) as cm:
+            self.module.get_last_coverage_report("dummy")
+        self.assertEqual(str(cm.exception), "Tests are running. Please wait end of it")
+        endless_console_mock.assert_not_called()
+
+    def test_get_last_coverage_report_invalid_params(self):
+        self.init()
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.get_last_coverage_report("dummy", pattern=1)
+        self.assertEqual(str(cm.exception), 'Parameter "pattern" must be a string')
+
+        with self.assertRaises(InvalidParameter) as cm:
+            self.module.get_last_coverage_report("dummy", max_coverage=101)
+        self.assertEqual(
+            str(cm.exception), 'Parameter "max_coverage" must be between 0 and 100'
+        )
+
+
+class TestsDeveloperDocsOutputEvent(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=LOG_LEVEL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.session = session.TestSession(self)
+        self.event = self.session.setup_event(DeveloperDocsOutputEvent)
+
+    def test_event_params(self):
+        self.assertCountEqual(self.event.EVENT_PARAMS, ["messages", "runid", "seq"])
+
+
+class TestsDeveloperTestsOutputEvent(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=LOG_LEVEL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.session = session.TestSession(self)
+        self.event = self.session.setup_event(DeveloperTestsOutputEvent)
+
+    def test_event_params(self):
+        self.assertCountEqual(self.event.EVENT_PARAMS, ["messages", "runid", "seq"])
+
+
+class TestsDeveloperFrontendRestartEvent(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=LOG_LEVEL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.session = session.TestSession(self)
+        self.event = self.session.setup_event(DeveloperFrontendRestartEvent)
+
+    def test_event_params(self):
+        self.assertCountEqual(self.event.EVENT_PARAMS, [])
+
+
+class TestsDeveloperPerformanceStatsEvent(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=LOG_LEVEL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.session = session.TestSession(self)
+        self.event = self.session.setup_event(DeveloperPerformanceStatsEvent)
+
+    def test_event_params(self):
+        self.assertCountEqual(self.event.EVENT_PARAMS, ["stats"])
+
+
+class TestsDeveloperApplicationCreateEvent(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=LOG_LEVEL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.session = session.TestSession(self)
+        self.event = self.session.setup_event(DeveloperApplicationCreateEvent)
+
+    def test_event_params(self):
+        self.assertCountEqual(
+            self.event.EVENT_PARAMS, ["module", "step", "progress", "error"]
+        )
+
+
+class TestsDeveloperFrontendAssetsEvent(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=LOG_LEVEL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.session = session.TestSession(self)
+        self.event = self.session.setup_event(DeveloperFrontendAssetsEvent)
+
+    def test_event_params(self):
+        self.assertCountEqual(self.event.EVENT_PARAMS, ["module", "files"])
+
+
+class TestsDeveloperImport(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=LOG_LEVEL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.root_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+    def test_lazy_imports(self):
+        code = (
+            "import sys, backend.developer;"
+            "modules = ('pstats', 'cleep.libs.internals.cleepdoc', 'sqlite3',"
+            " 'concurrent.futures');"
+            "print(','.join(m for m in modules if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=self.root_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        self.assertEqual(result.stdout.strip(), "")
 
 
 if __name__ == "__main__":
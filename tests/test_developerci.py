@@ -0,0 +1,73 @@
+import unittest
+import logging
+import sys
+
+sys.path.append("../")
+from backend import developerci
+from unittest.mock import Mock, patch
+
+
+class TestDeveloperCi(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+
+    @patch("backend.developerci.requests")
+    def test_run_pipeline(self, requests_mock):
+        requests_mock.post.return_value.json.return_value = {"error": False}
+
+        result = developerci.run_pipeline(
+            "http://device/", ["mod1"], ["check"], True, 60.0
+        )
+
+        self.assertEqual(result, {"error": False})
+        requests_mock.post.assert_called_with(
+            "http://device/command",
+            json={
+                "command": "run_pipeline",
+                "to": "developer",
+                "params": {
+                    "module_names": ["mod1"],
+                    "steps": ["check"],
+                    "use_cache": True,
+                },
+                "timeout": 60.0,
+            },
+            timeout=70.0,
+            auth=None,
+        )
+
+    @patch("backend.developerci.run_pipeline")
+    def test_main_success(self, run_pipeline_mock):
+        run_pipeline_mock.return_value = {"error": False, "data": {"success": True}}
+
+        self.assertEqual(developerci.main(["--module", "mod1"]), 0)
+        run_pipeline_mock.assert_called_with(
+            "http://127.0.0.1", ["mod1"], developerci.STEPS, True, 1800.0, None
+        )
+
+    @patch("backend.developerci.run_pipeline")
+    def test_main_failure(self, run_pipeline_mock):
+        run_pipeline_mock.return_value = {"error": False, "data": {"success": False}}
+
+        self.assertEqual(
+            developerci.main(["--module", "mod1", "--step", "check", "--no-cache"]), 1
+        )
+        run_pipeline_mock.assert_called_with(
+            "http://127.0.0.1", ["mod1"], ["check"], False, 1800.0, None
+        )
+
+    @patch("backend.developerci.run_pipeline")
+    def test_main_error(self, run_pipeline_mock):
+        run_pipeline_mock.side_effect = Exception("Connection refused")
+        self.assertEqual(developerci.main(["--module", "mod1"]), 2)
+
+        run_pipeline_mock.side_effect = None
+        run_pipeline_mock.return_value = {"error": True, "message": "error", "data": None}
+        self.assertEqual(developerci.main(["--module", "mod1"]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import logging
+import sys
+
+sys.path.append("../")
+from backend.docrenderer import DocRenderer
+
+
+class TestDocRenderer(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.renderer = DocRenderer()
+
+    def test_render_empty(self):
+        self.assertEqual(self.renderer.render({}, {}), "<ul></ul>")
+
+    def test_render_command(self):
+        doc = {
+            "my_command": {
+                "args": [
+                    {
+                        "name": "param",
+                        "type": "dict<str>",
+                        "optional": True,
+                        "default": 3,
+                        "description": "a param",
+                        "formats": ["format1"],
+                    }
+                ],
+                "returns": [{"type": "bool", "description": "a result", "formats": []}],
+                "raises": [{"type": "CommandError", "description": "an error"}],
+            }
+        }
+
+        html = self.renderer.render(doc, {})
+        logging.debug("Html: %s" % html)
+
+        self.assertIn('<li class="doc-function"><span>Command my_command</span>', html)
+        self.assertIn("<li>Type: dict&lt;str&gt;</li>", html)
+        self.assertIn("<li>Optional: true</li>", html)
+        self.assertIn("<li>default: 3</li>", html)
+        self.assertIn("<li><span>Formats</span>:<ul><li>format1</li></ul></li>", html)
+        self.assertIn("<li><span>Returns</span><ul><li><span>bool</span>", html)
+        self.assertIn("<li><span>CommandError</span><ul><li>Description: an error</li>", html)
+        self.assertNotIn("Errors:", html)
+
+    def test_render_errors_and_warnings(self):
+        doc = {"my_command": {"args": [], "returns": [], "raises": []}}
+        check = {"my_command": {"errors": ["an <error>"], "warnings": ["a warning"]}}
+
+        html = self.renderer.render(doc, check)
+
+        self.assertIn('<ul class="doc-errors"><li>an &lt;error&gt;</li></ul>', html)
+        self.assertIn('<ul class="doc-warns"><li>a warning</li></ul>', html)
+        self.assertNotIn("<span>Args</span>", html)
+
+
+if __name__ == "__main__":
+    unittest.main()
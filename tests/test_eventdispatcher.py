@@ -0,0 +1,148 @@
+import unittest
+import logging
+import sys
+import time
+
+sys.path.append("../")
+from backend.eventdispatcher import EventDispatcher
+from unittest.mock import Mock, call
+
+
+class TestEventDispatcher(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.event = Mock()
+        self.other_event = Mock()
+
+    def wait_pending(self, dispatcher, timeout=2.0):
+        end = time.time() + timeout
+        while dispatcher.get_stats()["pending"] and time.time() < end:
+            time.sleep(0.01)
+
+    def test_send_immediately_within_burst(self):
+        dispatcher = EventDispatcher(rate=1.0, burst=2)
+
+        dispatcher.dispatch("output", self.event, {"messages": ["a"]}, to="rpc")
+        dispatcher.dispatch("output", self.event, {"messages": ["b"]}, to="rpc")
+
+        self.event.send.assert_has_calls(
+            [
+                call(params={"messages": ["a"]}, to="rpc"),
+                call(params={"messages": ["b"]}, to="rpc"),
+            ]
+        )
+        self.assertEqual(dispatcher.get_stats()["events"]["output"]["sent"], 2)
+
+    def test_send_without_params(self):
+        dispatcher = EventDispatcher()
+
+        dispatcher.dispatch("restart", self.event, priority=EventDispatcher.HIGH)
+
+        self.event.send.assert_called_once_with()
+
+    def test_coalesce_messages_when_rate_limited(self):
+        dispatcher = EventDispatcher(rate=20.0, burst=1)
+        merge = EventDispatcher.MERGE_MESSAGES
+
+        dispatcher.dispatch("output", self.event, {"messages": ["a"]}, merge=merge)
+        dispatcher.dispatch("output", self.event, {"messages": ["b"]}, merge=merge)
+        dispatcher.dispatch("output", self.event, {"messages": "c"}, merge=merge)
+        self.assertEqual(dispatcher.get_stats()["pending"], ["output"])
+        self.wait_pending(dispatcher)
+
+        self.assertEqual(
+            self.event.send.call_args_list,
+            [
+                call(params={"messages": ["a"]}),
+                call(params={"messages": ["b", "c"]}),
+            ],
+        )
+        stats = dispatcher.get_stats()["events"]["output"]
+        self.assertEqual(stats, {"sent": 2, "coalesced": 1, "dropped": 0})
+
+    def test_coalesce_replace(self):
+        dispatcher = EventDispatcher(rate=20.0, burst=1)
+
+        for value in range(4):
+            dispatcher.dispatch("stats", self.event, {"stats": value})
+        self.wait_pending(dispatcher)
+
+        self.assertEqual(
+            self.event.send.call_args_list,
+            [call(params={"stats": 0}), call(params={"stats": 3})],
+        )
+        self.assertEqual(dispatcher.get_stats()["events"]["stats"]["coalesced"], 2)
+
+    def test_drop_oldest_messages(self):
+        dispatcher = EventDispatcher(rate=20.0, burst=1, max_pending_messages=3)
+        merge = EventDispatcher.MERGE_MESSAGES
+
+        dispatcher.dispatch("output", self.event, {"messages": ["0"]}, merge=merge)
+        dispatcher.dispatch("output", self.event, {"messages": ["1", "2"]}, merge=merge)
+        dispatcher.dispatch("output", self.event, {"messages": ["3", "4"]}, merge=merge)
+        self.wait_pending(dispatcher)
+
+        self.assertEqual(
+            self.event.send.call_args_list[-1],
+            call(params={"messages": ["2", "3", "4"]}),
+        )
+        self.assertEqual(dispatcher.get_stats()["events"]["output"]["dropped"], 1)
+
+    def test_high_priority_not_rate_limited(self):
+        dispatcher = EventDispatcher(rate=0.1, burst=1)
+
+        dispatcher.dispatch("output", self.event, {"messages": ["a"]})
+        dispatcher.dispatch("output", self.event, {"messages": ["b"]})
+        dispatcher.dispatch("restart", self.other_event, priority=EventDispatcher.HIGH)
+
+        self.other_event.send.assert_called_once()
+        self.assertEqual(dispatcher.get_stats()["pending"], ["output"])
+
+    def test_high_priority_flushes_pending_first(self):
+        dispatcher = EventDispatcher(rate=0.1, burst=1)
+        merge = EventDispatcher.MERGE_MESSAGES
+        calls = []
+        self.event.send.side_effect = lambda **kwargs: calls.append(kwargs["params"])
+
+        dispatcher.dispatch("output", self.event, {"messages": ["a"]}, merge=merge)
+        dispatcher.dispatch("output", self.event, {"messages": ["b"]}, merge=merge)
+        dispatcher.dispatch(
+            "output",
+            self.event,
+            {"messages": "done"},
+            priority=EventDispatcher.HIGH,
+            flush=["output"],
+        )
+
+        self.assertEqual(
+            calls,
+            [{"messages": ["a"]}, {"messages": ["b"]}, {"messages": "done"}],
+        )
+        self.assertEqual(dispatcher.get_stats()["pending"], [])
+
+    def test_flush(self):
+        dispatcher = EventDispatcher(rate=0.1, burst=1)
+
+        dispatcher.dispatch("stats", self.event, {"stats": 1})
+        dispatcher.dispatch("output", self.other_event, {"messages": ["a"]})
+        dispatcher.dispatch("stats", self.event, {"stats": 2})
+        dispatcher.flush()
+
+        self.assertEqual(self.event.send.call_count, 2)
+        self.other_event.send.assert_called_once()
+        self.assertEqual(dispatcher.get_stats()["pending"], [])
+
+    def test_send_failure(self):
+        dispatcher = EventDispatcher()
+        self.event.send.side_effect = Exception("Test exception")
+
+        dispatcher.dispatch("output", self.event, {"messages": ["a"]})
+
+        self.assertEqual(dispatcher.get_stats()["events"]["output"]["sent"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
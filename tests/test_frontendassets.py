@@ -0,0 +1,118 @@
+import unittest
+import logging
+import sys
+import os
+import time
+import tempfile
+import shutil
+
+sys.path.append("../")
+from backend.frontendassets import FrontendAssets
+from unittest.mock import Mock
+
+
+class TestFrontendAssets(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.callback = Mock()
+        self.assets = FrontendAssets(0.05, self.callback)
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.assets.cancel()
+        shutil.rmtree(self.tmp_dir)
+
+    def _write(self, path, content):
+        path = os.path.join(self.tmp_dir, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as fd:
+            fd.write(content)
+        # make sure mtime changes even on filesystems with coarse timestamps
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+
+    def test_notifications_coalesced_during_quiet_period(self):
+        for _ in range(10):
+            self.assets.notify()
+        self.callback.assert_not_called()
+        self.assertTrue(self.assets.get_stats()["pending"])
+
+        time.sleep(0.2)
+
+        self.callback.assert_called_once_with([], True)
+        self.assertEqual(
+            self.assets.get_stats(), {"notifications": 10, "sent": 1, "pending": False}
+        )
+
+    def test_no_quiet_period(self):
+        self.assets.quiet_period = 0
+
+        self.assets.notify(["style.css"])
+
+        self.callback.assert_called_once_with(["style.css"], False)
+
+    def test_detect_changed_assets(self):
+        self._write("css/style.css", "a")
+        self._write("js/app.js", "b")
+        self.assets.track(self.tmp_dir)
+
+        self._write("css/style.css", "aa")
+        self.assets.notify()
+        self.assets.flush()
+
+        self.callback.assert_called_once_with([os.path.join("css", "style.css")], False)
+
+    def test_script_change_requires_reload(self):
+        self._write("css/style.css", "a")
+        self._write("js/app.js", "b")
+        self.assets.track(self.tmp_dir)
+
+        self._write("css/style.css", "aa")
+        self._write("js/app.js", "bb")
+        self.assets.flush()
+
+        self.callback.assert_called_once_with(
+            [os.path.join("css", "style.css"), os.path.join("js", "app.js")], True
+        )
+
+    def test_removed_file_requires_reload(self):
+        self._write("style.css", "a")
+        self.assets.track(self.tmp_dir)
+
+        os.remove(os.path.join(self.tmp_dir, "style.css"))
+        self.assets.flush()
+
+        self.callback.assert_called_once_with(["style.css"], True)
+
+    def test_snapshot_updated_after_flush(self):
+        self._write("style.css", "a")
+        self.assets.track(self.tmp_dir)
+        self._write("style.css", "aa")
+        self.assets.flush()
+
+        self.assets.notify(["logo.png"])
+        self.assets.flush()
+
+        self.callback.assert_called_with(["logo.png"], False)
+
+    def test_cancel_drops_pending_changes(self):
+        self.assets.notify(["style.css"])
+
+        self.assets.cancel()
+        time.sleep(0.1)
+
+        self.callback.assert_not_called()
+        self.assertFalse(self.assets.get_stats()["pending"])
+
+    def test_is_hot_swappable(self):
+        self.assertTrue(FrontendAssets.is_hot_swappable("css/Style.CSS"))
+        self.assertTrue(FrontendAssets.is_hot_swappable("images/logo.svg"))
+        self.assertFalse(FrontendAssets.is_hot_swappable("js/app.js"))
+        self.assertFalse(FrontendAssets.is_hot_swappable("desc.json"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,247 @@
+import unittest
+import logging
+import sys
+import os
+import time
+import signal
+import tempfile
+import shutil
+import subprocess
+
+sys.path.append("../")
+from backend import joblimits
+from backend.joblimits import (
+    wrap_command,
+    limit_command,
+    kill_job,
+    run,
+    new_usage_path,
+    read_usage,
+)
+from unittest.mock import patch
+
+
+class TestJobLimits(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.tmp_dir = tempfile.mkdtemp()
+        self.jobs_path_patch = patch.object(joblimits, "JOBS_PATH", self.tmp_dir)
+        self.jobs_path_patch.start()
+        self.processes = []
+
+    def tearDown(self):
+        self.jobs_path_patch.stop()
+        for process in self.processes:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+        shutil.rmtree(self.tmp_dir)
+
+    def _spawn(self, command, job, **limits):
+        process = subprocess.Popen(
+            wrap_command(command, job, **limits),
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        self.processes.append(process)
+        return process
+
+    def test_wrap_command(self):
+        cmd = wrap_command(
+            'cleep-cli modtests --module "dummy"',
+            "tests",
+            nice=10,
+            memory=1024,
+            wall_time=60.0,
+        )
+
+        self.assertTrue(cmd.startswith(f"exec {sys.executable} "))
+        self.assertTrue(
+            cmd.endswith(
+                "joblimits.py --job tests --nice 10 --memory 1024 --wall-time 60.0 "
+                "-- 'cleep-cli modtests --module \"dummy\"'"
+            )
+        )
+
+    def test_wrap_command_usage_file(self):
+        cmd = wrap_command("ls", "cli", usage_path="/run/usage")
+
+        self.assertTrue(
+            cmd.endswith("joblimits.py --job cli --usage-file /run/usage -- ls")
+        )
+
+    def test_run_writes_own_usage(self):
+        usage_path = new_usage_path("usagetest")
+
+        run(
+            f"{sys.executable} -c 'sum(range(3000000))'",
+            "usagetest",
+            usage_path=usage_path,
+        )
+        usage = read_usage(usage_path)
+
+        self.assertGreater(usage["cputime"], 0.0)
+        self.assertGreater(usage["maxrss"], 0)
+        self.assertFalse(os.path.exists(usage_path))
+
+    def test_read_usage_not_available(self):
+        self.assertIsNone(read_usage(os.path.join(self.tmp_dir, "missing.usage")))
+
+    def test_wrap_command_without_limits(self):
+        cmd = wrap_command("ls", "cli")
+
+        self.assertTrue(cmd.endswith("joblimits.py --job cli -- ls"))
+
+    def test_limit_command(self):
+        self.assertEqual(limit_command("ls"), "ls")
+        self.assertEqual(
+            limit_command('echo "hello"', nice=5, memory=2048 * 1024),
+            "ulimit -d 2048 && exec nice -n 5 /bin/sh -c 'echo \"hello\"'",
+        )
+        self.assertEqual(limit_command("ls", nice=5), "exec nice -n 5 /bin/sh -c ls")
+
+    def test_limit_command_applies_limits(self):
+        output = subprocess.run(
+            limit_command("nice; ulimit -d", nice=5, memory=512 * 1024 * 1024),
+            shell=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+
+        self.assertEqual(int(output[0]), os.nice(0) + 5)
+        self.assertEqual(output[1], str(512 * 1024))
+
+    def test_limit_command_memory_allows_threaded_python(self):
+        # address space limit of same size fails here: each thread reserves a malloc
+        # arena and a stack
+        script = os.path.join(self.tmp_dir, "threads.py")
+        with open(script, "w") as fd:
+            fd.write(
+                "import threading\n"
+                "barrier = threading.Barrier(32, timeout=10)\n"
+                "def work():\n"
+                "    data = [str(i) * 10 for i in range(20000)]\n"
+                "    barrier.wait()\n"
+                "threads = [threading.Thread(target=work) for _ in range(32)]\n"
+                "[thread.start() for thread in threads]\n"
+                "[thread.join() for thread in threads]\n"
+            )
+
+        result = subprocess.run(
+            limit_command(f"{sys.executable} {script}", memory=512 * 1024 * 1024),
+            shell=True,
+            capture_output=True,
+            timeout=30,
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_run_returns_command_return_code(self):
+        self.assertEqual(run("exit 3", "test"), 3)
+        self.assertEqual(os.listdir(self.tmp_dir), [])
+
+    def test_run_applies_limits(self):
+        output = os.path.join(self.tmp_dir, "nice")
+
+        run(f"nice > {output}", "test", nice=5, memory=512 * 1024 * 1024)
+
+        with open(output) as fd:
+            self.assertEqual(int(fd.read()), os.nice(0) + 5)
+
+    def test_run_wall_time_kills_process_group(self):
+        pid_file = os.path.join(self.tmp_dir, "pid")
+        start = time.time()
+
+        returncode = run(
+            f"sleep 30 & echo $! > {pid_file}; wait", "test", wall_time=0.5, grace=0.5
+        )
+
+        self.assertEqual(returncode, joblimits.WALL_TIME_RETURN_CODE)
+        self.assertLess(time.time() - start, 5.0)
+        with open(pid_file) as fd:
+            background_pid = int(fd.read())
+        time.sleep(0.1)
+        self.assertFalse(joblimits._is_running(background_pid))
+
+    def test_kill_job(self):
+        pid_file = os.path.join(self.tmp_dir, "pid")
+        process = self._spawn(f"sleep 30 & echo $! > {pid_file}; wait", "killtest")
+        deadline = time.time() + 5.0
+        while not os.path.exists(pid_file) and time.time() < deadline:
+            time.sleep(0.05)
+
+        killed = kill_job("killtest", grace=1.0)
+
+        self.assertEqual(killed, [process.pid])
+        self.assertEqual(process.wait(5.0), 128 + signal.SIGTERM)
+        with open(pid_file) as fd:
+            background_pid = int(fd.read())
+        time.sleep(0.1)
+        self.assertFalse(joblimits._is_running(background_pid))
+
+    def test_kill_job_not_running(self):
+        self.assertEqual(kill_job("unknownjob", grace=0.1), [])
+
+    def _spawn_group(self):
+        process = subprocess.Popen(["sleep", "30"], start_new_session=True)
+        self.processes.append(process)
+        return process
+
+    def _write_pgid(self, job, pgid, start_time):
+        path = os.path.join(self.tmp_dir, f"{job}.999999.pgid")
+        with open(path, "w") as fd:
+            fd.write(f"{pgid} {start_time}")
+        return path
+
+    def test_kill_job_kills_left_process_group(self):
+        process = self._spawn_group()
+        path = self._write_pgid(
+            "lefttest", process.pid, joblimits._get_start_time(process.pid)
+        )
+
+        kill_job("lefttest", grace=0.1)
+
+        self.assertEqual(process.wait(5.0), -signal.SIGKILL)
+        self.assertFalse(os.path.exists(path))
+
+    def test_kill_job_ignores_reused_process_group(self):
+        process = self._spawn_group()
+        path = self._write_pgid("reusedtest", process.pid, "1")
+
+        kill_job("reusedtest", grace=0.1)
+
+        self.assertIsNone(process.poll())
+        self.assertFalse(os.path.exists(path))
+
+    def test_kill_job_ignores_unsafe_jobs_directory(self):
+        process = self._spawn_group()
+        path = self._write_pgid(
+            "unsafetest", process.pid, joblimits._get_start_time(process.pid)
+        )
+        os.chmod(self.tmp_dir, 0o777)
+
+        kill_job("unsafetest", grace=0.1)
+
+        self.assertIsNone(process.poll())
+        self.assertTrue(os.path.exists(path))
+
+    def test_run_records_process_group(self):
+        with patch.object(joblimits, "_kill_group"), patch(
+            "backend.joblimits.os.remove"
+        ):
+            run("sleep 0.2", "recordtest")
+
+        (filename,) = os.listdir(self.tmp_dir)
+        with open(os.path.join(self.tmp_dir, filename)) as fd:
+            pgid, start_time = fd.read().split()
+        self.assertTrue(filename.startswith("recordtest."))
+        self.assertTrue(pgid.isdigit())
+        self.assertTrue(start_time.isdigit())
+
+
+if __name__ == "__main__":
+    unittest.main()
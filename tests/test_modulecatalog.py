@@ -0,0 +1,166 @@
+import unittest
+import logging
+import sys
+import os
+import tempfile
+import shutil
+
+sys.path.append("../")
+from backend.modulecatalog import ModuleCatalog
+from unittest.mock import patch
+
+
+class TestModuleCatalog(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.modules_path = tempfile.mkdtemp()
+        self._write("dummy", "dummy.py", 'MODULE_VERSION = "1.2.3"\n')
+        self._write("dummy", "lib/helper.py", "# helper\n")
+        self._write("dummy", "__pycache__/dummy.cpython.pyc", "cache")
+        self.catalog = ModuleCatalog(self.modules_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.modules_path)
+
+    def _write(self, module_name, filename, content):
+        path = os.path.join(self.modules_path, module_name, filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as fd:
+            fd.write(content)
+
+    def _touch(self, module_name, filename):
+        path = os.path.join(self.modules_path, module_name, filename)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+    def test_get(self):
+        entry = self.catalog.get("dummy")
+
+        self.assertEqual(entry["name"], "dummy")
+        self.assertEqual(entry["path"], os.path.join(self.modules_path, "dummy"))
+        self.assertEqual(
+            entry["mainpath"], os.path.join(self.modules_path, "dummy", "dummy.py")
+        )
+        self.assertEqual(entry["version"], "1.2.3")
+        self.assertEqual(entry["files"], ["dummy.py", os.path.join("lib", "helper.py")])
+        self.assertEqual(entry["size"], 25 + 9)
+        self.assertEqual(len(entry["hash"]), 40)
+
+    def test_get_unknown_module(self):
+        self.assertIsNone(self.catalog.get("unknown"))
+        self.assertIsNone(self.catalog.get(""))
+        self.assertIsNone(self.catalog.get("../dummy"))
+
+    def test_get_without_version(self):
+        self._write("other", "other.py", "# no version\n")
+
+        self.assertIsNone(self.catalog.get("other")["version"])
+
+    def test_exists(self):
+        self.assertTrue(self.catalog.exists("dummy"))
+        self.assertFalse(self.catalog.exists("unknown"))
+
+    def test_unknown_module_not_memoized(self):
+        self.assertFalse(self.catalog.exists("other"))
+
+        self._write("other", "other.py", "# new module\n")
+
+        self.assertTrue(self.catalog.exists("other"))
+
+    def test_get_is_memoized(self):
+        entry = self.catalog.get("dummy")
+
+        self.assertIs(self.catalog.get("dummy"), entry)
+
+    def test_get_revalidates_entry(self):
+        entry = self.catalog.get("dummy")
+        self._write("dummy", "extra.py", "# extra\n")
+
+        revalidated = self.catalog.get("dummy")
+
+        self.assertIsNot(revalidated, entry)
+        self.assertIn("extra.py", revalidated["files"])
+        self.assertNotEqual(revalidated["hash"], entry["hash"])
+        self.assertIs(self.catalog.get("dummy"), revalidated)
+
+    def test_get_revalidates_modified_main_file(self):
+        entry = self.catalog.get("dummy")
+        self._touch("dummy", "dummy.py")
+
+        self.assertNotEqual(self.catalog.get("dummy")["hash"], entry["hash"])
+
+    def test_get_nested_change_needs_invalidation(self):
+        entry = self.catalog.get("dummy")
+        self._touch("dummy", os.path.join("lib", "helper.py"))
+
+        self.assertIs(self.catalog.get("dummy"), entry)
+        self.catalog.invalidate("dummy")
+        self.assertNotEqual(self.catalog.get("dummy")["hash"], entry["hash"])
+
+    def test_get_does_not_walk_module_tree(self):
+        self.catalog.get("dummy")
+
+        with patch("backend.modulecatalog.os.walk") as walk_mock:
+            self.catalog.get("dummy")
+
+        walk_mock.assert_not_called()
+
+    def test_get_removed_module(self):
+        self.catalog.get("dummy")
+        shutil.rmtree(os.path.join(self.modules_path, "dummy"))
+
+        self.assertIsNone(self.catalog.get("dummy"))
+
+    def test_refresh(self):
+        entry = self.catalog.get("dummy")
+        self._write("dummy", "extra.py", "# extra\n")
+
+        refreshed = self.catalog.refresh("dummy")
+
+        self.assertIn("extra.py", refreshed["files"])
+        self.assertNotEqual(refreshed["hash"], entry["hash"])
+        self.assertIs(self.catalog.get("dummy"), refreshed)
+
+    def test_refresh_removed_module(self):
+        self.catalog.get("dummy")
+        shutil.rmtree(os.path.join(self.modules_path, "dummy"))
+
+        self.assertIsNone(self.catalog.refresh("dummy"))
+        self.assertFalse(self.catalog.exists("dummy"))
+
+    def test_invalidate(self):
+        entry = self.catalog.get("dummy")
+        self._write("dummy", "extra.py", "# extra\n")
+
+        self.catalog.invalidate("dummy")
+
+        self.assertNotEqual(self.catalog.get("dummy")["hash"], entry["hash"])
+
+    def test_invalidate_all(self):
+        entry = self.catalog.get("dummy")
+        self._write("dummy", "extra.py", "# extra\n")
+
+        self.catalog.invalidate()
+
+        self.assertNotEqual(self.catalog.get("dummy")["hash"], entry["hash"])
+
+    def test_get_all(self):
+        self._write("other", "other.py", "# other\n")
+        os.makedirs(os.path.join(self.modules_path, "notamodule"))
+        os.makedirs(os.path.join(self.modules_path, "__pycache__"))
+
+        entries = self.catalog.get_all()
+
+        self.assertEqual([entry["name"] for entry in entries], ["dummy", "other"])
+
+    def test_get_all_missing_modules_path(self):
+        catalog = ModuleCatalog(os.path.join(self.modules_path, "missing"))
+
+        self.assertEqual(catalog.get_all(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
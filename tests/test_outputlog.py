@@ -0,0 +1,73 @@
+import unittest
+import logging
+import sys
+
+sys.path.append("../")
+from backend.outputlog import OutputLog
+
+
+class TestOutputLog(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.log = OutputLog(max_lines=5)
+
+    def test_append(self):
+        self.log.new_run("run1")
+
+        self.assertEqual(self.log.append("line0"), 0)
+        self.assertEqual(self.log.append(["line1", "line2"]), 2)
+        self.assertEqual(self.log.append(None), 2)
+        self.assertEqual(
+            self.log.get_range(),
+            {
+                "runid": "run1",
+                "start": 0,
+                "lines": ["line0", "line1", "line2"],
+                "first": 0,
+                "total": 3,
+            },
+        )
+
+    def test_get_range_bounded(self):
+        self.log.new_run()
+        self.log.append([f"line{i}" for i in range(8)])
+
+        result = self.log.get_range(0, 2)
+
+        self.assertEqual(result["start"], 3)
+        self.assertEqual(result["first"], 3)
+        self.assertEqual(result["total"], 8)
+        self.assertEqual(result["lines"], ["line3", "line4"])
+
+    def test_get_range_last_lines(self):
+        self.log.new_run()
+        self.log.append([f"line{i}" for i in range(4)])
+
+        result = self.log.get_range(-2)
+
+        self.assertEqual(result["start"], 2)
+        self.assertEqual(result["lines"], ["line2", "line3"])
+
+    def test_get_range_after_end(self):
+        self.log.new_run()
+        self.log.append(["line0"])
+
+        self.assertEqual(self.log.get_range(10)["lines"], [])
+
+    def test_new_run(self):
+        run_id = self.log.new_run()
+        self.log.append(["line0"])
+
+        new_run_id = self.log.new_run("other")
+
+        self.assertIsNotNone(run_id)
+        self.assertEqual(new_run_id, "other")
+        self.assertEqual(self.log.run_id, "other")
+        self.assertEqual(self.log.get_range()["total"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
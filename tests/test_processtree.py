@@ -0,0 +1,66 @@
+import unittest
+import logging
+import sys
+import signal
+import subprocess
+
+sys.path.append("../")
+from backend.processtree import get_processes, find_processes, get_descendants, kill_tree
+from unittest.mock import patch
+
+
+class TestProcessTree(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.processes = {
+            1: {"ppid": 0, "cmdline": "init"},
+            10: {"ppid": 1, "cmdline": "/usr/local/bin/cleep-cli modtests --module dummy"},
+            11: {"ppid": 10, "cmdline": "python3 -m pytest"},
+            12: {"ppid": 11, "cmdline": "worker"},
+            20: {"ppid": 1, "cmdline": "other"},
+        }
+
+    def test_find_processes(self):
+        self.assertEqual(
+            find_processes("cleep-cli modtests --module dummy", self.processes), [10]
+        )
+        self.assertEqual(find_processes("unknown", self.processes), [])
+
+    def test_get_descendants(self):
+        self.assertEqual(get_descendants(10, self.processes), [11, 12])
+        self.assertEqual(get_descendants(20, self.processes), [])
+
+    @patch("backend.processtree.os.kill")
+    def test_kill_tree(self, kill_mock):
+        killed = kill_tree([10], self.processes)
+
+        self.assertEqual(killed, [10, 11, 12])
+        kill_mock.assert_any_call(12, signal.SIGKILL)
+
+    @patch("backend.processtree.os.kill")
+    def test_kill_tree_process_ended(self, kill_mock):
+        kill_mock.side_effect = [None, ProcessLookupError(), None]
+
+        killed = kill_tree([10], self.processes)
+
+        self.assertEqual(killed, [10, 12])
+
+    def test_get_processes_real(self):
+        proc = subprocess.Popen(["sleep", "30"])
+        try:
+            processes = get_processes()
+            self.assertIn(proc.pid, processes)
+            self.assertEqual(processes[proc.pid]["cmdline"], "sleep 30")
+            self.assertEqual(kill_tree([proc.pid]), [proc.pid])
+            proc.wait(timeout=5)
+            self.assertEqual(proc.returncode, -signal.SIGKILL)
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+
+
+if __name__ == "__main__":
+    unittest.main()
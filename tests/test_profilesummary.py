@@ -0,0 +1,84 @@
+import unittest
+import logging
+import sys
+import os
+import cProfile
+import tempfile
+import shutil
+
+sys.path.append("../")
+from backend.profilesummary import merge_profiles, get_hotspots, format_hotspots
+
+
+def dummy_hotspot():
+    return sum(i * i for i in range(1000))
+
+
+class TestProfileSummary(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def make_profile(self, name):
+        path = os.path.join(self.tmp_dir, name)
+        profiler = cProfile.Profile()
+        profiler.runcall(dummy_hotspot)
+        profiler.dump_stats(path)
+        return path
+
+    def test_get_hotspots(self):
+        path = self.make_profile("run.prof")
+
+        hotspots = get_hotspots(path, top=3)
+        logging.debug("Hotspots: %s" % hotspots)
+
+        self.assertLessEqual(len(hotspots), 3)
+        self.assertIn("dummy_hotspot", [hotspot["function"] for hotspot in hotspots])
+        self.assertCountEqual(
+            hotspots[0].keys(), ["function", "file", "line", "calls", "tottime", "cumtime"]
+        )
+
+    def test_merge_profiles(self):
+        path1 = self.make_profile("check1.prof")
+        path2 = self.make_profile("check2.prof")
+        output = os.path.join(self.tmp_dir, "merged.prof")
+
+        result = merge_profiles([path1, path2, "/unknown.prof"], output)
+        hotspots = get_hotspots(output)
+
+        self.assertTrue(result)
+        hotspot = [hotspot for hotspot in hotspots if hotspot["function"] == "dummy_hotspot"][0]
+        self.assertEqual(hotspot["calls"], 2)
+
+    def test_merge_profiles_no_profile(self):
+        output = os.path.join(self.tmp_dir, "merged.prof")
+
+        self.assertFalse(merge_profiles(["/unknown.prof"], output))
+        self.assertFalse(os.path.exists(output))
+
+    def test_format_hotspots(self):
+        hotspots = [
+            {
+                "function": "func",
+                "file": "/path/to/file.py",
+                "line": 12,
+                "calls": 3,
+                "tottime": 0.5,
+                "cumtime": 1.5,
+            }
+        ]
+
+        lines = format_hotspots(hotspots)
+
+        self.assertEqual(len(lines), 2)
+        self.assertIn("func (file.py:12)", lines[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
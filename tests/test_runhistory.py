@@ -0,0 +1,165 @@
+import unittest
+import logging
+import sys
+import os
+import tempfile
+import shutil
+
+sys.path.append("../")
+from backend.runhistory import RunHistory
+
+
+class TestRunHistory(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "runs")
+        self.history = RunHistory(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_run(self):
+        run_id = self.history.start("tests", "dummy")
+        self.history.append(run_id, ["line1", "line2"])
+        self.history.append(run_id, "line3\nwith newline")
+
+        run = self.history.get_run(run_id)
+        self.assertEqual(run["status"], "running")
+        self.assertEqual(run["lines"], 3)
+
+        self.history.end(run_id, 0)
+
+        run = self.history.get_run(run_id)
+        self.assertEqual(run["job"], "tests")
+        self.assertEqual(run["module"], "dummy")
+        self.assertEqual(run["status"], "succeeded")
+        self.assertEqual(run["returncode"], 0)
+        self.assertIsNotNone(run["ended"])
+        output = self.history.get_output(run_id)
+        self.assertEqual(output["lines"], ["line1", "line2", "line3\nwith newline"])
+        self.assertEqual(output["total"], 3)
+        self.assertFalse(output["running"])
+
+    def test_end_status(self):
+        failed = self.history.start("tests", "dummy")
+        self.history.end(failed, 1)
+        killed = self.history.start("tests", "dummy")
+        self.history.end(killed, -9, killed=True)
+
+        self.assertEqual(self.history.get_run(failed)["status"], "failed")
+        self.assertEqual(self.history.get_run(killed)["status"], "killed")
+
+    def test_unique_run_ids(self):
+        run_ids = {self.history.start("docs", "dummy") for _ in range(5)}
+
+        self.assertEqual(len(run_ids), 5)
+
+    def test_get_output_range(self):
+        run_id = self.history.start("tests", "dummy")
+        self.history.append(run_id, [f"line{i}" for i in range(10)])
+
+        output = self.history.get_output(run_id, 2, 3)
+        self.assertEqual(output["start"], 2)
+        self.assertEqual(output["lines"], ["line2", "line3", "line4"])
+        self.assertTrue(output["running"])
+
+        output = self.history.get_output(run_id, -2)
+        self.assertEqual(output["start"], 8)
+        self.assertEqual(output["lines"], ["line8", "line9"])
+
+        output = self.history.get_output(run_id, 20)
+        self.assertEqual(output["lines"], [])
+
+    def test_get_output_unknown_run(self):
+        self.assertIsNone(self.history.get_output("tests-123"))
+        self.assertIsNone(self.history.get_run("tests-123"))
+
+    def test_record(self):
+        run_id = self.history.record("build", "dummy", ["out", "err"], 2)
+
+        self.assertEqual(self.history.get_run(run_id)["status"], "failed")
+        self.assertEqual(self.history.get_output(run_id)["lines"], ["out", "err"])
+
+    def test_segment_rotation(self):
+        history = RunHistory(self.path, segment_size=100)
+        run_id = history.start("tests", "dummy")
+        for i in range(30):
+            history.append(run_id, f"line{i:02d}")
+        history.end(run_id, 0)
+
+        output = history.get_output(run_id)
+        logging.debug("Output: %s" % output)
+
+        self.assertEqual(output["total"], 30)
+        self.assertGreater(output["first"], 0)
+        self.assertEqual(output["lines"][-1], "line29")
+        self.assertEqual(len(output["lines"]), 30 - output["first"])
+        self.assertEqual(output["lines"][0], f"line{output['first']:02d}")
+        self.assertLessEqual(history.get_run(run_id)["size"], 200)
+        self.assertEqual(history.get_run(run_id)["first"], output["first"])
+
+    def test_prune_max_runs(self):
+        history = RunHistory(self.path, max_runs=2)
+        run_ids = [history.record("tests", "dummy", ["line"], 0) for _ in range(3)]
+
+        self.assertEqual(
+            [run["runid"] for run in history.get_runs()], run_ids[:0:-1]
+        )
+        self.assertFalse(os.path.exists(os.path.join(self.path, f"{run_ids[0]}.log")))
+
+    def test_prune_max_size(self):
+        history = RunHistory(self.path, max_size=50)
+        first = history.record("tests", "dummy", ["x" * 40], 0)
+        second = history.record("tests", "dummy", ["x" * 40], 0)
+
+        self.assertIsNone(history.get_run(first))
+        self.assertIsNotNone(history.get_run(second))
+
+    def test_running_runs_not_pruned(self):
+        history = RunHistory(self.path, max_runs=1)
+        running = history.start("tests", "dummy")
+        history.start("docs", "dummy")
+
+        self.assertIsNotNone(history.get_run(running))
+
+    def test_get_runs_filters(self):
+        self.history.record("tests", "dummy", [], 0)
+        self.history.record("docs", "dummy", [], 0)
+        self.history.record("tests", "other", [], 0)
+
+        self.assertEqual(len(self.history.get_runs()), 3)
+        self.assertEqual(len(self.history.get_runs(module_name="dummy")), 2)
+        self.assertEqual(len(self.history.get_runs(job="tests")), 2)
+        self.assertEqual(len(self.history.get_runs("dummy", "tests")), 1)
+        self.assertEqual(len(self.history.get_runs(limit=1)), 1)
+
+    def test_index_persisted(self):
+        ended = self.history.record("tests", "dummy", ["line"], 0)
+        running = self.history.start("docs", "dummy")
+        self.history.append(running, "partial")
+
+        history = RunHistory(self.path)
+
+        self.assertEqual(history.get_run(ended)["status"], "succeeded")
+        self.assertEqual(history.get_output(ended)["lines"], ["line"])
+        self.assertEqual(history.get_run(running)["status"], "interrupted")
+        self.assertEqual(history.get_output(running)["lines"], ["partial"])
+
+    def test_not_writable_path(self):
+        path = os.path.join(self.tmp_dir, "file")
+        with open(path, "w") as fd:
+            fd.write("")
+        history = RunHistory(os.path.join(path, "runs"))
+
+        run_id = history.record("tests", "dummy", ["line"], 0)
+
+        self.assertEqual(history.get_run(run_id)["lines"], 1)
+        self.assertEqual(history.get_output(run_id)["lines"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
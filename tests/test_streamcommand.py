@@ -0,0 +1,165 @@
+import unittest
+import logging
+import sys
+import json
+import os
+
+sys.path.append("../")
+from backend.streamcommand import JsonStreamParser, stream_command, MAX_TEXT_LINES
+
+
+class TestJsonStreamParser(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.parser = JsonStreamParser()
+
+    def test_single_document(self):
+        documents, lines = self.parser.feed('{"hello": "world"}')
+
+        self.assertEqual(documents, [{"hello": "world"}])
+        self.assertEqual(lines, [])
+        self.assertEqual(self.parser.close(), [])
+
+    def test_ndjson_and_text_lines(self):
+        documents, lines = self.parser.feed(
+            'warning: something\n{"a": 1}\n  [1, 2]\n\n{"b": 2}\nend'
+        )
+
+        self.assertEqual(documents, [{"a": 1}, [1, 2], {"b": 2}])
+        self.assertEqual(lines, ["warning: something"])
+        self.assertEqual(self.parser.close(), ["end"])
+
+    def test_document_split_in_chunks(self):
+        document = {"files": [{"name": 'a"}\\{[', "errors": ["x"] * 10}] * 50}
+        text = json.dumps(document, indent=2)
+
+        documents = []
+        for index in range(0, len(text), 7):
+            documents.extend(self.parser.feed(text[index : index + 7])[0])
+
+        self.assertEqual(documents, [document])
+
+    def test_escaped_quote_at_chunk_boundary(self):
+        self.assertEqual(self.parser.feed('{"a": "x\\'), ([], []))
+        self.assertEqual(self.parser.feed('"}"}'), ([{"a": 'x"}'}], []))
+
+    def test_invalid_document(self):
+        with self.assertRaises(ValueError):
+            self.parser.feed('{\n  hello: "world"\n}')
+
+    def test_text_lines_starting_with_bracket(self):
+        documents, lines = self.parser.feed(
+            "[INFO] checking {module}\n[ 50%] test_a PASSED\n{hello: 1}\n"
+            '[\n  {"a": 1}\n]\n[ERROR] done'
+        )
+
+        self.assertEqual(documents, [[{"a": 1}]])
+        self.assertEqual(
+            lines, ["[INFO] checking {module}", "[ 50%] test_a PASSED", "{hello: 1}"]
+        )
+        self.assertEqual(self.parser.close(), ["[ERROR] done"])
+
+    def test_text_line_starting_with_bracket_split_in_chunks(self):
+        self.assertEqual(self.parser.feed("[ 50"), ([], []))
+        self.assertEqual(self.parser.feed("%] test"), ([], []))
+        self.assertEqual(
+            self.parser.feed('_a\n{"a": 1}\n'), ([{"a": 1}], ["[ 50%] test_a"])
+        )
+
+    def test_incomplete_document(self):
+        self.parser.feed('{\n  "hello": ')
+
+        with self.assertRaises(ValueError) as cm:
+            self.parser.close()
+        self.assertEqual(str(cm.exception), "Incomplete JSON document")
+
+
+class TestStreamCommand(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+
+    def test_stream_command(self):
+        result = stream_command(
+            "echo 'text'; echo '{\"a\": 1}'; echo '{\"b\": 2}'; echo error >&2"
+        )
+
+        self.assertEqual(result["returncode"], 0)
+        self.assertEqual(result["documents"], [{"a": 1}, {"b": 2}])
+        self.assertEqual(result["stdout"], ["text"])
+        self.assertEqual(result["stderr"], ["error"])
+        self.assertEqual(result["outputsize"], 29)
+        self.assertFalse(result["killed"])
+        self.assertIsNone(result["error"])
+
+    def test_stream_command_returncode(self):
+        result = stream_command("echo '{}'; exit 3")
+
+        self.assertEqual(result["returncode"], 3)
+        self.assertEqual(result["documents"], [{}])
+
+    def test_stream_command_timeout(self):
+        result = stream_command("sleep 5", timeout=0.2)
+
+        self.assertTrue(result["killed"])
+        self.assertNotEqual(result["returncode"], 0)
+
+    def test_stream_command_output_size_limit(self):
+        result = stream_command("yes '{\"a\": 1}'", max_output_size=10000)
+
+        self.assertTrue(result["truncated"])
+        self.assertLessEqual(len(result["documents"]), 10000)
+
+    def test_stream_command_stopped_by_callback(self):
+        received = []
+
+        def on_document(document):
+            received.append(document)
+            return len(received) < 3
+
+        result = stream_command("yes '{\"a\": 1}'", on_document=on_document)
+
+        self.assertTrue(result["stopped"])
+        self.assertEqual(len(received), 3)
+
+    def test_stream_command_invalid_output(self):
+        result = stream_command("printf '{\\n  a: 1\\n}\\n'; sleep 5")
+
+        self.assertTrue(
+            result["error"].startswith("Expecting property name enclosed in double quotes")
+        )
+        self.assertEqual(result["documents"], [])
+
+    def test_stream_command_log_lines(self):
+        result = stream_command("echo '[INFO] start'; echo '{\"a\": 1}'")
+
+        self.assertEqual(result["documents"], [{"a": 1}])
+        self.assertEqual(result["stdout"], ["[INFO] start"])
+        self.assertIsNone(result["error"])
+
+    def test_stream_command_text_lines_limit(self):
+        result = stream_command("seq 1 500 | sed 's/^/line/'")
+
+        self.assertEqual(len(result["stdout"]), MAX_TEXT_LINES)
+        self.assertEqual(result["stdout"][0], "line1")
+
+    def test_stream_command_usage(self):
+        result = stream_command(f"{sys.executable} -c 'sum(range(3000000))'")
+
+        self.assertGreater(result["usage"]["cputime"], 0.0)
+        self.assertGreater(result["usage"]["maxrss"], 0)
+
+    def test_stream_command_limits(self):
+        result = stream_command("nice; ulimit -d", nice=5, memory=512 * 1024 * 1024)
+
+        self.assertEqual(result["returncode"], 0)
+        self.assertEqual(result["stdout"], [str(os.nice(0) + 5), str(512 * 1024)])
+
+
+if __name__ == "__main__":
+    unittest.main()
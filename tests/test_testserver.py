@@ -0,0 +1,178 @@
+import unittest
+import logging
+import sys
+import os
+import time
+import tempfile
+import shutil
+import subprocess
+
+sys.path.append("../")
+from backend import testserver
+
+TEST_SERVER_PATH = os.path.abspath(testserver.__file__)
+
+
+class TestTestServer(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.tmp_dir = tempfile.mkdtemp()
+        self.socket_path = os.path.join(self.tmp_dir, "testserver.sock")
+        self.tests_path = os.path.join(self.tmp_dir, "module", "tests")
+        os.makedirs(self.tests_path)
+        self.server = None
+
+    def tearDown(self):
+        if self.server:
+            self.server.kill()
+            self.server.wait()
+        shutil.rmtree(self.tmp_dir)
+
+    def _write_test(self, name, content):
+        with open(os.path.join(self.tests_path, name), "w") as fd:
+            fd.write(content)
+
+    def _start_server(self):
+        self.server = subprocess.Popen(
+            [sys.executable, TEST_SERVER_PATH, "--socket", self.socket_path, "--serve"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.time() + 10.0
+        while not os.path.exists(self.socket_path) and time.time() < deadline:
+            time.sleep(0.05)
+
+    def _run_client(self, fallback=None):
+        command = [
+            sys.executable,
+            TEST_SERVER_PATH,
+            "--socket",
+            self.socket_path,
+            "--cwd",
+            self.tests_path,
+        ]
+        if fallback:
+            command += ["--fallback", fallback]
+        command += ["--", "-q", "-p", "no:cacheprovider"]
+        return subprocess.run(command, capture_output=True, text=True, timeout=30)
+
+    def test_run_tests_through_server(self):
+        self._write_test("test_ok.py", "def test_ok():\n    assert True\n")
+        self._start_server()
+
+        for _ in range(2):
+            result = self._run_client()
+
+            self.assertEqual(result.returncode, 0)
+            self.assertIn("1 passed", result.stdout)
+            self.assertNotIn("TESTSERVER-END", result.stdout)
+
+    def test_run_failing_tests_through_server(self):
+        self._write_test("test_ko.py", "def test_ko():\n    assert False\n")
+        self._start_server()
+
+        result = self._run_client()
+
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("1 failed", result.stdout)
+
+    def test_module_changes_seen_by_server(self):
+        self._write_test("test_ok.py", "def test_ok():\n    assert True\n")
+        self._start_server()
+        self._run_client()
+
+        self._write_test(
+            "test_ok.py",
+            "def test_ok():\n    assert True\n\ndef test_new():\n    assert True\n",
+        )
+        result = self._run_client()
+
+        self.assertIn("2 passed", result.stdout)
+
+    def test_server_stays_single_threaded(self):
+        self._write_test("test_ok.py", "def test_ok():\n    assert True\n")
+        self._start_server()
+
+        clients = [
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    TEST_SERVER_PATH,
+                    "--socket",
+                    self.socket_path,
+                    "--cwd",
+                    self.tests_path,
+                    "--",
+                    "-q",
+                    "-p",
+                    "no:cacheprovider",
+                ],
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            for _ in range(3)
+        ]
+        outputs = [client.communicate(timeout=30)[0] for client in clients]
+
+        for output in outputs:
+            self.assertIn("1 passed", output)
+        with open(f"/proc/{self.server.pid}/status", encoding="utf-8") as fd:
+            self.assertIn("Threads:\t1\n", fd.read())
+
+    def test_socket_is_private(self):
+        self._start_server()
+
+        self.assertEqual(os.stat(self.socket_path).st_mode & 0o777, 0o600)
+
+    def test_socket_directory_not_private(self):
+        os.chmod(self.tmp_dir, 0o777)
+        server = testserver.TestServer(self.socket_path, preload=())
+
+        with self.assertRaises(OSError) as cm:
+            server.serve()
+        self.assertEqual(
+            str(cm.exception), f"Test server directory {self.tmp_dir} is not private"
+        )
+
+    def test_fallback_without_server(self):
+        result = self._run_client(fallback="echo fallback; exit 3")
+
+        self.assertEqual(result.returncode, 3)
+        self.assertEqual(result.stdout, "fallback\n")
+
+    def test_is_stale(self):
+        module_path = os.path.join(self.tmp_dir, "devpreloadtest.py")
+        with open(module_path, "w") as fd:
+            fd.write("VALUE = 1\n")
+        sys.path.insert(0, self.tmp_dir)
+        try:
+            server = testserver.TestServer(
+                self.socket_path, preload=("devpreloadtest",)
+            )
+            server.warm_up()
+            self.assertEqual(server.preloaded, ["devpreloadtest"])
+            self.assertFalse(server.is_stale())
+
+            stat = os.stat(module_path)
+            os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            self.assertTrue(server.is_stale())
+        finally:
+            sys.path.remove(self.tmp_dir)
+            sys.modules.pop("devpreloadtest", None)
+
+    def test_warm_up_ignores_missing_modules(self):
+        server = testserver.TestServer(
+            self.socket_path, preload=("unittest", "devunknownmod")
+        )
+
+        server.warm_up()
+
+        self.assertEqual(server.preloaded, ["unittest"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+import unittest
+import logging
+import sys
+import os
+import time
+import tempfile
+import shutil
+
+sys.path.append("../")
+from backend.writesession import WriteSession
+from unittest.mock import Mock
+
+
+class TestWriteSession(unittest.TestCase):
+    def setUp(self):
+        logging.basicConfig(
+            level=logging.FATAL,
+            format=u"%(asctime)s %(name)s:%(lineno)d %(levelname)s : %(message)s",
+        )
+        self.fs = Mock()
+        self.fs.write_data.side_effect = self._write_data
+        self.session = WriteSession(self.fs, quiet_period=0.05)
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.session.reset()
+        shutil.rmtree(self.tmp_dir)
+
+    def _write_data(self, path, data, encoding=None):
+        with open(path, "w", encoding=encoding) as fd:
+            fd.write(data)
+        return True
+
+    def test_session_enables_and_restores_ro_after_quiet_period(self):
+        with self.session.session():
+            self.fs.enable_write.assert_called_once_with(root=True, boot=False)
+            self.assertTrue(self.session.get_stats()["writable"]["root"])
+
+        self.fs.disable_write.assert_not_called()
+        time.sleep(0.2)
+
+        self.fs.disable_write.assert_called_once_with(root=True, boot=False)
+        stats = self.session.get_stats()
+        self.assertFalse(stats["writable"]["root"])
+        self.assertEqual(stats["windows"], 1)
+        self.assertGreater(stats["rwseconds"]["root"], 0)
+
+    def test_consecutive_sessions_share_window(self):
+        with self.session.session():
+            pass
+        with self.session.session():
+            pass
+        time.sleep(0.2)
+
+        self.fs.enable_write.assert_called_once()
+        self.fs.disable_write.assert_called_once()
+        self.assertEqual(self.session.get_stats()["windows"], 1)
+
+    def test_nested_sessions(self):
+        with self.session.session():
+            with self.session.session(root=True, boot=True):
+                pass
+            self.fs.enable_write.assert_called_with(root=False, boot=True)
+        time.sleep(0.2)
+
+        self.fs.disable_write.assert_called_once_with(root=True, boot=True)
+
+    def test_named_session(self):
+        self.session.open("watcher")
+        self.session.open("watcher")
+        self.fs.enable_write.assert_called_once_with(root=True, boot=False)
+        self.assertEqual(self.session.get_stats()["sessions"], ["watcher"])
+
+        with self.session.session():
+            pass
+        time.sleep(0.2)
+        self.fs.disable_write.assert_not_called()
+
+        self.session.close("watcher")
+        self.fs.disable_write.assert_called_once_with(root=True, boot=False)
+        self.session.close("watcher")
+        self.fs.disable_write.assert_called_once()
+
+    def test_queue_write_batches_and_syncs_once(self):
+        path1 = os.path.join(self.tmp_dir, "file1")
+        path2 = os.path.join(self.tmp_dir, "file2")
+
+        with self.session.session():
+            self.session.queue_write(path1, "first")
+            self.session.queue_write(path1, "second")
+            self.session.queue_write(path2, "content")
+            self.assertFalse(os.path.exists(path1))
+            self.assertEqual(self.session.get_stats()["pendingwrites"], 2)
+        time.sleep(0.2)
+
+        with open(path1) as fd:
+            self.assertEqual(fd.read(), "second")
+        with open(path2) as fd:
+            self.assertEqual(fd.read(), "content")
+        stats = self.session.get_stats()
+        self.assertEqual(stats["writes"], 2)
+        self.assertEqual(stats["flushes"], 1)
+        self.assertEqual(stats["pendingwrites"], 0)
+        self.fs.enable_write.assert_called_once()
+
+    def test_flush(self):
+        path = os.path.join(self.tmp_dir, "file")
+        self.session.queue_write(path, "content")
+
+        self.session.flush()
+
+        with open(path) as fd:
+            self.assertEqual(fd.read(), "content")
+        self.fs.disable_write.assert_called_once_with(root=True, boot=False)
+
+    def test_flush_nothing_queued(self):
+        self.session.flush()
+
+        self.fs.enable_write.assert_not_called()
+
+    def test_write_failure_does_not_block_ro(self):
+        self.session.queue_write("/invalid/path/file", "content")
+        self.session.flush()
+
+        self.fs.disable_write.assert_called_once_with(root=True, boot=False)
+        self.assertEqual(self.session.get_stats()["writes"], 0)
+
+    def test_write_failure_reported_by_filesystem(self):
+        self.fs.write_data.side_effect = None
+        self.fs.write_data.return_value = False
+        self.session.queue_write(os.path.join(self.tmp_dir, "file"), "content")
+
+        self.session.flush()
+
+        self.assertEqual(self.session.get_stats()["writes"], 0)
+
+    def test_reset(self):
+        self.session.open("watcher", root=True, boot=True)
+
+        self.session.reset()
+
+        self.fs.disable_write.assert_called_with(root=True, boot=True)
+        stats = self.session.get_stats()
+        self.assertEqual(stats["sessions"], [])
+        self.assertEqual(stats["writable"], {"root": False, "boot": False})
+
+        # counters are reset
+        with self.session.session():
+            pass
+        self.assertEqual(self.fs.enable_write.call_count, 2)
+
+    def test_reset_without_writable_partition(self):
+        self.session.open("watcher")
+        self.session.close("watcher")
+        self.fs.disable_write.reset_mock()
+
+        self.session.reset()
+
+        self.fs.disable_write.assert_not_called()
+
+    def test_reset_disables_only_writable_partitions(self):
+        self.session.open("watcher", root=True, boot=False)
+
+        self.session.reset()
+
+        self.fs.disable_write.assert_called_once_with(root=True, boot=False)
+
+
+if __name__ == "__main__":
+    unittest.main()